@@ -4,41 +4,67 @@ Demonstrates exporting product data to CSV/XLSX/JSON/XML files
 """
 
 import asyncio
+import os
 import sys
 from pathlib import Path
+from types import MappingProxyType
 
 # Add parent directory to path to import the SDK
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python-sdk"))
 
-from saastify_edge.transformations import transform, bulk_apply_pipe_rules
-from saastify_edge.export import build_csv, build_xlsx, build_json, build_xml
+from saastify_edge.transformations import bulk_apply_pipe_rules
+from saastify_edge.export import CSVFileBuilder, JSONFileBuilder, XLSXFileBuilder, XMLFileBuilder
+
+# Translation table for URL slugs (spaces → hyphens)
+SLUG_TABLE = str.maketrans(' ', '-')
+
+# Pretty-print JSON exports only when debugging; machine consumers get compact output
+DEBUG = bool(os.environ.get("SAASTIFY_DEBUG"))
+
+# Shared read-only sample catalog, built once at import. Each example
+# merges in an overlay with the extra fields it needs.
+SAMPLE_PRODUCTS = (
+    MappingProxyType({'sku': 'SKU001', 'name': 'Wireless Mouse', 'price': 29.99}),
+    MappingProxyType({'sku': 'SKU002', 'name': 'USB Cable', 'price': 9.99}),
+    MappingProxyType({'sku': 'SKU003', 'name': 'Mechanical Keyboard', 'price': 149.99}),
+)
+
+CSV_DETAILS = (
+    MappingProxyType({'description': 'Ergonomic wireless mouse with USB receiver'}),
+    MappingProxyType({'description': 'High-quality USB-C cable'}),
+    MappingProxyType({'description': 'Cherry MX Blue switches'}),
+)
+
+XLSX_DETAILS = (
+    MappingProxyType({'category': 'Electronics', 'stock': 150}),
+    MappingProxyType({'category': 'Accessories', 'stock': 500}),
+    MappingProxyType({'category': 'Electronics', 'stock': 75}),
+)
+
+JSON_DETAILS = (
+    MappingProxyType({
+        'attributes': {'color': 'black', 'brand': 'TechCo', 'warranty': '2 years'},
+        'tags': ('wireless', 'ergonomic', 'usb')
+    }),
+    MappingProxyType({
+        'attributes': {'length': '6ft', 'type': 'USB-C', 'color': 'white'},
+        'tags': ('cable', 'usb-c', 'fast-charging')
+    }),
+)
+
+XML_DETAILS = (
+    MappingProxyType({'description': 'Ergonomic design & USB receiver'}),
+    MappingProxyType({'description': 'USB-C cable - 6ft length'}),
+)
 
 
 async def example_csv_export():
     """Example 1: Export products to CSV"""
-    print("\n=== Example 1: CSV Export ===\n")
+    out = []
+    out.append("\n=== Example 1: CSV Export ===\n")
     
-    # Sample product data
-    products = [
-        {
-            'sku': 'SKU001',
-            'name': 'Wireless Mouse',
-            'price': 29.99,
-            'description': 'Ergonomic wireless mouse with USB receiver'
-        },
-        {
-            'sku': 'SKU002',
-            'name': 'USB Cable',
-            'price': 9.99,
-            'description': 'High-quality USB-C cable'
-        },
-        {
-            'sku': 'SKU003',
-            'name': 'Mechanical Keyboard',
-            'price': 149.99,
-            'description': 'Cherry MX Blue switches'
-        }
-    ]
+    # Sample product data: shared catalog plus CSV-specific descriptions
+    products = [{**base, **extra} for base, extra in zip(SAMPLE_PRODUCTS, CSV_DETAILS)]
     
     # Configure CSV export
     file_config = {
@@ -48,60 +74,38 @@ async def example_csv_export():
         'columns': ['sku', 'name', 'price', 'description']
     }
     
-    # Apply transformations before export
-    transformed_products = []
-    for product in products:
-        transformed = product.copy()
-        # Uppercase SKU
-        transformed['sku'] = transform(product['sku'], 'uppercase')
-        # Title case name
-        transformed['name'] = transform(product['name'], 'title_case')
-        # Format price with 2 decimals
-        transformed['price'] = transform(product['price'], 'round_decimal|2')
-        transformed_products.append(transformed)
-    
-    # Build CSV
-    csv_content = build_csv(transformed_products, file_config)
-    
-    print("Generated CSV:")
-    print(csv_content)
-    
-    # Save to file
+    # Apply transformations column-wise before export
+    # Uppercase SKU
+    skus = bulk_apply_pipe_rules([p['sku'] for p in products], 'uppercase')
+    # Title case name
+    names = bulk_apply_pipe_rules([p['name'] for p in products], 'title_case')
+    # Format price with 2 decimals
+    prices = bulk_apply_pipe_rules([p['price'] for p in products], 'round_decimal|2')
+    
+    transformed_products = [
+        {'sku': sku, 'name': name, 'price': price, 'description': product['description']}
+        for product, sku, name, price in zip(products, skus, names, prices)
+    ]
+    
+    # Stream CSV rows straight to the output file
     output_path = '/tmp/products_export.csv'
-    with open(output_path, 'w') as f:
-        f.write(csv_content)
+    await asyncio.to_thread(
+        CSVFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"✓ Exported {len(transformed_products)} products to {output_path}")
+    out.append(f"  Columns: {', '.join(file_config['columns'])}")
     
-    print(f"\n✓ Exported to {output_path}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_xlsx_export():
     """Example 2: Export products to Excel (XLSX)"""
-    print("\n=== Example 2: XLSX Export ===\n")
+    out = []
+    out.append("\n=== Example 2: XLSX Export ===\n")
     
-    # Sample product data
-    products = [
-        {
-            'sku': 'SKU001',
-            'name': 'Wireless Mouse',
-            'category': 'Electronics',
-            'price': 29.99,
-            'stock': 150
-        },
-        {
-            'sku': 'SKU002',
-            'name': 'USB Cable',
-            'category': 'Accessories',
-            'price': 9.99,
-            'stock': 500
-        },
-        {
-            'sku': 'SKU003',
-            'name': 'Mechanical Keyboard',
-            'category': 'Electronics',
-            'price': 149.99,
-            'stock': 75
-        }
-    ]
+    # Sample product data: shared catalog plus category/stock
+    products = [{**base, **extra} for base, extra in zip(SAMPLE_PRODUCTS, XLSX_DETAILS)]
     
     # Configure XLSX export
     file_config = {
@@ -111,148 +115,119 @@ async def example_xlsx_export():
         'columns': ['sku', 'name', 'category', 'price', 'stock']
     }
     
-    # Apply transformations before export
-    transformed_products = []
-    for product in products:
-        transformed = product.copy()
-        transformed['sku'] = transform(product['sku'], 'uppercase')
-        transformed['name'] = transform(product['name'], 'title_case')
-        transformed['category'] = transform(product['category'], 'uppercase')
-        transformed_products.append(transformed)
+    # Apply transformations column-wise before export
+    skus = bulk_apply_pipe_rules([p['sku'] for p in products], 'uppercase')
+    names = bulk_apply_pipe_rules([p['name'] for p in products], 'title_case')
+    categories = bulk_apply_pipe_rules([p['category'] for p in products], 'uppercase')
     
-    # Build XLSX
-    xlsx_bytes = build_xlsx(transformed_products, file_config)
+    transformed_products = [
+        {
+            'sku': sku,
+            'name': name,
+            'category': category,
+            'price': product['price'],
+            'stock': product['stock']
+        }
+        for product, sku, name, category in zip(products, skus, names, categories)
+    ]
     
-    # Save to file
+    # Stream XLSX rows straight to the output file
     output_path = '/tmp/products_export.xlsx'
-    with open(output_path, 'wb') as f:
-        f.write(xlsx_bytes)
+    await asyncio.to_thread(
+        XLSXFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"✓ Exported {len(products)} products to {output_path}")
+    out.append(f"  Sheet name: {file_config['sheet_name']}")
+    out.append(f"  Columns: {', '.join(file_config['columns'])}")
     
-    print(f"✓ Exported {len(products)} products to {output_path}")
-    print(f"  Sheet name: {file_config['sheet_name']}")
-    print(f"  Columns: {', '.join(file_config['columns'])}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_json_export():
     """Example 3: Export products to JSON"""
-    print("\n=== Example 3: JSON Export ===\n")
+    out = []
+    out.append("\n=== Example 3: JSON Export ===\n")
     
-    # Sample product data with nested attributes
-    products = [
-        {
-            'sku': 'SKU001',
-            'name': 'Wireless Mouse',
-            'price': 29.99,
-            'attributes': {
-                'color': 'black',
-                'brand': 'TechCo',
-                'warranty': '2 years'
-            },
-            'tags': ['wireless', 'ergonomic', 'usb']
-        },
-        {
-            'sku': 'SKU002',
-            'name': 'USB Cable',
-            'price': 9.99,
-            'attributes': {
-                'length': '6ft',
-                'type': 'USB-C',
-                'color': 'white'
-            },
-            'tags': ['cable', 'usb-c', 'fast-charging']
-        }
-    ]
+    # Sample product data with nested attributes (first two catalog items)
+    products = [{**base, **extra} for base, extra in zip(SAMPLE_PRODUCTS, JSON_DETAILS)]
     
     # Configure JSON export
     file_config = {
-        'format': 'json',
-        'pretty': True,
-        'indent': 2
+        'format': 'array',
+        'indent': 2 if DEBUG else None
     }
     
-    # Apply transformations
-    transformed_products = []
-    for product in products:
-        transformed = product.copy()
-        # Uppercase SKU
-        transformed['sku'] = transform(product['sku'], 'uppercase')
-        # Title case name
-        transformed['name'] = transform(product['name'], 'title_case')
-        # Transform tags to uppercase
-        transformed['tags'] = bulk_apply_pipe_rules(product['tags'], 'uppercase')
-        transformed_products.append(transformed)
-    
-    # Build JSON
-    json_content = build_json(transformed_products, file_config)
-    
-    print("Generated JSON:")
-    print(json_content)
-    
-    # Save to file
+    # Apply transformations column-wise
+    # Uppercase SKU
+    skus = bulk_apply_pipe_rules([p['sku'] for p in products], 'uppercase')
+    # Title case name
+    names = bulk_apply_pipe_rules([p['name'] for p in products], 'title_case')
+    
+    transformed_products = [
+        {
+            'sku': sku,
+            'name': name,
+            'price': product['price'],
+            'attributes': product['attributes'],
+            # Transform tags to uppercase
+            'tags': bulk_apply_pipe_rules(list(product['tags']), 'uppercase')
+        }
+        for product, sku, name in zip(products, skus, names)
+    ]
+    
+    # Build JSON straight to disk (orjson when installed)
     output_path = '/tmp/products_export.json'
-    with open(output_path, 'w') as f:
-        f.write(json_content)
+    await asyncio.to_thread(
+        JSONFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"✓ Exported {len(transformed_products)} products to {output_path}")
     
-    print(f"\n✓ Exported to {output_path}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_xml_export():
     """Example 4: Export products to XML"""
-    print("\n=== Example 4: XML Export ===\n")
+    out = []
+    out.append("\n=== Example 4: XML Export ===\n")
     
-    # Sample product data
-    products = [
-        {
-            'sku': 'SKU001',
-            'name': 'Wireless Mouse',
-            'price': 29.99,
-            'description': 'Ergonomic design & USB receiver'
-        },
-        {
-            'sku': 'SKU002',
-            'name': 'USB Cable',
-            'price': 9.99,
-            'description': 'USB-C cable - 6ft length'
-        }
-    ]
+    # Sample product data (first two catalog items)
+    products = [{**base, **extra} for base, extra in zip(SAMPLE_PRODUCTS, XML_DETAILS)]
     
     # Configure XML export
     file_config = {
         'format': 'xml',
-        'root_element': 'products',
-        'item_element': 'product',
-        'pretty': True
+        'root_tag': 'products',
+        'row_tag': 'product'
     }
     
-    # Apply transformations
-    transformed_products = []
-    for product in products:
-        transformed = product.copy()
-        # Uppercase SKU
-        transformed['sku'] = transform(product['sku'], 'uppercase')
-        # Title case name
-        transformed['name'] = transform(product['name'], 'title_case')
-        # Clean description for XML
-        transformed['description'] = transform(product['description'], 'xml_escape')
-        transformed_products.append(transformed)
-    
-    # Build XML
-    xml_content = build_xml(transformed_products, file_config)
-    
-    print("Generated XML:")
-    print(xml_content)
-    
-    # Save to file
+    # Apply transformations column-wise
+    # Uppercase SKU
+    skus = bulk_apply_pipe_rules([p['sku'] for p in products], 'uppercase')
+    # Title case name
+    names = bulk_apply_pipe_rules([p['name'] for p in products], 'title_case')
+    # Descriptions stay raw: the XML builder escapes text as it streams
+    transformed_products = [
+        {'sku': sku, 'name': name, 'price': product['price'], 'description': product['description']}
+        for product, sku, name in zip(products, skus, names)
+    ]
+    
+    # Stream XML elements straight to the output file
     output_path = '/tmp/products_export.xml'
-    with open(output_path, 'w') as f:
-        f.write(xml_content)
+    await asyncio.to_thread(
+        XMLFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"✓ Exported {len(transformed_products)} products to {output_path}")
     
-    print(f"\n✓ Exported to {output_path}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_bulk_export_with_transformations():
     """Example 5: Bulk export with complex transformations"""
-    print("\n=== Example 5: Bulk Export with Transformations ===\n")
+    out = []
+    out.append("\n=== Example 5: Bulk Export with Transformations ===\n")
     
     # Large product dataset
     products = [
@@ -288,7 +263,7 @@ async def example_bulk_export_with_transformations():
         }
     ]
     
-    print(f"Processing {len(products)} products...")
+    out.append(f"Processing {len(products)} products...")
     
     # Define transformation rules for each field
     transformation_rules = {
@@ -302,34 +277,34 @@ async def example_bulk_export_with_transformations():
         'created_at': 'date_only'
     }
     
-    # Apply transformations to all products
-    transformed_products = []
-    for product in products:
-        transformed = {}
-        for field, value in product.items():
-            if field in transformation_rules:
-                rule = transformation_rules[field]
-                transformed[field] = transform(value, rule)
-            else:
-                transformed[field] = value
-        
-        # Calculate discount percentage if sale price exists
-        if transformed.get('sale_price') and transformed.get('price'):
-            discount = ((transformed['price'] - transformed['sale_price']) / transformed['price']) * 100
-            transformed['discount_percent'] = transform(discount, 'round_decimal|0')
-        else:
-            transformed['discount_percent'] = 0
-        
-        # Generate URL slug
-        transformed['slug'] = transform(transformed['name'], 'lowercase + replace| |-')
-        
-        transformed_products.append(transformed)
-    
-    print("\nTransformed products:")
+    # Lay the data out as one list per field, then run each rule once
+    # over its whole column
+    columns = {field: [p[field] for p in products] for field in products[0]}
+    for field, rule in transformation_rules.items():
+        columns[field] = bulk_apply_pipe_rules(columns[field], rule)
+    
+    # Calculate discount percentage where a sale price exists
+    columns['discount_percent'] = bulk_apply_pipe_rules(
+        [
+            ((price - sale_price) / price) * 100 if sale_price and price else 0
+            for price, sale_price in zip(columns['price'], columns['sale_price'])
+        ],
+        'round_decimal|0'
+    )
+    
+    # Generate URL slugs; fixed rule, so skip the DSL
+    # (same result as 'lowercase + replace| |-')
+    columns['slug'] = [name.lower().translate(SLUG_TABLE) for name in columns['name']]
+    
+    # Materialize row dicts only for the file builder
+    fields = list(columns)
+    transformed_products = [dict(zip(fields, row)) for row in zip(*columns.values())]
+    
+    out.append("\nTransformed products:")
     for i, product in enumerate(transformed_products, 1):
-        print(f"\n  Product {i}:")
+        out.append(f"\n  Product {i}:")
         for key, value in product.items():
-            print(f"    {key}: {value}")
+            out.append(f"    {key}: {value}")
     
     # Export to CSV
     file_config = {
@@ -339,18 +314,39 @@ async def example_bulk_export_with_transformations():
         'columns': ['sku', 'name', 'brand', 'price', 'sale_price', 'discount_percent', 'stock', 'slug']
     }
     
-    csv_content = build_csv(transformed_products, file_config)
-    
     output_path = '/tmp/products_bulk_export.csv'
-    with open(output_path, 'w') as f:
-        f.write(csv_content)
+    await asyncio.to_thread(
+        CSVFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"\n✓ Exported {len(transformed_products)} products to {output_path}")
     
-    print(f"\n✓ Exported {len(transformed_products)} products to {output_path}")
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def build_amazon_listing(seller_sku, title, bullet_1, bullet_2, bullet_3, price, upc):
+    """Assemble one Amazon feed row from already-transformed column values"""
+    return {
+        'seller_sku': seller_sku,
+        # Title: max 200 chars
+        'product_name': title[:200],
+        'bullet_point1': bullet_1,
+        'bullet_point2': bullet_2,
+        'bullet_point3': bullet_3,
+        'standard_price': price,
+        'product_id': upc,
+        'product_id_type': 'UPC',
+        # Quantity: required field
+        'quantity': 999,
+        # Fulfillment: FBA or FBM
+        'fulfillment_channel': 'DEFAULT'
+    }
 
 
 async def example_channel_specific_export():
     """Example 6: Channel-specific export (e.g., Amazon)"""
-    print("\n=== Example 6: Channel-Specific Export ===\n")
+    out = []
+    out.append("\n=== Example 6: Channel-Specific Export ===\n")
     
     # Products with channel-specific transformations
     products = [
@@ -374,40 +370,28 @@ async def example_channel_specific_export():
         }
     ]
     
-    print("Applying Amazon-specific transformations...")
-    
-    # Amazon-specific transformation rules
-    transformed_products = []
-    for product in products:
-        transformed = {}
-        
-        # SKU: uppercase
-        transformed['seller_sku'] = transform(product['internal_sku'], 'uppercase')
-        
-        # Title: capitalize each word, max 200 chars
-        title = transform(product['title'], 'title_case')
-        transformed['product_name'] = title[:200] if len(title) > 200 else title
-        
-        # Bullets: combine into description
-        bullets = [product['bullet_1'], product['bullet_2'], product['bullet_3']]
-        transformed['bullet_point1'] = transform(bullets[0], 'capitalize')
-        transformed['bullet_point2'] = transform(bullets[1], 'capitalize')
-        transformed['bullet_point3'] = transform(bullets[2], 'capitalize')
-        
-        # Price: format with 2 decimals
-        transformed['standard_price'] = transform(product['price'], 'round_decimal|2')
-        
-        # UPC: clean and validate
-        transformed['product_id'] = transform(product['upc'], 'clean_upc')
-        transformed['product_id_type'] = 'UPC'
-        
-        # Quantity: required field
-        transformed['quantity'] = 999
-        
-        # Fulfillment: FBA or FBM
-        transformed['fulfillment_channel'] = 'DEFAULT'
-        
-        transformed_products.append(transformed)
+    out.append("Applying Amazon-specific transformations...")
+    
+    # Amazon-specific transformation rules, applied column-wise
+    # SKU: uppercase
+    seller_skus = bulk_apply_pipe_rules([p['internal_sku'] for p in products], 'uppercase')
+    # Title: capitalize each word
+    titles = bulk_apply_pipe_rules([p['title'] for p in products], 'title_case')
+    # Bullets: capitalize all three in one bulk call, then de-interleave
+    bullets = bulk_apply_pipe_rules(
+        [p[key] for p in products for key in ('bullet_1', 'bullet_2', 'bullet_3')],
+        'capitalize'
+    )
+    bullets_1, bullets_2, bullets_3 = bullets[0::3], bullets[1::3], bullets[2::3]
+    # Price: format with 2 decimals
+    standard_prices = bulk_apply_pipe_rules([p['price'] for p in products], 'round_decimal|2')
+    # UPC: clean and validate
+    product_ids = bulk_apply_pipe_rules([p['upc'] for p in products], 'clean_upc')
+    
+    transformed_products = list(map(
+        build_amazon_listing,
+        seller_skus, titles, bullets_1, bullets_2, bullets_3, standard_prices, product_ids
+    ))
     
     # Export to Amazon template format
     file_config = {
@@ -421,35 +405,34 @@ async def example_channel_specific_export():
         ]
     }
     
-    # Build TSV
-    tsv_content = build_csv(transformed_products, file_config)  # CSV builder handles TSV too
-    
-    print("\nGenerated Amazon feed:")
-    print(tsv_content)
-    
+    # Stream TSV rows straight to the feed file (CSV builder handles TSV too)
     output_path = '/tmp/amazon_products_export.txt'
-    with open(output_path, 'w') as f:
-        f.write(tsv_content)
+    await asyncio.to_thread(
+        CSVFileBuilder().build_file, transformed_products, output_path, file_config
+    )
+    
+    out.append(f"\n✓ Exported {len(transformed_products)} products in Amazon format to {output_path}")
     
-    print(f"\n✓ Exported {len(transformed_products)} products in Amazon format to {output_path}")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def main():
     """Run all examples"""
-    print("=" * 60)
-    print("Python SDK Export Examples")
-    print("=" * 60)
-    
-    await example_csv_export()
-    await example_xlsx_export()
-    await example_json_export()
-    await example_xml_export()
-    await example_bulk_export_with_transformations()
-    await example_channel_specific_export()
-    
-    print("\n" + "=" * 60)
-    print("All examples completed successfully!")
-    print("=" * 60)
+    rule = "=" * 60
+    sys.stdout.write(f"{rule}\nPython SDK Export Examples\n{rule}\n")
+    
+    # Examples write to independent files, so run them concurrently.
+    # Each example buffers its own output and writes it in one go.
+    await asyncio.gather(
+        example_csv_export(),
+        example_xlsx_export(),
+        example_json_export(),
+        example_xml_export(),
+        example_bulk_export_with_transformations(),
+        example_channel_specific_export(),
+    )
+    
+    sys.stdout.write(f"\n{rule}\nAll examples completed successfully!\n{rule}\n")
 
 
 if __name__ == "__main__":
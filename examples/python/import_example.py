@@ -11,13 +11,33 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "python-sdk"))
 
 from saastify_edge.transformations import transform, bulk_apply_pipe_rules
-from saastify_edge.validation import validate_row
+from saastify_edge.validation import compile_validations
 from saastify_edge.core.parsers import get_parser
+from saastify_edge.export import JSONFileBuilder
+
+# Translation table for URL slugs (spaces → hyphens)
+SLUG_TABLE = str.maketrans(' ', '-')
+
+# Column → (target field, DSL rule) table for the basic import, built once
+BASIC_IMPORT_RULES = {
+    'SKU': ('sku', 'strip + uppercase'),
+    'Product Name': ('name', 'strip + title_case'),
+    'Price': ('price', 'clean_numeric_value + round_decimal|2'),
+    'Description': ('description', 'clean_html + strip'),
+}
+
+BASIC_IMPORT_VALIDATIONS = {
+    'sku': [{'rule': 'required'}],
+    'name': [{'rule': 'required'}, {'rule': 'min_length', 'args': {'value': 3}}],
+    'price': [{'rule': 'numeric_range', 'args': {'min': 0, 'max': 10000}}]
+}
+validate_basic_import = compile_validations(BASIC_IMPORT_VALIDATIONS)
 
 
 async def example_basic_import():
     """Example 1: Basic CSV import with transformations"""
-    print("\n=== Example 1: Basic CSV Import ===\n")
+    out = []
+    out.append("\n=== Example 1: Basic CSV Import ===\n")
     
     # Sample CSV data (in real use, this would be a file)
     csv_data = """SKU,Product Name,Price,Description
@@ -35,40 +55,39 @@ async def example_basic_import():
     # Parse CSV file
     parser = get_parser(temp_file)
     
-    async for row in parser.parse(temp_file):
-        print(f"Row {row['file_row_number']}:")
-        print(f"  Raw data: {row['data']}")
-        
-        # Apply transformations
-        transformed = {}
-        transformed['sku'] = transform(row['data']['SKU'], 'strip + uppercase')
-        transformed['name'] = transform(row['data']['Product Name'], 'strip + title_case')
-        transformed['price'] = transform(row['data']['Price'], 'clean_numeric_value + round_decimal|2')
-        transformed['description'] = transform(row['data']['Description'], 'clean_html + strip')
+    rows = [row async for row in parser.parse(temp_file)]
+    
+    # Apply each rule once over its whole column instead of per row
+    transformed_columns = {
+        field: bulk_apply_pipe_rules([row['data'][column] for row in rows], rule)
+        for column, (field, rule) in BASIC_IMPORT_RULES.items()
+    }
+    
+    for i, row in enumerate(rows):
+        out.append(f"Row {row['file_row_number']}:")
+        out.append(f"  Raw data: {row['data']}")
         
-        print(f"  Transformed: {transformed}")
+        transformed = {field: values[i] for field, values in transformed_columns.items()}
+        out.append(f"  Transformed: {transformed}")
         
         # Validate
-        validations = {
-            'sku': [{'rule': 'required'}],
-            'name': [{'rule': 'required'}, {'rule': 'min_length', 'args': {'value': 3}}],
-            'price': [{'rule': 'numeric_range', 'args': {'min': 0, 'max': 10000}}]
-        }
-        
-        is_valid, errors, error_count = validate_row(transformed, validations)
-        print(f"  Valid: {is_valid}, Errors: {error_count}")
+        is_valid, errors, error_count = validate_basic_import(transformed)
+        out.append(f"  Valid: {is_valid}, Errors: {error_count}")
         if errors:
-            print(f"  Validation errors: {errors}")
-        print()
+            out.append(f"  Validation errors: {errors}")
+        out.append('')
     
     # Cleanup
     import os
     os.unlink(temp_file)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_bulk_transformations():
     """Example 2: Bulk transformations with DSL"""
-    print("\n=== Example 2: Bulk Transformations ===\n")
+    out = []
+    out.append("\n=== Example 2: Bulk Transformations ===\n")
     
     # Sample product data
     product_names = [
@@ -81,35 +100,34 @@ async def example_bulk_transformations():
     prices = ["$29.99", "$9.99", "$149.99", "$19.99"]
     skus = ["WM-001", "UC-002", "KB-003", "HC-004"]
     
-    # Transform product names
-    print("Transforming product names:")
-    cleaned_names = bulk_apply_pipe_rules(
-        product_names,
-        "strip + title_case"
+    # Names and prices are independent columns, so transform them
+    # concurrently on worker threads. The transforms are pure Python and
+    # hold the GIL, so the win is keeping the event loop free rather than
+    # parallel CPU.
+    cleaned_names, numeric_prices = await asyncio.gather(
+        asyncio.to_thread(bulk_apply_pipe_rules, product_names, "strip + title_case"),
+        asyncio.to_thread(bulk_apply_pipe_rules, prices, "clean_numeric_value + round_decimal|2"),
     )
+    
+    # Transform product names
+    out.append("Transforming product names:")
     for original, cleaned in zip(product_names, cleaned_names):
-        print(f"  '{original}' → '{cleaned}'")
+        out.append(f"  '{original}' → '{cleaned}'")
     
     # Transform prices
-    print("\nTransforming prices:")
-    numeric_prices = bulk_apply_pipe_rules(
-        prices,
-        "clean_numeric_value + round_decimal|2"
-    )
+    out.append("\nTransforming prices:")
     for original, cleaned in zip(prices, numeric_prices):
-        print(f"  '{original}' → {cleaned}")
+        out.append(f"  '{original}' → {cleaned}")
     
     # Generate slugs for URLs
-    print("\nGenerating URL slugs:")
-    slugs = bulk_apply_pipe_rules(
-        cleaned_names,
-        "lowercase + replace| |-"
-    )
+    out.append("\nGenerating URL slugs:")
+    # Fixed rule, so skip the DSL: same result as "lowercase + replace| |-"
+    slugs = [name.lower().translate(SLUG_TABLE) for name in cleaned_names]
     for name, slug in zip(cleaned_names, slugs):
-        print(f"  '{name}' → '{slug}'")
+        out.append(f"  '{name}' → '{slug}'")
     
     # Create full product objects
-    print("\nFull product objects:")
+    out.append("\nFull product objects:")
     for i in range(len(skus)):
         product = {
             'sku': skus[i],
@@ -117,52 +135,58 @@ async def example_bulk_transformations():
             'price': numeric_prices[i],
             'slug': slugs[i]
         }
-        print(f"  {product}")
+        out.append(f"  {product}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_advanced_transformations():
     """Example 3: Advanced transformations with multiple operations"""
-    print("\n=== Example 3: Advanced Transformations ===\n")
+    out = []
+    out.append("\n=== Example 3: Advanced Transformations ===\n")
     
     # Date transformations
-    print("Date transformations:")
+    out.append("Date transformations:")
     from datetime import datetime
     today = datetime.now()
     
     formatted_date = transform(today, "format_date|%Y-%m-%d")
-    print(f"  Formatted date: {formatted_date}")
+    out.append(f"  Formatted date: {formatted_date}")
     
     future_date = transform(today, "add_days|30 + format_date|%Y-%m-%d")
-    print(f"  30 days from now: {future_date}")
+    out.append(f"  30 days from now: {future_date}")
     
     # String manipulations
-    print("\nString manipulations:")
+    out.append("\nString manipulations:")
     brand = "ACME Corp"
     product = "Wireless Mouse"
     
     combined = transform(f"{brand} {product}", "uppercase + replace| |_")
-    print(f"  Combined: '{combined}'")
+    out.append(f"  Combined: '{combined}'")
     
     # Numeric operations
-    print("\nNumeric operations:")
+    out.append("\nNumeric operations:")
     base_price = 100.00
     
     discounted = transform(base_price, "multiplication|0.8 + round_decimal|2")
-    print(f"  20% discount: ${discounted}")
+    out.append(f"  20% discount: ${discounted}")
     
     with_tax = transform(base_price, "multiplication|1.08 + round_decimal|2")
-    print(f"  With 8% tax: ${with_tax}")
+    out.append(f"  With 8% tax: ${with_tax}")
     
     # Conditional transformations
-    print("\nConditional transformations:")
+    out.append("\nConditional transformations:")
     empty_description = ""
     description = transform(empty_description, "if_empty|No description available")
-    print(f"  Empty description: '{description}'")
+    out.append(f"  Empty description: '{description}'")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_validation():
     """Example 4: Comprehensive validation"""
-    print("\n=== Example 4: Validation Examples ===\n")
+    out = []
+    out.append("\n=== Example 4: Validation Examples ===\n")
     
     # Test data
     test_products = [
@@ -209,28 +233,31 @@ async def example_validation():
         ]
     }
     
-    # Validate each product
+    # Resolve the rules once, then validate each product
+    validate = compile_validations(validations)
     for i, product in enumerate(test_products, 1):
-        print(f"Product {i}:")
-        print(f"  Data: {product}")
+        out.append(f"Product {i}:")
+        out.append(f"  Data: {product}")
         
-        is_valid, errors, error_count = validate_row(product, validations)
+        is_valid, errors, error_count = validate(product)
         
-        print(f"  Valid: {is_valid}")
+        out.append(f"  Valid: {is_valid}")
         if errors:
-            print(f"  Errors ({error_count}):")
+            out.append(f"  Errors ({error_count}):")
             for field, field_errors in errors.items():
                 for error in field_errors:
-                    print(f"    - {field}: {error['message']}")
-        print()
+                    out.append(f"    - {field}: {error['message']}")
+        out.append('')
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def example_file_formats():
     """Example 5: Working with different file formats"""
-    print("\n=== Example 5: Multiple File Formats ===\n")
+    out = []
+    out.append("\n=== Example 5: Multiple File Formats ===\n")
     
     import tempfile
-    import json
     
     # Sample data
     products = [
@@ -239,38 +266,42 @@ async def example_file_formats():
     ]
     
     # JSON example
-    print("JSON format:")
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-        json.dump(products, f)
+    out.append("JSON format:")
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
         json_file = f.name
+    # Compact output; the builder and JSON parser both use orjson when installed
+    JSONFileBuilder().build_file(products, json_file, {'indent': None})
     
     parser = get_parser(json_file)
     row_count = 0
     async for row in parser.parse(json_file):
         row_count += 1
-        print(f"  Row {row_count}: {row['data']}")
+        out.append(f"  Row {row_count}: {row['data']}")
     
     import os
     os.unlink(json_file)
     
-    print("\n✓ CSV, TSV, XLSX, JSON, and XML formats all supported!")
+    out.append("\n✓ CSV, TSV, XLSX, JSON, and XML formats all supported!")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 async def main():
     """Run all examples"""
-    print("=" * 60)
-    print("Python SDK Import Examples")
-    print("=" * 60)
-    
-    await example_basic_import()
-    await example_bulk_transformations()
-    await example_advanced_transformations()
-    await example_validation()
-    await example_file_formats()
-    
-    print("\n" + "=" * 60)
-    print("All examples completed successfully!")
-    print("=" * 60)
+    rule = "=" * 60
+    sys.stdout.write(f"{rule}\nPython SDK Import Examples\n{rule}\n")
+    
+    # Examples use independent data and temp files, so run them concurrently.
+    # Each example buffers its own output and writes it in one go.
+    await asyncio.gather(
+        example_basic_import(),
+        example_bulk_transformations(),
+        example_advanced_transformations(),
+        example_validation(),
+        example_file_formats(),
+    )
+    
+    sys.stdout.write(f"\n{rule}\nAll examples completed successfully!\n{rule}\n")
 
 
 if __name__ == "__main__":
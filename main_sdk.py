@@ -1,7 +1,32 @@
 #transformation_export
 import re
+import sys
 from datetime import datetime, date
+from functools import lru_cache, partial
+from itertools import repeat
 
+# ─── Precompiled patterns ───────────────────────────────────────────────────
+_NUM_RE = re.compile(r'[^\d.]')
+_UPC_RE = re.compile(r'[^\d]')
+# Same matches as <.*?> (. excludes newline), but the negated class can't backtrack
+_HTML_RE = re.compile(r'<[^>\n]*>')
+_FLOAT_RE = re.compile(r'^-?\d+\.\d+$')
+_DATETIME_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+_DATETIME_FMT = "%Y-%m-%d %H:%M:%S"
+_strptime = datetime.strptime
+_fromisoformat = datetime.fromisoformat
+
+# ASCII fast path for the digit scrubbers: C-level byte deletion, no regex scan
+_NON_DIGIT = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_NON_NUMERIC = bytes(c for c in range(256) if not (0x30 <= c <= 0x39 or c == 0x2e))
+
+@lru_cache(maxsize=256)
+def _compile(pattern): return re.compile(pattern)
+
+def _keep_digits(v, table, pattern):
+    # Non-ASCII input keeps re's Unicode \d semantics
+    if v.isascii(): return v.encode('ascii').translate(None, table).decode('ascii')
+    return pattern.sub('', v)
 
 # ─── Sentinel ───────────────────────────────────────────────────────────────
 class RejectRow(Exception):
@@ -19,13 +44,21 @@ def join(v, delimiter, **kw):
     if isinstance(v, str): v = v.split()
     return delimiter.join(str(x) for x in v) if isinstance(v, (list, tuple)) else v
 def replace(v, old, new, **kw): return v.replace(old, new) if isinstance(v, str) else v
-def replace_regex(v, pattern, repl, **kw): return re.sub(pattern, repl, v) if isinstance(v, str) else v
-def clean_numeric_value(v, **kw): return float(re.sub(r'[^\d.]', '', v)) if isinstance(v, str) else v
-def clean_upc(v, **kw): return re.sub(r'[^\d]', '', v) if isinstance(v, str) else v
-def clean_html(v, **kw): return re.sub(r'<.*?>', '', v) if isinstance(v, str) else v
+def replace_regex(v, pattern, repl, **kw): return _compile(pattern).sub(repl, v) if isinstance(v, str) else v
+def clean_numeric_value(v, **kw): return float(_keep_digits(v, _NON_NUMERIC, _NUM_RE)) if isinstance(v, str) else v
+def clean_upc(v, **kw): return _keep_digits(v, _NON_DIGIT, _UPC_RE) if isinstance(v, str) else v
+def clean_html(v, **kw): return _HTML_RE.sub('', v) if isinstance(v, str) else v
 def date_only(v, **kw):
     if isinstance(v, str):
-        try: return datetime.strptime(v.strip(), "%Y-%m-%d %H:%M:%S").strftime("%Y-%m-%d")
+        s = v.strip()
+        # Canonical timestamps go through the C ISO parser; years < 1000 and
+        # anything else fall back to strptime for its exact semantics
+        if _DATETIME_RE.fullmatch(s) and s[0] != "0":
+            try:
+                _fromisoformat(s)
+                return s[:10]
+            except ValueError: pass
+        try: return _strptime(s, _DATETIME_FMT).strftime("%Y-%m-%d")
         except ValueError: return v.split()[0] if " " in v else v
     if isinstance(v, (datetime, date)): return v.strftime("%Y-%m-%d")
     return v
@@ -76,18 +109,216 @@ def apply_transformations(val, steps):
         except RejectRow: return None, True
     return v, False
 
+# ─── DSL token handlers (keyed by the name before the first "|") ───────────
+def _h_split(raw):
+    if raw in ("|||", r"\|"):
+        delim = "|"
+    elif raw.startswith("|||"):
+        delim = raw[3:] or "|"
+    elif raw.startswith("||"):
+        tail = raw[2:]
+        delim = " " if tail in ("", " ") else tail
+    elif raw.startswith(r"\|"):
+        delim = "|" + raw[2:]
+    else:
+        delim = raw
+    if delim != " ": delim = delim.strip()
+    if delim == "": raise ValueError("split requires non-empty delimiter")
+    return {"name": "split", "params": {"delimiter": delim}}
+
+def _h_replace_regex(raw):
+    pat, *rep = raw.split("||", 1)
+    return {"name": "replace_regex", "params": {"pattern": pat, "repl": rep[0] if rep else ""}}
+
+def _h_replace(raw):
+    try:
+        old, new = raw.split('|', 1)
+    except ValueError:
+        raise ValueError(f"replace requires two parameters: replace|{raw}")
+    return {"name": "replace", "params": {"old": old, "new": new}}
+
+def _h_vlookup(raw):
+    mapping = {}
+    for pair in raw.rstrip('|').split(','):
+        k, v = pair.split(':', 1)
+        v = v.strip()
+        lv = v.lower()
+        mapping[sys.intern(k.strip().lower())] = \
+            True if lv == "true" else \
+            False if lv == "false" else \
+            float(v) if _FLOAT_RE.match(v) else \
+            int(v) if v.isdigit() else v
+    return {"name": "vlookup_map", "params": {"mapping": mapping}}
+
+def _param_handler(name, key):
+    return lambda raw: {"name": name, "params": {key: raw}}
+
+_TOKEN_HANDLERS = {
+    "split": _h_split,
+    "join": _param_handler("join", "delimiter"),
+    "prefix": _param_handler("prefix", "prefix_str"),
+    "suffix": _param_handler("suffix", "suffix_str"),
+    "replace_regex": _h_replace_regex,
+    "replace": _h_replace,
+    "vlookup": _h_vlookup,
+    "addition": _param_handler("addition", "amount"),
+    "subtraction": _param_handler("subtraction", "amount"),
+    "multiplication": _param_handler("multiplication", "factor"),
+    "percentage": _param_handler("percentage", "factor"),
+    "division": _param_handler("division", "divisor"),
+    "strip": _param_handler("strip", "chars"),
+    "set": _param_handler("set", "value"),
+    "set_number": _param_handler("set_number", "value"),
+    "zero_padding": _param_handler("zero_padding", "value"),
+}
+
+# ─── DSL compiler (cached per rule string) ──────────────────────────────────
+@lru_cache(maxsize=1024)
+def _compile_rule(rule):
+    steps = []
+    for token_raw in rule.replace('+', '|;|').split('|;|'):
+        token = token_raw.lstrip()
+        if not token:
+            continue
+        # One dict lookup instead of a startswith() per known operation;
+        # bare tokens (and unknown "name|..." ones) become a plain step
+        head, sep, rest = token.partition('|')
+        handler = _TOKEN_HANDLERS.get(head) if sep else None
+        steps.append(handler(rest) if handler else {"name": token})
+    return tuple(steps)
+
+# ─── Fused pipeline (one callable per rule string) ──────────────────────────
+# Unguarded str methods; raise TypeError on non-str instead of checking first
+_STR_FAST = {
+    "uppercase": str.upper, "lowercase": str.lower, "strip": str.strip,
+    "title_case": str.title, "capitalize": str.capitalize,
+}
+
+@lru_cache(maxsize=1024)
+def _compile_pipeline(rule):
+    # Bind params up front so the hot loop is plain positional calls;
+    # copy is a no-op and is dropped from the chain
+    steps = [st for st in _compile_rule(rule) if st["name"] != "copy"]
+    fns = tuple(
+        partial(TRANSFORMS[st["name"]], **st["params"]) if st.get("params") else TRANSFORMS[st["name"]]
+        for st in steps
+    )
+    fast = tuple(
+        _STR_FAST[st["name"]] if st["name"] in _STR_FAST and not st.get("params") else fn
+        for st, fn in zip(steps, fns)
+    )
+
+    if fast == fns:
+        def run(v):
+            try:
+                for fn in fns: v = fn(v)
+            except RejectRow: return None, True
+            return v, False
+        return run
+
+    def run_fast(v):
+        try:
+            try:
+                out = v
+                for fn in fast: out = fn(out)
+                return out, False
+            except TypeError:
+                # A non-str hit a str-only step: redo the value with guarded helpers
+                for fn in fns: v = fn(v)
+                return v, False
+        except RejectRow: return None, True
+    return run_fast
+
+# ─── Column-wise fast path ──────────────────────────────────────────────────
+# str -> str steps that can run over a whole column in one comprehension
+_COLUMN_OPS = {
+    "uppercase": lambda col: [v.upper() for v in col],
+    "lowercase": lambda col: [v.lower() for v in col],
+    "strip": lambda col, chars=None: [v.strip(chars) for v in col],
+    "title_case": lambda col: [v.title() for v in col],
+    "capitalize": lambda col: [v.capitalize() for v in col],
+    "replace": lambda col, old, new: [v.replace(old, new) for v in col],
+    "replace_regex": lambda col, pattern, repl: list(map(partial(_compile(pattern).sub, repl), col)),
+    "clean_upc": lambda col: [_keep_digits(v, _NON_DIGIT, _UPC_RE) for v in col],
+    "clean_html": lambda col: [_HTML_RE.sub('', v) for v in col],
+    "prefix": lambda col, prefix_str="-": [prefix_str + v for v in col],
+    "suffix": lambda col, suffix_str="_": [v + suffix_str for v in col],
+    "copy": lambda col: col,
+}
+
+@lru_cache(maxsize=1024)
+def _compile_column_plan(rule):
+    steps = _compile_rule(rule)
+    if not all(st["name"] in _COLUMN_OPS for st in steps): return None
+    return tuple(partial(_COLUMN_OPS[st["name"]], **st["params"]) if st.get("params")
+                 else _COLUMN_OPS[st["name"]] for st in steps)
+
+# Arithmetic steps over an all-number column; each takes its parsed float param
+_NUMERIC_COLUMN_OPS = {
+    "addition": ("amount", lambda col, x: [float(v) + x for v in col]),
+    "subtraction": ("amount", lambda col, x: [float(v) - x for v in col]),
+    "multiplication": ("factor", lambda col, x: [float(v) * x for v in col]),
+    "percentage": ("factor", lambda col, x: [float(v) * x for v in col]),
+    "division": ("divisor", lambda col, x: [float(v) / x for v in col]),
+    "adjust_negative_to_zero": (None, lambda col: [x if x > 0 else 0 for x in map(float, col)]),
+}
+
+@lru_cache(maxsize=1024)
+def _compile_numeric_plan(rule):
+    steps = [st for st in _compile_rule(rule) if st["name"] != "copy"]
+    if not steps or not all(st["name"] in _NUMERIC_COLUMN_OPS for st in steps): return None
+    plan = []
+    for i, st in enumerate(steps):
+        param, op = _NUMERIC_COLUMN_OPS[st["name"]]
+        if param is None:
+            plan.append(op)
+            continue
+        params = st.get("params", {})
+        if st["name"] == "percentage": params = {"factor": 100, **params}
+        try: x = float(params[param])
+        except (KeyError, TypeError, ValueError): return None  # let the per-value path raise
+        if st["name"] == "division" and x == 0:
+            # division yields None here, which only the last step may return
+            if i != len(steps) - 1: return None
+            plan.append(lambda col: [None] * len(col))
+            continue
+        plan.append(partial(op, x=x))
+    return tuple(plan)
+
 # ─── DSL engine with broadcasting ───────────────────────────────────────────
 def bulk_apply_pipe_rules(values_list, rule_strings):
     if not isinstance(values_list, list):
         raise ValueError("values_list must be a list")
 
+    # Broadcast: one rule for every value, compiled once outside the loop
     if isinstance(rule_strings, str):
-        rule_strings = [rule_strings] * len(values_list)
+        if not rule_strings or not values_list:
+            return list(values_list)
+        # All-string column with only string steps: run step by step over the column
+        plan = _compile_column_plan(rule_strings)
+        if plan is not None and all(isinstance(v, str) for v in values_list):
+            col = values_list
+            for op in plan: col = op(col)
+            return list(col)
+        # All-number column with only arithmetic steps: same float math, no per-value dispatch
+        plan = _compile_numeric_plan(rule_strings)
+        if plan is not None and all(type(v) in (int, float) for v in values_list):
+            try:
+                col = values_list
+                for op in plan: col = op(col)
+                return list(col)
+            except OverflowError:
+                pass  # int too large for float: the per-value path decides
+        run = _compile_pipeline(rule_strings)
+        return [run(val)[0] for val in values_list]
     elif isinstance(rule_strings, list):
+        # Broadcast the single side lazily rather than growing the caller's list
         if len(rule_strings) == 1 and len(values_list) > 1:
-            rule_strings *= len(values_list)
+            if isinstance(rule_strings[0], str):
+                return bulk_apply_pipe_rules(values_list, rule_strings[0])
+            rule_strings = repeat(rule_strings[0], len(values_list))
         elif len(values_list) == 1 and len(rule_strings) > 1:
-            values_list *= len(rule_strings)
+            values_list = repeat(values_list[0], len(rule_strings))
         elif len(rule_strings) != len(values_list):
             raise ValueError("Length mismatch between values_list and rule_strings")
     else:
@@ -99,104 +330,7 @@ def bulk_apply_pipe_rules(values_list, rule_strings):
             results.append(val)
             continue
 
-        steps = []
-        for token_raw in rule.replace('+', '|;|').split('|;|'):
-            token = token_raw.lstrip()
-            if not token:
-                continue
-
-            # ---------- split ----------
-            if token.startswith("split|"):
-                raw = token[6:]
-                if raw in ("|||", r"\|"):
-                    delim = "|"
-                elif raw.startswith("|||"):
-                    delim = raw[3:] or "|"
-                elif raw.startswith("||"):
-                    tail = raw[2:]
-                    delim = " " if tail in ("", " ") else tail
-                elif raw.startswith(r"\|"):
-                    delim = "|" + raw[2:]
-                else:
-                    delim = raw
-                if delim != " ": delim = delim.strip()
-                if delim == "": raise ValueError("split requires non-empty delimiter")
-                steps.append({"name": "split", "params": {"delimiter": delim}})
-                continue
-
-            # ---------- join ----------
-            if token.startswith("join|"):
-                steps.append({"name": "join", "params": {"delimiter": token[5:]}})
-                continue
-
-            # ---------- prefix / suffix ----------
-            if token.startswith("prefix|"):
-                steps.append({"name": "prefix", "params": {"prefix_str": token[7:]}})
-                continue
-            if token.startswith("suffix|"):
-                steps.append({"name": "suffix", "params": {"suffix_str": token[7:]}})
-                continue
-
-            # ---------- replace_regex ----------
-            if token.startswith("replace_regex|"):
-                pat, *rep = token[14:].split("||", 1)
-                steps.append({"name": "replace_regex",
-                              "params": {"pattern": pat, "repl": rep[0] if rep else ""}})
-                continue
-
-            # ---------- replace ----------
-            if token.startswith("replace|"):
-                try:
-                    old, new = token[8:].split('|', 1)
-                except ValueError:
-                    raise ValueError(f"replace requires two parameters: {token}")
-                steps.append({"name": "replace",
-                              "params": {"old": old, "new": new}})
-                continue
-
-            # ---------- vlookup ----------
-            if token.startswith("vlookup|"):
-                mapping = {}
-                for pair in token[8:].rstrip('|').split(','):
-                    k, v = pair.split(':', 1)
-                    v = v.strip()
-                    mapping[k.strip().lower()] = \
-                        True if v.lower() == "true" else \
-                        False if v.lower() == "false" else \
-                        float(v) if re.match(r'^-?\d+\.\d+$', v) else \
-                        int(v) if v.isdigit() else v
-                steps.append({"name": "vlookup_map", "params": {"mapping": mapping}})
-                continue
-
-            # ---------- arithmetic ----------
-            for op in ("addition", "subtraction", "multiplication", "division", "percentage"):
-                if token.startswith(f"{op}|"):
-                    param = token.split('|', 1)[1]
-                    key = ("amount" if op in ("addition", "subtraction") else
-                           "factor" if op in ("multiplication", "percentage") else
-                           "divisor")
-                    steps.append({"name": op, "params": {key: param}})
-                    break
-            else:
-                # ---------- strip with chars / set / zero_padding ----------
-                if token.startswith("strip|"):
-                    steps.append({"name": "strip",
-                                  "params": {"chars": token.split('|',1)[1]}})
-                elif token.startswith("set|"):
-                    steps.append({"name": "set",
-                                  "params": {"value": token.split('|',1)[1]}})
-                elif token.startswith("set_number|"):
-                    steps.append({"name": "set_number",
-                                  "params": {"value": token.split('|',1)[1]}})
-                elif token.startswith("zero_padding|"):
-                    steps.append({"name": "zero_padding",
-                                  "params": {"value": token.split('|',1)[1]}})
-                elif token == "rejects":
-                    steps.append({"name": "rejects"})
-                else:
-                    steps.append({"name": token})
-
-        out, _ = apply_transformations(val, steps)
+        out, _ = _compile_pipeline(rule)(val)
         results.append(out)
 
-    return results
\ No newline at end of file
+    return results
@@ -10,12 +10,18 @@ Supports:
 
 import os
 import asyncio
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Sequence, Tuple
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+# HTTP download chunk size; large chunks keep syscalls and thread hops low
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Emit a debug progress line roughly every this many bytes
+PROGRESS_LOG_INTERVAL = 10 << 20
+
 
 class FileLoaderError(Exception):
     """Base exception for file loading errors."""
@@ -41,11 +47,39 @@ class FileLoader:
         """
         raise NotImplementedError
 
+    async def load_files(
+        self,
+        pairs: Sequence[Tuple[str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """
+        Load several files concurrently.
+        
+        Args:
+            pairs: (source, destination) tuples; destination may be None
+            max_concurrency: Maximum number of transfers in flight
+            
+        Returns:
+            Paths to loaded files, in the same order as pairs
+            
+        Raises:
+            FileLoaderError: If any load fails
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def load_one(source: str, destination: Optional[str]) -> str:
+            async with semaphore:
+                return await self.load_file(source, destination)
+
+        return list(await asyncio.gather(
+            *(load_one(source, destination) for source, destination in pairs)
+        ))
+
 
 class HTTPFileLoader(FileLoader):
     """Load files from HTTP/HTTPS URLs."""
 
-    def __init__(self, timeout: int = 300, chunk_size: int = 8192):
+    def __init__(self, timeout: int = 300, chunk_size: int = DOWNLOAD_CHUNK_SIZE):
         """
         Initialize HTTP loader.
         
@@ -55,6 +89,29 @@ class HTTPFileLoader(FileLoader):
         """
         self.timeout = timeout
         self.chunk_size = chunk_size
+        # Shared session while load_files() runs, so connections and TLS
+        # handshakes are reused across downloads
+        self._session: Optional[Any] = None
+
+    async def load_files(
+        self,
+        pairs: Sequence[Tuple[str, Optional[str]]],
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """Download several URLs concurrently over one shared session."""
+        try:
+            import aiohttp
+        except ImportError:
+            raise FileLoaderError(
+                "aiohttp not installed. Install with: pip install aiohttp"
+            )
+
+        async with aiohttp.ClientSession() as session:
+            self._session = session
+            try:
+                return await super().load_files(pairs, max_concurrency)
+            finally:
+                self._session = None
 
     async def load_file(self, source: str, destination: Optional[str] = None) -> str:
         """
@@ -82,25 +139,11 @@ class HTTPFileLoader(FileLoader):
         logger.info(f"Downloading file from {source} to {destination}")
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    source,
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                ) as response:
-                    response.raise_for_status()
-
-                    total_size = int(response.headers.get("content-length", 0))
-                    downloaded = 0
-
-                    with open(destination, "wb") as f:
-                        async for chunk in response.content.iter_chunked(self.chunk_size):
-                            f.write(chunk)
-                            downloaded += len(chunk)
-
-                            if total_size > 0:
-                                percent = (downloaded / total_size) * 100
-                                if percent % 10 < 0.5:  # Log every ~10%
-                                    logger.debug(f"Downloaded {percent:.1f}%")
+            if self._session is not None:
+                downloaded = await self._download(self._session, source, destination)
+            else:
+                async with aiohttp.ClientSession() as session:
+                    downloaded = await self._download(session, source, destination)
 
             logger.info(f"Downloaded {downloaded} bytes to {destination}")
             return destination
@@ -110,6 +153,33 @@ class HTTPFileLoader(FileLoader):
                 os.remove(destination)
             raise FileLoaderError(f"HTTP download failed: {e}")
 
+    async def _download(self, session: Any, source: str, destination: str) -> int:
+        """Stream one URL to destination; returns bytes written."""
+        import aiohttp
+
+        async with session.get(
+            source,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            response.raise_for_status()
+
+            total_size = int(response.headers.get("content-length", 0))
+            downloaded = 0
+            log_progress = logger.isEnabledFor(logging.DEBUG)
+            next_log = PROGRESS_LOG_INTERVAL
+
+            with open(destination, "wb") as f:
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    # Write on a worker thread so disk I/O doesn't stall the loop
+                    await asyncio.to_thread(f.write, chunk)
+                    downloaded += len(chunk)
+
+                    if log_progress and downloaded >= next_log:
+                        next_log += PROGRESS_LOG_INTERVAL
+                        logger.debug(f"Downloaded {downloaded} of {total_size or '?'} bytes")
+
+        return downloaded
+
 
 class GCSFileLoader(FileLoader):
     """Load files from Google Cloud Storage."""
@@ -122,6 +192,24 @@ class GCSFileLoader(FileLoader):
             credentials_path: Path to GCS credentials JSON (or use GOOGLE_APPLICATION_CREDENTIALS env)
         """
         self.credentials_path = credentials_path
+        self._client: Optional[Any] = None
+
+    def _get_client(self) -> Any:
+        """Create the storage client once and reuse it across downloads."""
+        if self._client is None:
+            try:
+                from google.cloud import storage
+            except ImportError:
+                raise FileLoaderError(
+                    "google-cloud-storage not installed. "
+                    "Install with: pip install google-cloud-storage"
+                )
+
+            if self.credentials_path:
+                self._client = storage.Client.from_service_account_json(self.credentials_path)
+            else:
+                self._client = storage.Client()
+        return self._client
 
     async def load_file(self, source: str, destination: Optional[str] = None) -> str:
         """
@@ -134,13 +222,6 @@ class GCSFileLoader(FileLoader):
         Returns:
             Path to downloaded file
         """
-        try:
-            from google.cloud import storage
-        except ImportError:
-            raise FileLoaderError(
-                "google-cloud-storage not installed. Install with: pip install google-cloud-storage"
-            )
-
         if not source.startswith("gs://"):
             raise FileLoaderError(f"Invalid GCS path: {source}. Must start with gs://")
 
@@ -160,13 +241,7 @@ class GCSFileLoader(FileLoader):
         logger.info(f"Downloading from GCS: gs://{bucket_name}/{blob_path}")
 
         try:
-            # Initialize client
-            if self.credentials_path:
-                client = storage.Client.from_service_account_json(self.credentials_path)
-            else:
-                client = storage.Client()
-
-            bucket = client.bucket(bucket_name)
+            bucket = self._get_client().bucket(bucket_name)
             blob = bucket.blob(blob_path)
 
             # Download to file
@@ -202,6 +277,25 @@ class S3FileLoader(FileLoader):
         self.aws_access_key_id = aws_access_key_id
         self.aws_secret_access_key = aws_secret_access_key
         self.region_name = region_name
+        self._client: Optional[Any] = None
+
+    def _get_client(self) -> Any:
+        """Create the S3 client once and reuse it across downloads."""
+        if self._client is None:
+            try:
+                import boto3
+            except ImportError:
+                raise FileLoaderError(
+                    "boto3 not installed. Install with: pip install boto3"
+                )
+
+            self._client = boto3.client(
+                "s3",
+                aws_access_key_id=self.aws_access_key_id,
+                aws_secret_access_key=self.aws_secret_access_key,
+                region_name=self.region_name,
+            )
+        return self._client
 
     async def load_file(self, source: str, destination: Optional[str] = None) -> str:
         """
@@ -214,13 +308,6 @@ class S3FileLoader(FileLoader):
         Returns:
             Path to downloaded file
         """
-        try:
-            import boto3
-        except ImportError:
-            raise FileLoaderError(
-                "boto3 not installed. Install with: pip install boto3"
-            )
-
         if not source.startswith("s3://"):
             raise FileLoaderError(f"Invalid S3 path: {source}. Must start with s3://")
 
@@ -240,17 +327,9 @@ class S3FileLoader(FileLoader):
         logger.info(f"Downloading from S3: s3://{bucket_name}/{key}")
 
         try:
-            # Initialize client
-            s3_client = boto3.client(
-                "s3",
-                aws_access_key_id=self.aws_access_key_id,
-                aws_secret_access_key=self.aws_secret_access_key,
-                region_name=self.region_name,
-            )
-
-            # Download to file
+            # Download to file (boto3 clients are thread-safe)
             await asyncio.to_thread(
-                s3_client.download_file, bucket_name, key, destination
+                self._get_client().download_file, bucket_name, key, destination
             )
 
             file_size = os.path.getsize(destination)
@@ -266,6 +345,17 @@ class S3FileLoader(FileLoader):
 class LocalFileLoader(FileLoader):
     """Load files from local filesystem."""
 
+    def __init__(self, hardlink: bool = False):
+        """
+        Initialize local loader.
+        
+        Args:
+            hardlink: Hard-link instead of copying when source and destination
+                share a filesystem. Only use this for sources that won't be
+                modified in place, since both paths share the same data.
+        """
+        self.hardlink = hardlink
+
     async def load_file(self, source: str, destination: Optional[str] = None) -> str:
         """
         Copy or reference local file.
@@ -288,15 +378,61 @@ class LocalFileLoader(FileLoader):
             logger.info(f"Using local file: {source}")
             return source
 
+        if os.path.isdir(destination):
+            destination = os.path.join(destination, os.path.basename(source))
+
         # Copy to destination
         logger.info(f"Copying {source} to {destination}")
         try:
-            import shutil
-            await asyncio.to_thread(shutil.copy2, source, destination)
+            await asyncio.to_thread(self._copy, source, destination)
             return destination
         except Exception as e:
             raise FileLoaderError(f"Local file copy failed: {e}")
 
+    def _copy(self, source: str, destination: str) -> None:
+        """Link or copy source to destination (runs off the event loop)."""
+        import shutil
+
+        if self.hardlink:
+            try:
+                os.link(source, destination)
+                return
+            except OSError:
+                # Cross-device, existing destination or unsupported: copy instead
+                pass
+
+        # Opening the destination truncates it, so refuse copies onto the source
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            raise shutil.SameFileError(f"{source} and {destination} are the same file")
+
+        try:
+            _copy_file_range(source, destination)
+        except OSError:
+            shutil.copyfile(source, destination)
+        # Keep the permission bits and timestamps shutil.copy2 used to preserve
+        shutil.copystat(source, destination)
+
+
+def _copy_file_range(source: str, destination: str) -> None:
+    """
+    Copy file contents in-kernel with os.copy_file_range.
+    
+    Avoids the userspace buffer and lets filesystems that support it
+    (btrfs, XFS, NFS 4.2) share extents instead of copying. Raises OSError
+    where unavailable so the caller can fall back to shutil.copyfile.
+    """
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("os.copy_file_range is not available")
+
+    with open(source, "rb") as src, open(destination, "wb") as dst:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        remaining = os.fstat(src_fd).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(src_fd, dst_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+
 
 class FileLoaderFactory:
     """Factory to create appropriate file loader based on source type."""
@@ -318,7 +454,7 @@ class FileLoaderFactory:
         if source.startswith("http://") or source.startswith("https://"):
             return HTTPFileLoader(
                 timeout=config.get("timeout", 300),
-                chunk_size=config.get("chunk_size", 8192),
+                chunk_size=config.get("chunk_size", DOWNLOAD_CHUNK_SIZE),
             )
         elif source.startswith("gs://"):
             return GCSFileLoader(
@@ -332,7 +468,7 @@ class FileLoaderFactory:
             )
         else:
             # Assume local file
-            return LocalFileLoader()
+            return LocalFileLoader(hardlink=config.get("hardlink", False))
 
     @staticmethod
     async def load_file(
@@ -353,3 +489,39 @@ class FileLoaderFactory:
         """
         loader = FileLoaderFactory.create_loader(source, config)
         return await loader.load_file(source, destination)
+
+    @staticmethod
+    async def load_files(
+        pairs: Sequence[Tuple[str, Optional[str]]],
+        config: Optional[Dict[str, Any]] = None,
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """
+        Load several files concurrently, sharing one loader per source type.
+        
+        Args:
+            pairs: (source, destination) tuples; destination may be None
+            config: Loader configuration
+            max_concurrency: Maximum transfers in flight per source type
+            
+        Returns:
+            Paths to loaded files, in the same order as pairs
+        """
+        groups: Dict[type, Tuple[FileLoader, List[int]]] = {}
+        for index, (source, _) in enumerate(pairs):
+            loader = FileLoaderFactory.create_loader(source, config)
+            if type(loader) not in groups:
+                groups[type(loader)] = (loader, [])
+            groups[type(loader)][1].append(index)
+
+        results: List[str] = [""] * len(pairs)
+
+        async def load_group(loader: FileLoader, indexes: List[int]) -> None:
+            paths = await loader.load_files([pairs[i] for i in indexes], max_concurrency)
+            for i, path in zip(indexes, paths):
+                results[i] = path
+
+        await asyncio.gather(
+            *(load_group(loader, indexes) for loader, indexes in groups.values())
+        )
+        return results
@@ -2,9 +2,18 @@
 Base parser class for file parsing
 """
 
+import copy
 from abc import ABC, abstractmethod
-from typing import AsyncIterator, Dict, Any, Optional
-from ..types import FileConfig
+from types import MappingProxyType
+from typing import AsyncIterator, Dict, Any, Mapping, Optional
+from ..types import FileConfig, ParsedRow
+
+# How raw_input_snapshot relates to a row's "data" dict:
+# - share: the same dict (no copy; treat both as read-only)
+# - shallow: a shallow copy, for consumers that modify "data" in place
+# - deep: a deep copy, for consumers that also modify nested values
+# - readonly: a read-only view of "data", to catch writes through the snapshot
+SNAPSHOT_MODES = ("share", "shallow", "deep", "readonly")
 
 
 class BaseParser(ABC):
@@ -22,9 +31,14 @@ class BaseParser(ABC):
         self.fixed_rows = self.file_config.get("fixed_rows", 0)
         self.delimiter = self.file_config.get("delimiter", ",")
         self.sheet_name = self.file_config.get("sheet_name")
+        self.snapshot_mode = self.file_config.get("snapshot_mode", "share")
+        if self.snapshot_mode not in SNAPSHOT_MODES:
+            raise ValueError(
+                f"Unknown snapshot_mode '{self.snapshot_mode}'. Expected one of {SNAPSHOT_MODES}"
+            )
     
     @abstractmethod
-    async def parse(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    async def parse(self, file_path: str) -> AsyncIterator[ParsedRow]:
         """
         Parse file and yield rows as dictionaries.
         
@@ -48,3 +62,14 @@ class BaseParser(ABC):
             True if this parser can handle the file
         """
         pass
+    
+    def _snapshot(self, row_data: Dict[str, Any]) -> Mapping[str, Any]:
+        """Build a row's raw_input_snapshot according to snapshot_mode."""
+        mode = self.snapshot_mode
+        if mode == "share":
+            return row_data
+        if mode == "shallow":
+            return row_data.copy()
+        if mode == "deep":
+            return copy.deepcopy(row_data)
+        return MappingProxyType(row_data)
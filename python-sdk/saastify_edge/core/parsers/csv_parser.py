@@ -2,10 +2,32 @@
 CSV/TSV file parser with streaming support
 """
 
+import asyncio
 import csv
-from typing import AsyncIterator, Dict, Any, Optional, List
+import mmap
+import os
+from typing import AsyncIterator, Any, Iterator, Optional, List, Tuple
 from .base import BaseParser
-from ..types import FileConfig
+from ..types import FileConfig, ParsedRow
+
+try:
+    import pyarrow.compute as pc
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Minimum read buffer; raised to the filesystem block size when that is larger
+READ_BUFFER_SIZE = 1 << 20
+
+# Rows read per worker-thread hop
+ROW_BLOCK_SIZE = 2048
+
+# Bytes per record batch for the pyarrow engine
+ARROW_BLOCK_SIZE = 8 << 20
+
+# Data rows inspected by strip_whitespace="auto" before choosing a row builder
+STRIP_SAMPLE_ROWS = 1000
 
 
 class CSVParser(BaseParser):
@@ -16,52 +38,250 @@ class CSVParser(BaseParser):
         # Auto-detect delimiter if not specified
         if not self.delimiter:
             self.delimiter = ","
+        # Strip cells and map empty ones to None (disable for pre-cleaned files).
+        # "auto" samples the first STRIP_SAMPLE_ROWS data rows and, when no cell
+        # there has surrounding whitespace, only maps empty cells to None for
+        # the rest of the file; later rows are trusted to be just as clean.
+        self.strip_whitespace = self.file_config.get("strip_whitespace", True)
+        # "pyarrow" uses Arrow's multi-threaded C++ reader for large,
+        # rectangular files; "python" (default) handles ragged rows
+        self.engine = self.file_config.get("engine", "python")
     
     def can_parse(self, file_path: str) -> bool:
         """Check if file is CSV or TSV"""
         return file_path.lower().endswith(('.csv', '.tsv', '.txt'))
     
-    async def parse(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    async def parse(self, file_path: str) -> AsyncIterator[ParsedRow]:
         """
         Parse CSV/TSV file and yield rows.
         
         Yields rows as dictionaries with file_row_number and field data.
+        "data" and "raw_input_snapshot" share one dict unless snapshot_mode
+        says otherwise, so treat them as read-only and copy before modifying.
         """
         # Auto-detect TSV
         if file_path.lower().endswith('.tsv'):
             self.delimiter = '\t'
         
-        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+        if self.engine == "pyarrow" and PYARROW_AVAILABLE:
+            async for row in self._parse_arrow(file_path):
+                yield row
+            return
+        
+        buffer_size = max(READ_BUFFER_SIZE, os.stat(file_path).st_blksize)
+        
+        with open(file_path, 'r', encoding='utf-8-sig', newline='',
+                  buffering=buffer_size) as f:
             # Skip fixed rows
-            for _ in range(self.fixed_rows):
-                next(f, None)
+            self._skip_fixed_rows(f, file_path)
             
             # Create CSV reader
             reader = csv.reader(f, delimiter=self.delimiter)
+            numbered_rows = enumerate(reader, start=1)
             
-            # Read header
-            headers: Optional[List[str]] = None
-            for row_num, row in enumerate(reader, start=1):
-                if row_num == self.header_row:
-                    headers = [col.strip() if col else f"Column_{i}" 
-                              for i, col in enumerate(row)]
-                    continue
-                
-                # Skip rows before data starts
-                if headers is None:
-                    continue
-                
-                # Build row dictionary
-                row_data = {}
-                for i, value in enumerate(row):
-                    col_name = headers[i] if i < len(headers) else f"Column_{i}"
-                    row_data[col_name] = value.strip() if value else None
-                
+            # Read blocks of rows on a worker thread so disk I/O doesn't
+            # block the event loop, prefetching the next block while the
+            # current one is being consumed
+            pending = asyncio.ensure_future(
+                asyncio.to_thread(self._read_block, numbered_rows)
+            )
+            
+            try:
+                headers: Optional[List[str]] = None
+                header_count = 0
+                strip_whitespace = self.strip_whitespace
+                sample_strip = strip_whitespace == "auto"
+                empty_to_none = False
+                while True:
+                    block = await pending
+                    if not block:
+                        break
+                    pending = asyncio.ensure_future(
+                        asyncio.to_thread(self._read_block, numbered_rows)
+                    )
+                    
+                    if sample_strip:
+                        sample = [row for row_num, row in block if row_num > self.header_row]
+                        if sample:
+                            sample_strip = False
+                            strip_whitespace = self._sample_needs_strip(sample)
+                            empty_to_none = not strip_whitespace
+                    
+                    for row_num, row in block:
+                        # Read header
+                        if row_num == self.header_row:
+                            headers = [col.strip() if col else f"Column_{i}" 
+                                      for i, col in enumerate(row)]
+                            header_count = len(headers)
+                            continue
+                        
+                        # Skip rows before data starts
+                        if headers is None:
+                            continue
+                        
+                        if strip_whitespace:
+                            row = [value.strip() if value else None for value in row]
+                        elif empty_to_none:
+                            row = [value or None for value in row]
+                        
+                        # Build row dictionary; zip stops at the shorter of the two
+                        row_data = dict(zip(headers, row))
+                        if len(row) > header_count:
+                            for i in range(header_count, len(row)):
+                                row_data[f"Column_{i}"] = row[i]
+                        
+                        yield {
+                            "file_row_number": row_num,
+                            "data": row_data,
+                            "raw_input_snapshot": self._snapshot(row_data)
+                        }
+            finally:
+                # Let any in-flight read finish before the file is closed
+                if not pending.done():
+                    try:
+                        await pending
+                    except Exception:
+                        pass
+    
+    async def _parse_arrow(self, file_path: str) -> AsyncIterator[ParsedRow]:
+        """
+        Parse with pyarrow's CSV reader, yielding the same row dicts as parse().
+        
+        Every column is read as a string (no type inference). Ragged rows
+        raise instead of getting Column_N keys, so use the default engine
+        for irregular files. Blank lines are kept so row numbers match
+        parse(), but come through with every column empty rather than as
+        an empty dict.
+        """
+        headers = await asyncio.to_thread(self._read_headers, file_path)
+        if headers is None:
+            return
+        
+        # "auto" only skips stripping when it finds nothing to strip, so the
+        # rows come out the same as with full stripping
+        strip_whitespace = bool(self.strip_whitespace)
+        reader = await asyncio.to_thread(
+            pa_csv.open_csv,
+            file_path,
+            read_options=pa_csv.ReadOptions(
+                skip_rows=self.fixed_rows + self.header_row,
+                column_names=headers,
+                block_size=ARROW_BLOCK_SIZE,
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=self.delimiter,
+                newlines_in_values=True,
+                ignore_empty_lines=False,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: "string" for name in headers},
+                # Empty cells become None only when stripping, as in parse()
+                strings_can_be_null=strip_whitespace,
+                null_values=[""],
+            ),
+        )
+        
+        row_num = self.header_row
+        while True:
+            batch = await asyncio.to_thread(self._read_arrow_batch, reader)
+            if batch is None:
+                break
+            
+            columns = [
+                (pc.utf8_trim_whitespace(column) if strip_whitespace else column).to_pylist()
+                for column in batch.columns
+            ]
+            for values in zip(*columns):
+                row_num += 1
+                row_data = dict(zip(headers, values))
                 yield {
                     "file_row_number": row_num,
                     "data": row_data,
-                    "raw_input_snapshot": row_data.copy()
+                    "raw_input_snapshot": self._snapshot(row_data)
                 }
+    
+    def _read_headers(self, file_path: str) -> Optional[List[str]]:
+        """Read and normalize the header row the same way parse() does."""
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            self._skip_fixed_rows(f, file_path)
+            
+            reader = csv.reader(f, delimiter=self.delimiter)
+            for row_num, row in enumerate(reader, start=1):
+                if row_num == self.header_row:
+                    return [col.strip() if col else f"Column_{i}"
+                            for i, col in enumerate(row)]
+        return None
+    
+    def _skip_fixed_rows(self, f: Any, file_path: str) -> None:
+        """Position the text file f just past the first fixed_rows lines."""
+        if not self.fixed_rows:
+            return
+        
+        offset = self._fixed_rows_offset(file_path)
+        if offset is None:
+            for _ in range(self.fixed_rows):
+                next(f, None)
+        else:
+            f.seek(offset)
+    
+    def _fixed_rows_offset(self, file_path: str) -> Optional[int]:
+        """
+        Byte offset just past the first fixed_rows lines, found by scanning
+        for newlines in a memory map instead of decoding each line.
+        
+        Returns None when the skipped part contains bare CR line endings,
+        which the text-mode line iterator also treats as line breaks.
+        """
+        with open(file_path, 'rb') as fb:
+            try:
+                mm = mmap.mmap(fb.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty file
+                return 0
+            
+            with mm:
+                offset = 0
+                for _ in range(self.fixed_rows):
+                    newline = mm.find(b'\n', offset)
+                    if newline == -1:
+                        offset = len(mm)
+                        break
+                    offset = newline + 1
+                
+                skipped = mm[:offset]
+        
+        if skipped.count(b'\r') != skipped.count(b'\r\n'):
+            return None
+        return offset
+    
+    @staticmethod
+    def _sample_needs_strip(rows: List[List[str]]) -> bool:
+        """True if any cell in the first STRIP_SAMPLE_ROWS rows has surrounding whitespace."""
+        for row in rows[:STRIP_SAMPLE_ROWS]:
+            for value in row:
+                if value and value != value.strip():
+                    return True
+        return False
+    
+    @staticmethod
+    def _read_arrow_batch(reader: Any) -> Any:
+        """Next record batch, or None at end of file."""
+        try:
+            return reader.read_next_batch()
+        except StopIteration:
+            return None
+    
+    @staticmethod
+    def _read_block(
+        numbered_rows: Iterator[Tuple[int, List[str]]]
+    ) -> List[Tuple[int, List[str]]]:
+        """Pull up to ROW_BLOCK_SIZE rows from the reader (runs off the event loop)."""
+        block = []
+        for item in numbered_rows:
+            block.append(item)
+            if len(block) >= ROW_BLOCK_SIZE:
+                break
+        return block
 
 
 class TSVParser(CSVParser):
@@ -1,10 +1,17 @@
 """
-Excel (XLSX/XLSM) file parser with streaming support
+Excel (XLSX/XLSM/XLS) file parser with streaming support
 """
 
-from typing import AsyncIterator, Dict, Any, Optional
+import asyncio
+from typing import AsyncIterator, Any, Iterator, List, Optional, Sequence, Tuple
 from .base import BaseParser
-from ..types import FileConfig
+from ..types import FileConfig, ParsedRow
+
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
 
 try:
     from openpyxl import load_workbook
@@ -12,78 +19,133 @@ try:
 except ImportError:
     OPENPYXL_AVAILABLE = False
 
+# Rows read per worker-thread hop
+ROW_BLOCK_SIZE = 2048
+
 
 class ExcelParser(BaseParser):
-    """Parser for Excel files (XLSX, XLSM)"""
+    """Parser for Excel files (XLSX, XLSM, XLS)"""
     
     def __init__(self, file_config: Optional[FileConfig] = None):
         super().__init__(file_config)
-        if not OPENPYXL_AVAILABLE:
-            raise ImportError("openpyxl is required for Excel parsing. Install with: pip install openpyxl")
+        if not (CALAMINE_AVAILABLE or OPENPYXL_AVAILABLE):
+            raise ImportError(
+                "python-calamine or openpyxl is required for Excel parsing. "
+                "Install with: pip install python-calamine"
+            )
+        # "calamine" uses the Rust calamine reader (much faster on large
+        # workbooks) but reports values differently from openpyxl: integers
+        # as floats, dates as ISO dates and no leading empty columns.
+        # "openpyxl" (default) keeps openpyxl's values.
+        self.engine = self.file_config.get("engine", "openpyxl")
     
     def can_parse(self, file_path: str) -> bool:
         """Check if file is Excel"""
         return file_path.lower().endswith(('.xlsx', '.xlsm', '.xls'))
     
-    async def parse(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    async def parse(self, file_path: str) -> AsyncIterator[ParsedRow]:
         """
         Parse Excel file and yield rows.
         
-        Uses read_only mode for memory efficiency with large files.
+        Uses openpyxl in read_only mode for memory efficiency with large
+        files, or the calamine reader with engine="calamine" (and for
+        legacy .xls files, or when openpyxl is missing) when python-calamine
+        is installed.
+        "data" and "raw_input_snapshot" follow snapshot_mode, as in CSVParser.
         """
-        # Load workbook in read-only mode for streaming
-        wb = load_workbook(file_path, read_only=True, data_only=True)
-        
-        # Select worksheet
-        if self.sheet_name:
-            if self.sheet_name in wb.sheetnames:
-                ws = wb[self.sheet_name]
-            else:
-                raise ValueError(f"Sheet '{self.sheet_name}' not found. Available: {wb.sheetnames}")
+        if CALAMINE_AVAILABLE and (
+            self.engine == "calamine"
+            or not OPENPYXL_AVAILABLE
+            or file_path.lower().endswith(".xls")
+        ):
+            excel_rows = self._iter_calamine_rows(file_path)
         else:
-            # Use first sheet
-            ws = wb.active
+            excel_rows = self._iter_openpyxl_rows(file_path)
         
-        # Iterate through rows
+        # Workbook reads and decompression run on a worker thread, a block
+        # of rows at a time, so the event loop is never blocked
+        numbered_rows = enumerate(excel_rows, start=1)
         headers = None
-        row_num = 0
         
-        for excel_row in ws.iter_rows(values_only=True):
-            row_num += 1
-            
-            # Skip fixed rows
-            if row_num <= self.fixed_rows:
-                continue
-            
-            # Extract headers
-            if row_num == self.header_row:
-                headers = [
-                    str(col).strip() if col is not None else f"Column_{i}"
-                    for i, col in enumerate(excel_row)
-                ]
-                continue
+        while True:
+            block = await asyncio.to_thread(self._read_block, numbered_rows)
+            if not block:
+                break
             
-            # Skip if headers not yet read
-            if headers is None:
-                continue
-            
-            # Build row dictionary
-            row_data = {}
-            for i, value in enumerate(excel_row):
-                col_name = headers[i] if i < len(headers) else f"Column_{i}"
+            for row_num, excel_row in block:
+                # Skip fixed rows
+                if row_num <= self.fixed_rows:
+                    continue
                 
-                # Convert value to string, handle None
-                if value is None:
-                    row_data[col_name] = None
-                elif isinstance(value, (int, float)):
-                    row_data[col_name] = value
-                else:
-                    row_data[col_name] = str(value).strip()
-            
-            yield {
-                "file_row_number": row_num,
-                "data": row_data,
-                "raw_input_snapshot": row_data.copy()
-            }
+                # Extract headers
+                if row_num == self.header_row:
+                    headers = [
+                        str(col).strip() if col is not None else f"Column_{i}"
+                        for i, col in enumerate(excel_row)
+                    ]
+                    continue
+                
+                # Skip if headers not yet read
+                if headers is None:
+                    continue
+                
+                # Build row dictionary
+                row_data = {}
+                for i, value in enumerate(excel_row):
+                    col_name = headers[i] if i < len(headers) else f"Column_{i}"
+                    
+                    # Convert value to string, handle None
+                    if value is None:
+                        row_data[col_name] = None
+                    elif isinstance(value, (int, float)):
+                        row_data[col_name] = value
+                    else:
+                        row_data[col_name] = str(value).strip()
+                
+                yield {
+                    "file_row_number": row_num,
+                    "data": row_data,
+                    "raw_input_snapshot": self._snapshot(row_data)
+                }
+    
+    @staticmethod
+    def _read_block(
+        numbered_rows: Iterator[Tuple[int, Sequence[Any]]]
+    ) -> List[Tuple[int, Sequence[Any]]]:
+        """Read up to ROW_BLOCK_SIZE rows (runs off the event loop)."""
+        block = []
+        for item in numbered_rows:
+            block.append(item)
+            if len(block) >= ROW_BLOCK_SIZE:
+                break
+        return block
+    
+    def _select_sheet(self, sheet_names: List[str]) -> Optional[str]:
+        """Resolve the configured sheet name (None means the default sheet)."""
+        if self.sheet_name and self.sheet_name not in sheet_names:
+            raise ValueError(f"Sheet '{self.sheet_name}' not found. Available: {sheet_names}")
+        return self.sheet_name
+    
+    def _iter_calamine_rows(self, file_path: str) -> Iterator[Sequence[Any]]:
+        """Yield raw cell values per row using python-calamine."""
+        wb = CalamineWorkbook.from_path(file_path)
+        sheet_name = self._select_sheet(wb.sheet_names) or wb.sheet_names[0]
+        sheet = wb.get_sheet_by_name(sheet_name)
         
-        wb.close()
+        for row in sheet.iter_rows():
+            # Calamine reports empty cells as "", openpyxl as None
+            yield [None if value == "" else value for value in row]
+    
+    def _iter_openpyxl_rows(self, file_path: str) -> Iterator[Sequence[Any]]:
+        """Yield raw cell values per row using openpyxl in read-only mode."""
+        # Load workbook in read-only mode for streaming
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        
+        try:
+            # Select worksheet (first/active sheet by default)
+            sheet_name = self._select_sheet(wb.sheetnames)
+            ws = wb[sheet_name] if sheet_name else wb.active
+            
+            yield from ws.iter_rows(values_only=True)
+        finally:
+            wb.close()
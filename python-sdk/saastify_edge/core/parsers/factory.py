@@ -2,6 +2,7 @@
 Parser factory for auto-detecting and creating the appropriate parser
 """
 
+from functools import lru_cache
 from typing import Optional
 from .base import BaseParser
 from .csv_parser import CSVParser, TSVParser
@@ -20,6 +21,42 @@ PARSER_CLASSES = [
     XMLParser,
 ]
 
+# Extension -> parser class, equivalent to scanning PARSER_CLASSES in order
+_EXT_TO_PARSER = {
+    '.tsv': TSVParser,
+    '.csv': CSVParser,
+    '.txt': CSVParser,
+    '.xlsx': ExcelParser,
+    '.xlsm': ExcelParser,
+    '.xls': ExcelParser,
+    '.json': JSONParser,
+    '.xml': XMLParser,
+}
+
+# Extension -> file type reported by detect_file_type
+_EXT_TO_TYPE = {
+    '.csv': 'CSV',
+    '.tsv': 'TSV',
+    '.xlsx': 'XLSX',
+    '.xlsm': 'XLSX',
+    '.xls': 'XLS',
+    '.json': 'JSON',
+    '.xml': 'XML',
+}
+
+
+@lru_cache(maxsize=1024)
+def _extension(file_path: str) -> str:
+    """
+    Lower-cased suffix from the last dot (same test as str.endswith on it).
+    
+    Memoized per path: jobs resolve the same file's parser and type
+    repeatedly, and both lookups then cost a single hash probe.
+    """
+    lower_path = file_path.lower()
+    dot = lower_path.rfind('.')
+    return lower_path[dot:] if dot != -1 else ''
+
 
 def get_parser(file_path: str, file_config: Optional[FileConfig] = None) -> BaseParser:
     """
@@ -35,6 +72,11 @@ def get_parser(file_path: str, file_config: Optional[FileConfig] = None) -> Base
     Raises:
         ValueError: If no suitable parser is found
     """
+    parser_class = _EXT_TO_PARSER.get(_extension(file_path))
+    if parser_class is not None:
+        return parser_class(file_config)
+    
+    # Parsers registered in PARSER_CLASSES beyond the built-in extensions
     for parser_class in PARSER_CLASSES:
         parser = parser_class(file_config)
         if parser.can_parse(file_path):
@@ -53,22 +95,7 @@ def detect_file_type(file_path: str) -> str:
     Returns:
         File type string (CSV, TSV, XLSX, JSON, XML, UNKNOWN)
     """
-    lower_path = file_path.lower()
-    
-    if lower_path.endswith('.csv'):
-        return 'CSV'
-    elif lower_path.endswith('.tsv'):
-        return 'TSV'
-    elif lower_path.endswith(('.xlsx', '.xlsm')):
-        return 'XLSX'
-    elif lower_path.endswith('.xls'):
-        return 'XLS'
-    elif lower_path.endswith('.json'):
-        return 'JSON'
-    elif lower_path.endswith('.xml'):
-        return 'XML'
-    else:
-        return 'UNKNOWN'
+    return _EXT_TO_TYPE.get(_extension(file_path), 'UNKNOWN')
 
 
 class ParserFactory:
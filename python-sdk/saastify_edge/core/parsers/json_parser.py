@@ -2,10 +2,50 @@
 JSON file parser
 """
 
+import asyncio
 import json
-from typing import AsyncIterator, Dict, Any, Optional
+import os
+import re
+from typing import AsyncIterator, Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
 from .base import BaseParser
-from ..types import FileConfig
+from ..types import FileConfig, ParsedRow
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Files at least this large are streamed with ijson (when installed) rather
+# than decoded whole, keeping memory at O(one row) instead of O(file)
+STREAM_THRESHOLD = 64 << 20
+
+# Rows decoded per worker-thread hop when streaming
+ROW_BLOCK_SIZE = 2048
+
+# Keys searched, in order, for the row array of a wrapping object
+ROW_ARRAY_KEYS = ('data', 'items', 'rows', 'records', 'products')
+
+# A run of 19 digits may be an integer outside 64 bits, which orjson would
+# silently turn into a float
+_has_long_digits = re.compile(rb'\d{19}').search
+
+
+def _project(item: Dict[str, Any], wanted: FrozenSet[str]) -> Dict[str, Any]:
+    """Keep the keys of item whose lower-cased name is in wanted."""
+    return {key: value for key, value in item.items() if key.lower() in wanted}
 
 
 class JSONParser(BaseParser):
@@ -15,44 +55,260 @@ class JSONParser(BaseParser):
         """Check if file is JSON"""
         return file_path.lower().endswith('.json')
     
-    async def parse(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    async def parse(self, file_path: str) -> AsyncIterator[ParsedRow]:
         """
         Parse JSON file and yield rows.
         
         Expects JSON to be either:
         - An array of objects: [{...}, {...}, ...]
         - An object with an array property
+        
+        "data" and "raw_input_snapshot" share one dict unless snapshot_mode
+        says otherwise, so treat them as read-only and copy before modifying.
+        
+        With a "columns" list in the file config, each row keeps only those
+        keys (matched case-insensitively, like the template mapper). When
+        pysimdjson is installed, the other values are then never turned
+        into Python objects at all.
+        
+        Files of STREAM_THRESHOLD bytes or more are streamed when ijson is
+        installed, so malformed JSON there can raise after some rows have
+        been yielded.
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        columns = self.file_config.get("columns")
+        wanted = frozenset(column.lower() for column in columns) if columns else None
+        
+        # Rows already yielded by a stream that then failed
+        skip = 0
+        if IJSON_AVAILABLE and os.path.getsize(file_path) >= STREAM_THRESHOLD:
+            prefix = await asyncio.to_thread(self._find_row_prefix, file_path)
+            if prefix is not None:
+                try:
+                    async for row in self._parse_stream(file_path, prefix, wanted):
+                        skip = row["file_row_number"]
+                        yield row
+                    return
+                except ijson.JSONError:
+                    # Malformed JSON, or values ijson's C backend rejects
+                    # (integers beyond 64 bits, NaN): the full load below
+                    # reports the first and reads the rest of the others
+                    pass
+        
+        if not skip and wanted is not None and SIMDJSON_AVAILABLE:
+            document = await asyncio.to_thread(self._load_document, file_path)
+            if document is not None:
+                async for row in self._parse_projected(document, wanted):
+                    yield row
+                return
         
+        # Load off the event loop; orjson decodes the raw bytes when installed
+        data = await asyncio.to_thread(self._load, file_path)
+        for row in self._rows(data, wanted):
+            if row["file_row_number"] > skip:
+                yield row
+    
+    def _rows(self, data: Any, wanted: Optional[FrozenSet[str]]) -> Iterator[ParsedRow]:
+        """Rows of a fully decoded document."""
         # If data is a list, iterate through it
         if isinstance(data, list):
             for row_num, item in enumerate(data, start=1):
                 if isinstance(item, dict):
+                    if wanted is not None:
+                        item = _project(item, wanted)
                     yield {
                         "file_row_number": row_num,
                         "data": item,
-                        "raw_input_snapshot": item.copy()
+                        "raw_input_snapshot": self._snapshot(item)
                     }
         
         # If data is a dict, try to find the array
         elif isinstance(data, dict):
             # Look for common array keys
-            for key in ['data', 'items', 'rows', 'records', 'products']:
+            for key in ROW_ARRAY_KEYS:
                 if key in data and isinstance(data[key], list):
                     for row_num, item in enumerate(data[key], start=1):
                         if isinstance(item, dict):
+                            if wanted is not None:
+                                item = _project(item, wanted)
                             yield {
                                 "file_row_number": row_num,
                                 "data": item,
-                                "raw_input_snapshot": item.copy()
+                                "raw_input_snapshot": self._snapshot(item)
                             }
                     return
             
             # If no array found, treat the whole object as a single row
+            if wanted is not None:
+                data = _project(data, wanted)
             yield {
                 "file_row_number": 1,
                 "data": data,
-                "raw_input_snapshot": data.copy()
+                "raw_input_snapshot": self._snapshot(data)
             }
+    
+    async def _parse_stream(
+        self, file_path: str, prefix: str, wanted: Optional[FrozenSet[str]]
+    ) -> AsyncIterator[ParsedRow]:
+        """Stream the row array at ijson prefix, yielding the same rows as parse()."""
+        with open(file_path, 'rb') as f:
+            numbered_items = enumerate(ijson.items(f, prefix, use_float=True), start=1)
+            while True:
+                block = await asyncio.to_thread(self._read_block, numbered_items)
+                if not block:
+                    break
+                for row_num, item in block:
+                    if isinstance(item, dict):
+                        if wanted is not None:
+                            item = _project(item, wanted)
+                        yield {
+                            "file_row_number": row_num,
+                            "data": item,
+                            "raw_input_snapshot": self._snapshot(item)
+                        }
+    
+    async def _parse_projected(
+        self, document: Any, wanted: FrozenSet[str]
+    ) -> AsyncIterator[ParsedRow]:
+        """Yield the same rows as parse() from a pysimdjson document."""
+        if isinstance(document, simdjson.Array):
+            items = document
+        elif isinstance(document, simdjson.Object):
+            items = None
+            for key in ROW_ARRAY_KEYS:
+                if key in document and isinstance(document[key], simdjson.Array):
+                    items = document[key]
+                    break
+            if items is None:
+                row_data = self._project_object(document, wanted)
+                yield {
+                    "file_row_number": 1,
+                    "data": row_data,
+                    "raw_input_snapshot": self._snapshot(row_data)
+                }
+                return
+        else:
+            return
+        
+        numbered_items = enumerate(items, start=1)
+        while True:
+            block = await asyncio.to_thread(self._read_projected_block, numbered_items, wanted)
+            if not block:
+                break
+            for row_num, row_data in block:
+                yield {
+                    "file_row_number": row_num,
+                    "data": row_data,
+                    "raw_input_snapshot": self._snapshot(row_data)
+                }
+    
+    @classmethod
+    def _read_projected_block(
+        cls,
+        numbered_items: Iterator[Tuple[int, Any]],
+        wanted: FrozenSet[str]
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Project up to ROW_BLOCK_SIZE object rows (runs off the event loop)."""
+        block = []
+        for row_num, item in numbered_items:
+            if isinstance(item, simdjson.Object):
+                block.append((row_num, cls._project_object(item, wanted)))
+                if len(block) >= ROW_BLOCK_SIZE:
+                    break
+        return block
+    
+    @staticmethod
+    def _project_object(item: Any, wanted: FrozenSet[str]) -> Dict[str, Any]:
+        """Materialize only the wanted keys of a pysimdjson object."""
+        row_data = {}
+        for key in item:
+            if key.lower() in wanted:
+                value = item[key]
+                if isinstance(value, simdjson.Object):
+                    value = value.as_dict()
+                elif isinstance(value, simdjson.Array):
+                    value = value.as_list()
+                row_data[key] = value
+        return row_data
+    
+    @staticmethod
+    def _load_document(file_path: str) -> Any:
+        """
+        Parse the file with pysimdjson, leaving values unmaterialized.
+        
+        Returns None when simdjson rejects the file (malformed JSON or
+        numbers outside 64 bits) so the regular load reports or handles it.
+        """
+        try:
+            return simdjson.Parser().load(file_path)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _find_row_prefix(file_path: str) -> Optional[str]:
+        """
+        Locate the row array, with an event-only pass over a wrapping object.
+        
+        Returns the ijson prefix of the array parse() would read rows from,
+        or None to leave the file to the regular full load: no such array
+        (a single object row or a scalar), malformed JSON, or integers too
+        large for the C backend.
+        
+        A top-level array is recognized from its first event, so problems
+        later in it surface while streaming instead.
+        """
+        top = None
+        # Whether each candidate key's (last) value is an array
+        is_array: Dict[str, bool] = {}
+        key = None
+        try:
+            with open(file_path, 'rb') as f:
+                for prefix, event, value in ijson.parse(f, use_float=True):
+                    if top is None:
+                        if event == 'start_array':
+                            return 'item'
+                        top = event
+                    elif prefix == '':
+                        if event == 'map_key':
+                            key = value if value in ROW_ARRAY_KEYS else None
+                    elif key is not None and prefix == key:
+                        is_array[key] = event == 'start_array'
+                        key = None
+        except ijson.JSONError:
+            return None
+        
+        for key in ROW_ARRAY_KEYS:
+            if is_array.get(key):
+                return f"{key}.item"
+        return None
+    
+    @staticmethod
+    def _read_block(
+        numbered_items: Iterator[Tuple[int, Any]]
+    ) -> List[Tuple[int, Any]]:
+        """Decode up to ROW_BLOCK_SIZE items (runs off the event loop)."""
+        block = []
+        for item in numbered_items:
+            block.append(item)
+            if len(block) >= ROW_BLOCK_SIZE:
+                break
+        return block
+    
+    @staticmethod
+    def _load(file_path: str) -> Any:
+        """
+        Read and decode the whole JSON document.
+        
+        orjson decodes it when installed, unless the document may hold
+        integers outside 64 bits or uses NaN/Infinity; json handles those
+        the way it always has.
+        """
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        if ORJSON_AVAILABLE and not _has_long_digits(raw):
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+        
+        return json.loads(raw)
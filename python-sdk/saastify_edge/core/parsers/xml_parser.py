@@ -2,50 +2,165 @@
 XML file parser
 """
 
+import asyncio
+import copy
 import xml.etree.ElementTree as ET
-from typing import AsyncIterator, Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Iterator, List, Optional, Set, Tuple
 from .base import BaseParser
-from ..types import FileConfig
+from ..types import FileConfig, ParsedRow
 
+# Common tag names for repeating row elements, in order of preference
+ITEM_TAGS = ('row', 'item', 'record', 'product', 'entry', 'data')
+_ITEM_TAG_SET = frozenset(ITEM_TAGS)
 
-class XMLParser(BaseParser):
-    """Parser for XML files"""
+# Rows converted per worker-thread hop
+ROW_BLOCK_SIZE = 2048
+
+# Bytes fed to the parser at a time by the tag scan
+READ_CHUNK_SIZE = 1 << 20
+
+# Marks a tag not yet present in a result dict (None is a valid value)
+_MISSING = object()
+
+
+class _TagCollector:
+    """
+    XMLParser target recording which ITEM_TAGS occur below the root.
     
-    def can_parse(self, file_path: str) -> bool:
-        """Check if file is XML"""
-        return file_path.lower().endswith('.xml')
+    No tree is built, so one streaming pass over the file answers what the
+    old findall(".//tag") probe needed up to one full traversal per tag for.
+    """
+    
+    def __init__(self) -> None:
+        self.tags: Set[str] = set()
+        self.seen_root = False
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if self.seen_root:
+            if tag in _ITEM_TAG_SET:
+                self.tags.add(tag)
+        else:
+            self.seen_root = True
     
-    def _element_to_dict(self, element: ET.Element) -> Dict[str, Any]:
-        """Convert XML element to dictionary"""
-        result = {}
+    def close(self) -> Set[str]:
+        return self.tags
+
+
+class _RowBuilder:
+    """
+    XMLParser target building row values straight from parse events.
+    
+    Each row element becomes its stripped text when it is a plain text
+    leaf, otherwise a dict of its attributes, text ('_text') and child
+    values, with repeated child tags collected into lists and empty
+    elements as None. No Element objects are built. Completed rows collect
+    in .rows in document order (a row before the rows nested inside it).
+    """
+    
+    def __init__(self, row_tag: Optional[str]) -> None:
+        self.row_tag = row_tag
+        self.rows: List[Any] = []
+        # One frame per open element: [attrib, text parts (None once the
+        # first child starts), result dict, row slot, convert flag]
+        self._stack: List[list] = []
+        # Values of the open outermost row and the rows nested in it
+        self._group: List[Any] = []
+        self._open_rows = 0
+    
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        stack = self._stack
+        depth = len(stack)
+        slot = None
+        convert = False
+        if depth:
+            parent = stack[-1]
+            parts = parent[1]
+            if parts is not None:
+                # First child: the parent's own text is complete
+                text = ''.join(parts).strip()
+                result = dict(parent[0])
+                if text:
+                    result['_text'] = text
+                parent[2] = result
+                parent[1] = None
+            
+            if self.row_tag is None:
+                # Rows are the root's children
+                convert = depth == 1 or parent[4]
+                if depth == 1:
+                    slot = 0
+            elif tag == self.row_tag:
+                convert = True
+                slot = len(self._group)
+                self._group.append(None)
+                self._open_rows += 1
+            else:
+                convert = parent[4]
         
-        # Add attributes
-        if element.attrib:
-            result.update(element.attrib)
+        stack.append([attrib, [] if convert else None, None, slot, convert])
+    
+    def data(self, text: str) -> None:
+        parts = self._stack[-1][1]
+        if parts is not None:
+            parts.append(text)
+    
+    def end(self, tag: str) -> None:
+        stack = self._stack
+        attrib, parts, result, slot, convert = stack.pop()
+        if not convert:
+            return
         
-        # Add text content
-        if element.text and element.text.strip():
-            # If element has no children and no attributes, return text directly
-            if not list(element) and not element.attrib:
-                return element.text.strip()
-            result['_text'] = element.text.strip()
+        if parts is None:
+            value = result
+        elif not attrib:
+            # Plain leaf (the common case): its stripped text or None
+            value = ''.join(parts).strip() or None
+        else:
+            # Leaf with attributes: a dict of attributes and text
+            text = ''.join(parts).strip()
+            value = dict(attrib)
+            if text:
+                value['_text'] = text
         
-        # Add child elements
-        for child in element:
-            child_data = self._element_to_dict(child)
-            
-            # Handle multiple children with same tag
-            if child.tag in result:
-                # Convert to list if not already
-                if not isinstance(result[child.tag], list):
-                    result[child.tag] = [result[child.tag]]
-                result[child.tag].append(child_data)
+        if stack and stack[-1][4]:
+            # The second occurrence of a tag promotes the value to a list
+            parent = stack[-1][2]
+            existing = parent.get(tag, _MISSING)
+            if existing is _MISSING:
+                parent[tag] = value
+            elif existing.__class__ is list:
+                existing.append(value)
             else:
-                result[child.tag] = child_data
+                parent[tag] = [existing, value]
+        
+        if slot is None:
+            return
+        if self.row_tag is None:
+            self.rows.append(value)
+            return
         
-        return result if result else None
+        group = self._group
+        group[slot] = value
+        self._open_rows -= 1
+        if not self._open_rows:
+            self.rows.append(group[0])
+            # Nested rows are also part of their parent's value; copy them
+            # so each row owns its dicts, as when converted separately
+            self.rows.extend(copy.deepcopy(value) for value in group[1:])
+            group.clear()
     
-    async def parse(self, file_path: str) -> AsyncIterator[Dict[str, Any]]:
+    def close(self) -> None:
+        return None
+
+
+class XMLParser(BaseParser):
+    """Parser for XML files"""
+    
+    def can_parse(self, file_path: str) -> bool:
+        """Check if file is XML"""
+        return file_path.lower().endswith('.xml')
+    
+    async def parse(self, file_path: str) -> AsyncIterator[ParsedRow]:
         """
         Parse XML file and yield rows.
         
@@ -53,31 +168,87 @@ class XMLParser(BaseParser):
         Common patterns:
         - <root><row>...</row><row>...</row></root>
         - <root><items><item>...</item><item>...</item></items></root>
-        """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
         
-        # Try to find repeating elements (items)
-        # Common tag names for items
-        item_tags = ['row', 'item', 'record', 'product', 'entry', 'data']
+        The file is fed to the parser incrementally and rows are built
+        straight from its events, so memory stays at O(one row).
+        """
+        # First pass picks the row tag (and surfaces parse errors before any
+        # row is yielded); the second converts rows as their elements close
+        row_tag = await asyncio.to_thread(self._find_row_tag, file_path)
+        rows = self._iter_rows(file_path, row_tag)
         
-        items = []
-        for tag in item_tags:
-            items = root.findall(f".//{tag}")
-            if items:
+        while True:
+            block = await asyncio.to_thread(self._read_block, rows)
+            if not block:
                 break
+            
+            for row_num, row_data in block:
+                if row_data:
+                    if not isinstance(row_data, dict):
+                        row_data = {"value": row_data}
+                    yield {
+                        "file_row_number": row_num,
+                        "data": row_data,
+                        "raw_input_snapshot": self._snapshot(row_data)
+                    }
+    
+    @staticmethod
+    def _find_row_tag(file_path: str) -> Optional[str]:
+        """
+        First tag in ITEM_TAGS used anywhere below the root, or None when
+        rows are the root's direct children.
+        """
+        collector = _TagCollector()
+        parser = ET.XMLParser(target=collector)
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+        found = parser.close()
         
-        # If no common tags found, use direct children
-        if not items:
-            items = list(root)
+        for tag in ITEM_TAGS:
+            if tag in found:
+                return tag
+        return None
+    
+    def _iter_rows(
+        self, file_path: str, row_tag: Optional[str]
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Yield (row_num, converted element) in document order, matching
+        root.findall(f".//{row_tag}") (or list(root) when row_tag is None).
         
-        # Yield each item as a row
-        for row_num, item in enumerate(items, start=1):
-            row_data = self._element_to_dict(item)
-            
-            if row_data:
-                yield {
-                    "file_row_number": row_num,
-                    "data": row_data if isinstance(row_data, dict) else {"value": row_data},
-                    "raw_input_snapshot": row_data if isinstance(row_data, dict) else {"value": row_data}
-                }
+        Values are built by _RowBuilder as the file is fed through the
+        parser, so no Element tree is materialized at all.
+        """
+        builder = _RowBuilder(row_tag)
+        parser = ET.XMLParser(target=builder)
+        rows = builder.rows
+        row_num = 0
+        with open(file_path, 'rb') as f:
+            while True:
+                chunk = f.read(READ_CHUNK_SIZE)
+                if not chunk:
+                    break
+                parser.feed(chunk)
+                for value in rows:
+                    row_num += 1
+                    yield row_num, value
+                rows.clear()
+        
+        parser.close()
+        for value in rows:
+            row_num += 1
+            yield row_num, value
+    
+    @staticmethod
+    def _read_block(rows: Iterator[Tuple[int, Any]]) -> List[Tuple[int, Any]]:
+        """Convert up to ROW_BLOCK_SIZE rows (runs off the event loop)."""
+        block = []
+        for item in rows:
+            block.append(item)
+            if len(block) >= ROW_BLOCK_SIZE:
+                break
+        return block
@@ -2,7 +2,7 @@
 Type definitions for the SaaStify Edge SDK
 """
 
-from typing import Any, Dict, List, Optional, Union, TypedDict
+from typing import Any, Dict, List, Mapping, Optional, Union, TypedDict
 from datetime import datetime
 from enum import Enum
 
@@ -105,6 +105,17 @@ class FileConfig(TypedDict, total=False):
     header_row: int
     fixed_rows: int
     sheet_name: Optional[str]
+    strip_whitespace: Union[bool, str]
+    engine: str
+    snapshot_mode: str
+    columns: List[str]
+
+
+class ParsedRow(TypedDict):
+    """Row yielded by the file parsers"""
+    file_row_number: int
+    data: Dict[str, Any]
+    raw_input_snapshot: Mapping[str, Any]
 
 
 class FeedSettings(TypedDict, total=False):
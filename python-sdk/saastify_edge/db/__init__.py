@@ -2,7 +2,7 @@
 Database layer for completeness cache and job management
 """
 
-from .completeness_cache import CompletenessWriter, CompletenessReader
+from .completeness_cache import CompletenessWriter, CompletenessReader, batch_timestamp
 from .job_manager import JobStatusUpdater
 from .config import DatabaseConfig, ConnectionMode, get_db_config
 from .mock_db_client import MockDBClient
@@ -10,20 +10,28 @@ from .mock_db_client import MockDBClient
 # Optional PostgreSQL client (requires asyncpg)
 try:
     from .postgres_client import PostgreSQLClient, create_db_client
+    from .pool import get_pool, warm_pool, close_pools
     HAS_POSTGRES = True
 except ImportError:
     HAS_POSTGRES = False
     PostgreSQLClient = None
     create_db_client = None
+    get_pool = None
+    warm_pool = None
+    close_pools = None
 
 __all__ = [
     "CompletenessWriter",
     "CompletenessReader",
+    "batch_timestamp",
     "JobStatusUpdater",
     "DatabaseConfig",
     "ConnectionMode",
     "get_db_config",
     "PostgreSQLClient",
     "create_db_client",
+    "get_pool",
+    "warm_pool",
+    "close_pools",
     "MockDBClient",
 ]
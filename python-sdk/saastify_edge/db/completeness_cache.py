@@ -6,23 +6,123 @@ This cache stores intermediate transformed data, validation errors, and metadata
 for reuse during export operations.
 """
 
+import os
 import uuid
-from datetime import datetime
-from typing import Dict, Any, List, Optional
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Any, Iterator, List, Optional
 from ..core.types import RunType, CompletenessRecord
 
+# Timestamp shared by every record written inside a batch_timestamp() block
+_batch_now: ContextVar[Optional[datetime]] = ContextVar("completeness_batch_now", default=None)
+
+
+@contextmanager
+def batch_timestamp(now: Optional[datetime] = None) -> Iterator[datetime]:
+    """
+    Stamp every record written inside the block with one timestamp.
+    
+    Pipeline drivers open this at a batch boundary so write_record and
+    enqueue read the batch's time instead of querying the clock per row.
+    Scoped with a ContextVar, so concurrent tasks keep their own batches.
+    
+    Args:
+        now: Timestamp to use (defaults to the current UTC time)
+    
+    Yields:
+        The timestamp in effect for the block
+    """
+    now = now or datetime.now(timezone.utc)
+    token = _batch_now.set(now)
+    try:
+        yield now
+    finally:
+        _batch_now.reset(token)
+
+
+def _utcnow() -> datetime:
+    """Current batch timestamp, or the current UTC time outside a batch."""
+    return _batch_now.get() or datetime.now(timezone.utc)
+
+
+def _uuid4_strings(count: int) -> List[str]:
+    """
+    Generate count random (version 4) UUID strings.
+    
+    Equivalent to [str(uuid.uuid4()) for _ in range(count)], but draws all
+    the randomness with a single os.urandom call and formats the hex
+    directly instead of building a UUID object per id.
+    """
+    buf = bytearray(os.urandom(16 * count))
+    # Version 4 in the high nibble of byte 6, RFC 4122 variant in byte 8
+    buf[6::16] = bytes(b & 0x0F | 0x40 for b in buf[6::16])
+    buf[8::16] = bytes(b & 0x3F | 0x80 for b in buf[8::16])
+    h = buf.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+# Column order of the value tuples written by CompletenessWriter
+_COMPLETENESS_COLS = (
+    "internal_id",
+    "job_id",
+    "run_type",
+    "saas_edge_id",
+    "product_id",
+    "template_id",
+    "transformed_response",
+    "validation_errors",
+    "is_valid",
+    "error_count",
+    "cache_freshness",
+    "processing_status",
+    "file_row_number",
+    "raw_input_snapshot",
+    "created_at",
+    "updated_at",
+)
+
+# Column order of the completeness_errors side table (one row per error)
+_ERROR_COLS = (
+    "internal_id",
+    "job_id",
+    "saas_edge_id",
+    "template_id",
+    "field",
+    "rule",
+    "message",
+    "value",
+)
+
+# Rows buffered by CompletenessWriter.enqueue before a flush
+ENQUEUE_BATCH_SIZE = 1000
+
 
 class CompletenessWriter:
     """Writes completeness records to the cache"""
     
-    def __init__(self, db_client):
+    def __init__(
+        self,
+        db_client,
+        batch_size: int = ENQUEUE_BATCH_SIZE,
+        split_errors: bool = False
+    ):
         """
         Initialize the completeness writer.
         
         Args:
             db_client: Database client (GraphQL or PostgreSQL)
+            batch_size: Rows buffered by enqueue() before they are written
+            split_errors: Also write each validation error as a row of the
+                completeness_errors table, bulk-loaded once per write
         """
         self.db = db_client
+        self.batch_size = batch_size
+        self.split_errors = split_errors
+        self._pending: List[tuple] = []
     
     async def write_record(
         self,
@@ -57,32 +157,118 @@ class CompletenessWriter:
         Returns:
             internal_id of the created record
         """
-        record_id = str(uuid.uuid4())
-        now = datetime.utcnow()
-        
-        record = {
-            "internal_id": record_id,
-            "job_id": job_id,
-            "run_type": run_type.value if isinstance(run_type, RunType) else run_type,
-            "saas_edge_id": saas_edge_id,
-            "product_id": product_id,
-            "template_id": template_id,
-            "transformed_response": transformed_response,
-            "validation_errors": validation_errors,
-            "is_valid": is_valid,
-            "error_count": error_count,
-            "cache_freshness": True,
-            "processing_status": "VALIDATED",
-            "file_row_number": file_row_number,
-            "raw_input_snapshot": raw_input_snapshot,
-            "created_at": now,
-            "updated_at": now
-        }
+        values = self._row_values(
+            job_id, run_type, saas_edge_id, template_id, transformed_response,
+            validation_errors, is_valid, error_count, product_id,
+            file_row_number, raw_input_snapshot
+        )
         
         # Insert into database
-        await self.db.insert("product_template_completeness", record)
+        await self.db.insert_row("product_template_completeness", _COMPLETENESS_COLS, values)
+        
+        if self.split_errors:
+            await self._flush_errors(
+                self._error_rows(values[0], job_id, saas_edge_id, template_id, validation_errors)
+            )
+        
+        return values[0]
+    
+    async def enqueue(
+        self,
+        job_id: str,
+        run_type: RunType,
+        saas_edge_id: str,
+        template_id: str,
+        transformed_response: Dict[str, Any],
+        validation_errors: Dict[str, List[Dict[str, Any]]],
+        is_valid: bool,
+        error_count: int,
+        product_id: Optional[str] = None,
+        file_row_number: Optional[int] = None,
+        raw_input_snapshot: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Buffer a completeness record and write it with the next flush.
+        
+        Takes the same arguments as write_record(). Buffered rows are
+        written in one insert_rows call once batch_size of them are
+        pending; call flush() at the end of a job to write the remainder.
+        
+        Returns:
+            internal_id the record will be stored under
+        """
+        values = self._row_values(
+            job_id, run_type, saas_edge_id, template_id, transformed_response,
+            validation_errors, is_valid, error_count, product_id,
+            file_row_number, raw_input_snapshot
+        )
+        self._pending.append(values)
         
-        return record_id
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        
+        return values[0]
+    
+    async def flush(self) -> int:
+        """
+        Write all rows buffered by enqueue().
+        
+        Returns:
+            Number of rows written
+        """
+        if not self._pending:
+            return 0
+        
+        # Swap the buffer out first so rows enqueued while the write is in
+        # flight land in the next batch
+        rows, self._pending = self._pending, []
+        await self.db.insert_rows("product_template_completeness", _COMPLETENESS_COLS, rows)
+        
+        if self.split_errors:
+            error_rows = []
+            for values in rows:
+                # internal_id, job_id, saas_edge_id, template_id, validation_errors
+                error_rows.extend(
+                    self._error_rows(values[0], values[1], values[3], values[5], values[7])
+                )
+            await self._flush_errors(error_rows)
+        
+        return len(rows)
+    
+    @staticmethod
+    def _row_values(
+        job_id: str,
+        run_type: RunType,
+        saas_edge_id: str,
+        template_id: str,
+        transformed_response: Dict[str, Any],
+        validation_errors: Dict[str, List[Dict[str, Any]]],
+        is_valid: bool,
+        error_count: int,
+        product_id: Optional[str],
+        file_row_number: Optional[int],
+        raw_input_snapshot: Optional[Dict[str, Any]]
+    ) -> tuple:
+        """Build a record's values in _COMPLETENESS_COLS order."""
+        now = _utcnow()
+        return (
+            str(uuid.uuid4()),
+            job_id,
+            run_type.value if isinstance(run_type, RunType) else run_type,
+            saas_edge_id,
+            product_id,
+            template_id,
+            transformed_response,
+            validation_errors,
+            is_valid,
+            error_count,
+            True,
+            "VALIDATED",
+            file_row_number,
+            raw_input_snapshot,
+            now,
+            now,
+        )
     
     async def write_batch(
         self,
@@ -97,22 +283,70 @@ class CompletenessWriter:
         Returns:
             List of internal_ids for created records
         """
-        record_ids = []
-        now = datetime.utcnow()
+        record_ids = _uuid4_strings(len(records))
+        now = _utcnow()
+        stamp = {
+            "created_at": now,
+            "updated_at": now,
+            "cache_freshness": True,
+        }
         
-        for record in records:
-            record_id = str(uuid.uuid4())
+        for record, record_id in zip(records, record_ids):
             record["internal_id"] = record_id
-            record["created_at"] = now
-            record["updated_at"] = now
-            record["cache_freshness"] = True
-            record_ids.append(record_id)
+            record.update(stamp)
         
         # Batch insert
-        await self.db.insert_batch("product_template_completeness", records)
+        await self.db.insert_batch(
+            "product_template_completeness", records, id_column="internal_id"
+        )
+        
+        if self.split_errors:
+            error_rows = []
+            for record in records:
+                error_rows.extend(self._error_rows(
+                    record["internal_id"],
+                    record.get("job_id"),
+                    record.get("saas_edge_id"),
+                    record.get("template_id"),
+                    record.get("validation_errors"),
+                ))
+            await self._flush_errors(error_rows)
         
         return record_ids
     
+    @staticmethod
+    def _error_rows(
+        internal_id: str,
+        job_id: str,
+        saas_edge_id: str,
+        template_id: str,
+        validation_errors: Optional[Dict[str, List[Dict[str, Any]]]]
+    ) -> List[tuple]:
+        """Flatten a record's validation errors into _ERROR_COLS tuples."""
+        if not validation_errors:
+            return []
+        
+        rows = []
+        for field, errors in validation_errors.items():
+            for error in errors:
+                value = error.get("value")
+                rows.append((
+                    internal_id,
+                    job_id,
+                    saas_edge_id,
+                    template_id,
+                    field,
+                    error.get("rule"),
+                    error.get("message"),
+                    None if value is None else str(value),
+                ))
+        return rows
+    
+    async def _flush_errors(self, rows: List[tuple]) -> None:
+        """Bulk-load flattened error rows into completeness_errors."""
+        if rows:
+            await self.db.copy_records("completeness_errors", _ERROR_COLS, rows)
+    
     async def invalidate_cache(
         self,
         saas_edge_id: str,
@@ -138,7 +372,7 @@ class CompletenessWriter:
         
         update_data = {
             "cache_freshness": False,
-            "updated_at": datetime.utcnow()
+            "updated_at": _utcnow()
         }
         
         count = await self.db.update(
@@ -227,17 +461,14 @@ class CompletenessReader:
         if check_freshness:
             filters["cache_freshness"] = True
         
+        # Only the most recent record per product comes back
         records = await self.db.query_many(
             "product_template_completeness",
-            filters
+            filters,
+            latest_per="product_id"
         )
         
-        # Map by product_id
-        result = {}
-        for record in records:
-            result[record["product_id"]] = record
-        
-        return result
+        return {record["product_id"]: record for record in records}
     
     async def check_freshness(
         self,
@@ -317,6 +548,37 @@ class CompletenessReader:
         
         return records
     
+    async def get_error_field_counts(
+        self,
+        saas_edge_id: str,
+        template_id: str,
+        job_id: Optional[str] = None
+    ) -> Dict[str, int]:
+        """
+        Count validation errors per field from the completeness_errors table.
+        
+        Only covers records written with CompletenessWriter(split_errors=True).
+        
+        Args:
+            saas_edge_id: Tenant identifier
+            template_id: Template identifier
+            job_id: Optional job identifier filter
+        
+        Returns:
+            Dictionary mapping field name to its number of errors
+        """
+        filters = {
+            "saas_edge_id": saas_edge_id,
+            "template_id": template_id
+        }
+        
+        if job_id:
+            filters["job_id"] = job_id
+        
+        groups = await self.db.aggregate("completeness_errors", filters, group_by=["field"])
+        
+        return {field: count for field, count in groups}
+    
     async def get_completeness_stats(
         self,
         saas_edge_id: str,
@@ -338,14 +600,16 @@ class CompletenessReader:
             "cache_freshness": True
         }
         
-        # Get counts
-        total = await self.db.count("product_template_completeness", filters)
-        
-        filters["is_valid"] = True
-        valid = await self.db.count("product_template_completeness", filters)
-        
-        filters["is_valid"] = False
-        invalid = await self.db.count("product_template_completeness", filters)
+        # Count valid and invalid records in a single grouped query
+        groups = {
+            is_valid: count
+            for is_valid, count in await self.db.aggregate(
+                "product_template_completeness", filters, group_by=["is_valid"]
+            )
+        }
+        total = sum(groups.values())
+        valid = groups.get(True, 0)
+        invalid = groups.get(False, 0)
         
         return {
             "total_records": total,
@@ -8,8 +8,9 @@ Supports:
 """
 
 import os
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -20,9 +21,14 @@ class ConnectionMode(str, Enum):
     LOCAL = "local"    # Local PostgreSQL
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
-    """Database connection configuration"""
+    """
+    Database connection configuration.
+    
+    Frozen: get_db_config() hands the same instance to every caller, and
+    derived connection strings are computed once per instance.
+    """
     
     # Connection mode
     mode: ConnectionMode = ConnectionMode.PROXY
@@ -47,12 +53,48 @@ class DatabaseConfig:
     pool_timeout: int = 30
     pool_recycle: int = 3600
     
+    # Prepared statements each connection keeps (0 disables the cache, so
+    # every call is planned afresh for its own parameters)
+    statement_cache_size: int = 1024
+    
     # SSL settings
     use_ssl: bool = True
     ssl_cert_path: Optional[str] = None
     ssl_key_path: Optional[str] = None
     ssl_root_cert_path: Optional[str] = None
     
+    # (project, region, instance), split from instance_connection_name once
+    _icn_parts: Optional[Tuple[str, str, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        """Split and validate instance_connection_name once."""
+        if not self.instance_connection_name:
+            return
+        
+        parts = tuple(self.instance_connection_name.split(":", 2))
+        if len(parts) != 3 or not all(parts):
+            if self.mode == ConnectionMode.DIRECT:
+                raise ValueError(
+                    f"instance_connection_name must be project:region:instance, "
+                    f"got {self.instance_connection_name!r}"
+                )
+            return
+        object.__setattr__(self, "_icn_parts", parts)
+    
+    @property
+    def instance_parts(self) -> Tuple[str, str, str]:
+        """
+        (project, region, instance) of the Cloud SQL instance.
+        
+        Raises:
+            ValueError: If no valid instance_connection_name is configured
+        """
+        if self._icn_parts is None:
+            raise ValueError("instance_connection_name required for direct mode")
+        return self._icn_parts
+    
     @classmethod
     def from_env(cls) -> "DatabaseConfig":
         """
@@ -69,6 +111,7 @@ class DatabaseConfig:
         - DB_LOCAL_HOST: Local PostgreSQL host
         - DB_LOCAL_PORT: Local PostgreSQL port
         - DB_POOL_SIZE: Connection pool size
+        - DB_STATEMENT_CACHE_SIZE: Prepared statements cached per connection
         - DB_USE_SSL: Enable SSL (true/false)
         """
         mode_str = os.getenv("DB_MODE", "proxy").lower()
@@ -86,6 +129,7 @@ class DatabaseConfig:
             local_port=int(os.getenv("DB_LOCAL_PORT", "5432")),
             pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
             max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+            statement_cache_size=int(os.getenv("DB_STATEMENT_CACHE_SIZE", "1024")),
             use_ssl=os.getenv("DB_USE_SSL", "true").lower() == "true",
             ssl_cert_path=os.getenv("DB_SSL_CERT"),
             ssl_key_path=os.getenv("DB_SSL_KEY"),
@@ -99,6 +143,11 @@ class DatabaseConfig:
         Returns:
             Database connection URL
         """
+        return self._connection_string
+    
+    @cached_property
+    def _connection_string(self) -> str:
+        """Connection string for the configured mode (built once)."""
         if self.mode == ConnectionMode.DIRECT:
             return self._get_direct_connection_string()
         elif self.mode == ConnectionMode.PROXY:
@@ -108,14 +157,13 @@ class DatabaseConfig:
     
     def _get_direct_connection_string(self) -> str:
         """Get connection string for direct Cloud SQL connection."""
-        if not self.instance_connection_name:
-            raise ValueError("instance_connection_name required for direct mode")
+        project, region, instance = self.instance_parts
         
         # Format: postgresql+pg8000://user:pass@/dbname?unix_sock=/cloudsql/instance
         # Or use Cloud SQL Python Connector
         return (
             f"postgresql+pg8000://{self.user}:{self.password}@"
-            f"/{self.database}?unix_sock=/cloudsql/{self.instance_connection_name}"
+            f"/{self.database}?unix_sock=/cloudsql/{project}:{region}:{instance}"
         )
     
     def _get_proxy_connection_string(self) -> str:
@@ -141,6 +189,11 @@ class DatabaseConfig:
         Returns:
             DSN string for asyncpg
         """
+        return self._asyncpg_dsn
+    
+    @cached_property
+    def _asyncpg_dsn(self) -> str:
+        """asyncpg DSN for the configured mode (built once)."""
         if self.mode == ConnectionMode.PROXY:
             host = self.proxy_host
             port = self.proxy_port
@@ -166,14 +219,20 @@ class DatabaseConfig:
             "local_port": self.local_port if self.mode == ConnectionMode.LOCAL else None,
             "instance": self.instance_connection_name if self.mode == ConnectionMode.DIRECT else None,
             "pool_size": self.pool_size,
+            "statement_cache_size": self.statement_cache_size,
             "use_ssl": self.use_ssl,
         }
 
 
+@lru_cache(maxsize=1)
 def get_db_config() -> DatabaseConfig:
     """
     Get database configuration from environment.
     
+    The environment is read once per process; call
+    get_db_config.cache_clear() after changing DB_* variables (e.g. in
+    tests). DatabaseConfig.from_env() always reads it afresh.
+    
     Returns:
         DatabaseConfig instance
     """
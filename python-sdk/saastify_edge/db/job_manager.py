@@ -5,23 +5,155 @@ Manages job status updates and metrics in the saas_edge_jobs table.
 Tracks job progress through various stages and collects performance metrics.
 """
 
+import asyncio
+import logging
+import os
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional, List
-from ..core.types import JobType, JobStatus
+from datetime import datetime, timezone
+from functools import partial
+from typing import Dict, Any, Optional, List, Sequence, Tuple
+from ..core.types import JobType, JobStatus, RunType
+
+logger = logging.getLogger(__name__)
+
+# Seconds add_metrics waits to coalesce further metrics into one write
+METRICS_FLUSH_DELAY = 0.1
+
+# Seconds get_job_status serves a job from memory (0, the default, disables
+# the cache), and how many jobs it keeps
+JOB_CACHE_TTL = float(os.getenv("DB_JOB_CACHE_TTL", "0"))
+JOB_CACHE_SIZE = 10_000
+
+# Initial status strings, resolved once instead of per create_job
+IMPORT_INIT_STR = JobStatus.IMPORT_INIT.value
+EXPORT_INIT_STR = JobStatus.EXPORT_INIT.value
+
+# Columns job listings return by default; the saas_edge_jobs listing
+# indexes cover them, so listings are index-only scans
+JOB_SUMMARY_FIELDS = ("job_id", "job_name", "job_type", "job_status", "created_at", "updated_at")
+
+# Initial status of each job type, derived from the enums so new *_IMPORT
+# types start in IMPORT_INIT (str enums, so plain strings such as the
+# pipelines' "IMPORT"/"EXPORT" match too)
+_INIT_STATUS = {
+    job_type: IMPORT_INIT_STR if job_type.name.endswith("IMPORT") else EXPORT_INIT_STR
+    for job_type in (*JobType, *RunType)
+}
+
+
+def _init_status(job_type: Any) -> str:
+    """Initial status for job_type; other values go by whether they name an import."""
+    status = _INIT_STATUS.get(job_type)
+    if status is None:
+        status = IMPORT_INIT_STR if "IMPORT" in str(job_type) else EXPORT_INIT_STR
+    return status
+
+
+def _enum_value(value: Any) -> Any:
+    """Return an enum member's value, or value itself if it is already a str."""
+    cls = type(value)
+    if cls is JobStatus or cls is JobType:
+        return value.value
+    return value
 
 
 class JobStatusUpdater:
     """Updates job status and metrics"""
     
-    def __init__(self, db_client):
+    def __init__(self, db_client, cache_ttl: Optional[float] = None):
         """
         Initialize the job status updater.
         
         Args:
             db_client: Database client (GraphQL or PostgreSQL)
+            cache_ttl: Seconds get_job_status may serve a cached job
+                (defaults to JOB_CACHE_TTL; 0 disables caching). Cached
+                records are shared between callers, so only enable it
+                when callers do not modify what get_job_status returns.
         """
         self.db = db_client
+        self.cache_ttl = JOB_CACHE_TTL if cache_ttl is None else cache_ttl
+        # job_id -> (expiry on the monotonic clock, job record), oldest first
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Metrics not yet written to each job's current step, with the
+        # timer or in-flight task that will write them
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_timers: Dict[str, asyncio.TimerHandle] = {}
+        self._flush_tasks: Dict[str, asyncio.Task] = {}
+    
+    def _cache_job(self, job_id: str, job: Optional[Dict[str, Any]]) -> None:
+        """Cache a job's latest known state (or drop it when None)."""
+        # Re-inserting keeps the dict ordered by expiry, so the first
+        # entry is always the one to evict
+        self._cache.pop(job_id, None)
+        if job is None or not self.cache_ttl:
+            return
+        if len(self._cache) >= JOB_CACHE_SIZE:
+            del self._cache[next(iter(self._cache))]
+        self._cache[job_id] = (time.monotonic() + self.cache_ttl, job)
+    
+    async def _write_metrics(self, job_id: str, metrics: Dict[str, Any]) -> bool:
+        """Merge metrics into a job's current step."""
+        # Merged into the latest step (or the root metrics when no step
+        # exists yet) by a single UPDATE
+        updated = await self.db.merge_job_step(job_id, metrics, datetime.now(timezone.utc))
+        self._cache.pop(job_id, None)
+        return updated
+    
+    def _start_write(self, job_id: str) -> Optional[asyncio.Task]:
+        """Hand a job's pending metrics to a tracked write task."""
+        metrics = self._pending.pop(job_id, None)
+        if not metrics:
+            return None
+        
+        task = asyncio.ensure_future(self._write_metrics(job_id, metrics))
+        self._flush_tasks[job_id] = task
+        task.add_done_callback(partial(self._forget_write, job_id))
+        return task
+    
+    def _forget_write(self, job_id: str, task: asyncio.Task) -> None:
+        if self._flush_tasks.get(job_id) is task:
+            del self._flush_tasks[job_id]
+    
+    def _flush_later(self, job_id: str) -> None:
+        """Debounce timer callback: write pending metrics in the background."""
+        self._flush_timers.pop(job_id, None)
+        task = self._start_write(job_id)
+        if task is not None:
+            task.add_done_callback(partial(self._log_write, job_id))
+    
+    @staticmethod
+    def _log_write(job_id: str, task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error(f"Failed to write metrics for job {job_id}: {task.exception()}")
+        elif not task.result():
+            logger.warning(f"Dropped metrics for unknown job {job_id}")
+    
+    async def _flush(self, job_id: str) -> None:
+        """
+        Write a job's pending metrics now.
+        
+        Waits for writes already in flight first, so metrics always land
+        in the step they were recorded for.
+        
+        Raises:
+            ValueError: If metrics were pending for a job that does not exist
+        """
+        timer = self._flush_timers.pop(job_id, None)
+        if timer is not None:
+            timer.cancel()
+        
+        task = self._flush_tasks.get(job_id)
+        while task is not None and not task.done():
+            await asyncio.wait([task])
+            task = self._flush_tasks.get(job_id)
+        
+        task = self._start_write(job_id)
+        if task is not None and not await task:
+            raise ValueError(f"Job {job_id} not found")
     
     async def create_job(
         self,
@@ -47,26 +179,25 @@ class JobStatusUpdater:
         if not job_id:
             job_id = str(uuid.uuid4())
         
-        now = datetime.utcnow()
-        
-        job_record = {
-            "job_id": job_id,
-            "job_name": job_name,
-            "job_type": job_type.value if isinstance(job_type, JobType) else job_type,
-            "job_status": JobStatus.IMPORT_INIT.value if "IMPORT" in str(job_type) else JobStatus.EXPORT_INIT.value,
-            "saas_edge_id": saas_edge_id,
-            "request_args": request_args,
-            "job_response": {},
-            "metrics": {
-                "created_at": now.isoformat(),
+        now = datetime.now(timezone.utc)
+        
+        # Values in JOB_COLUMNS order
+        await self.db.insert_job((
+            job_id,
+            job_name,
+            _enum_value(job_type),
+            _init_status(job_type),
+            saas_edge_id,
+            request_args,
+            {},
+            {
+                "created_at": now,
                 "current_step": "INIT",
                 "steps": []
             },
-            "created_at": now,
-            "updated_at": now
-        }
-        
-        await self.db.insert("saas_edge_jobs", job_record)
+            now,
+            now
+        ))
         
         return job_id
     
@@ -75,7 +206,7 @@ class JobStatusUpdater:
         job_id: str,
         new_status: JobStatus,
         metrics_update: Optional[Dict[str, Any]] = None
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Update job status and optionally add metrics.
         
@@ -83,79 +214,65 @@ class JobStatusUpdater:
             job_id: Job identifier
             new_status: New status to set
             metrics_update: Optional metrics to add to the job
+        
+        Returns:
+            Updated job record, or None if the job does not exist
         """
-        update_data = {
-            "job_status": new_status.value if isinstance(new_status, JobStatus) else new_status,
-            "updated_at": datetime.utcnow()
-        }
+        status = _enum_value(new_status)
+        step_entry = None
+        
+        # Metrics recorded so far belong to the step that is ending
+        await self._flush(job_id)
         
         if metrics_update:
-            # Get current metrics
-            current_job = await self.db.query_one(
-                "saas_edge_jobs",
-                {"job_id": job_id},
-                fields=["metrics"]
-            )
-            
-            current_metrics = current_job.get("metrics", {}) if current_job else {}
-            
-            # Add new step to metrics
             step_entry = {
-                "step": new_status.value if isinstance(new_status, JobStatus) else new_status,
-                "started_at": datetime.utcnow().isoformat(),
+                "step": status,
+                "started_at": datetime.now(timezone.utc),
                 **metrics_update
             }
-            
-            if "steps" not in current_metrics:
-                current_metrics["steps"] = []
-            
-            current_metrics["steps"].append(step_entry)
-            current_metrics["current_step"] = new_status.value if isinstance(new_status, JobStatus) else new_status
-            
-            update_data["metrics"] = current_metrics
         
-        await self.db.update(
-            "saas_edge_jobs",
-            {"job_id": job_id},
-            update_data
-        )
+        # Status and step append in one server-side call, without reading
+        # the metrics document back first
+        # The updated row comes back with the write, so the next
+        # get_job_status is served without another round trip
+        job = await self.db.advance_job(job_id, status, step=step_entry)
+        self._cache_job(job_id, job)
+        return job
     
     async def add_metrics(
         self,
         job_id: str,
-        metrics: Dict[str, Any]
+        metrics: Dict[str, Any],
+        flush: bool = False
     ) -> None:
         """
         Add metrics to the current job step.
         
+        Metrics are held in memory and written together METRICS_FLUSH_DELAY
+        seconds after the first call, so frequent progress updates cost one
+        UPDATE per interval. Pending metrics are also written before the
+        step or job status changes.
+        
         Args:
             job_id: Job identifier
             metrics: Metrics to add
-        """
-        # Get current job
-        current_job = await self.db.query_one(
-            "saas_edge_jobs",
-            {"job_id": job_id},
-            fields=["metrics"]
-        )
+            flush: Write pending metrics before returning
         
-        if not current_job:
-            raise ValueError(f"Job {job_id} not found")
-        
-        current_metrics = current_job.get("metrics", {})
-        
-        # Update the latest step with new metrics
-        if "steps" in current_metrics and current_metrics["steps"]:
-            current_metrics["steps"][-1].update(metrics)
+        Raises:
+            ValueError: If flushing and the job does not exist
+        """
+        pending = self._pending.get(job_id)
+        if pending is None:
+            self._pending[job_id] = dict(metrics)
         else:
-            # No steps yet, add to root metrics
-            current_metrics.update(metrics)
+            pending.update(metrics)
         
-        await self.db.update(
-            "saas_edge_jobs",
-            {"job_id": job_id},
-            {"metrics": current_metrics, "updated_at": datetime.utcnow()}
-        )
+        if flush:
+            await self._flush(job_id)
+        elif job_id not in self._flush_timers:
+            self._flush_timers[job_id] = asyncio.get_running_loop().call_later(
+                METRICS_FLUSH_DELAY, self._flush_later, job_id
+            )
     
     async def complete_step(
         self,
@@ -176,7 +293,7 @@ class JobStatusUpdater:
             errors: Optional list of error messages
         """
         metrics = {
-            "completed_at": datetime.utcnow().isoformat(),
+            "completed_at": datetime.now(timezone.utc),
             "rows_processed": rows_processed,
             "rows_success": rows_success,
             "rows_failed": rows_failed
@@ -185,7 +302,7 @@ class JobStatusUpdater:
         if errors:
             metrics["errors"] = errors
         
-        await self.add_metrics(job_id, metrics)
+        await self.add_metrics(job_id, metrics, flush=True)
     
     async def complete_job(
         self,
@@ -195,7 +312,7 @@ class JobStatusUpdater:
         success_count: int = 0,
         failed_count: int = 0,
         response_data: Optional[Dict[str, Any]] = None
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Mark job as completed (success or failure).
         
@@ -206,35 +323,35 @@ class JobStatusUpdater:
             success_count: Number of successful rows
             failed_count: Number of failed rows
             response_data: Optional additional response data
+        
+        Returns:
+            Updated job record, or None if the job does not exist
         """
         job_response = {
             "total": total_rows,
             "success": success_count,
             "failed": failed_count,
-            "completed_at": datetime.utcnow().isoformat()
+            "completed_at": datetime.now(timezone.utc)
         }
         
         if response_data:
             job_response.update(response_data)
         
-        update_data = {
-            "job_status": JobStatus.COMPLETED.value if success else JobStatus.FAILED.value,
-            "job_response": job_response,
-            "updated_at": datetime.utcnow()
-        }
-        
-        await self.db.update(
-            "saas_edge_jobs",
-            {"job_id": job_id},
-            update_data
+        await self._flush(job_id)
+        job = await self.db.advance_job(
+            job_id,
+            JobStatus.COMPLETED.value if success else JobStatus.FAILED.value,
+            response=job_response
         )
+        self._cache_job(job_id, job)
+        return job
     
     async def fail_job(
         self,
         job_id: str,
         error_message: str,
         error_detail: Optional[str] = None
-    ) -> None:
+    ) -> Optional[Dict[str, Any]]:
         """
         Mark job as failed with error details.
         
@@ -242,26 +359,36 @@ class JobStatusUpdater:
             job_id: Job identifier
             error_message: Short error message
             error_detail: Optional full error details/stack trace
+        
+        Returns:
+            Updated job record, or None if the job does not exist
         """
+        now = datetime.now(timezone.utc)
         job_response = {
             "error": error_message,
-            "failed_at": datetime.utcnow().isoformat()
+            "failed_at": now
         }
         
-        update_data = {
-            "job_status": JobStatus.FAILED.value,
-            "job_response": job_response,
-            "updated_at": datetime.utcnow()
-        }
+        await self._flush(job_id)
         
-        if error_detail:
-            update_data["error_detail"] = error_detail
+        if not error_detail:
+            job = await self.db.advance_job(job_id, JobStatus.FAILED.value, response=job_response)
+        else:
+            update_data = {
+                "job_status": JobStatus.FAILED.value,
+                "job_response": job_response,
+                "updated_at": now,
+                "error_detail": error_detail
+            }
+            
+            job = await self.db.update_returning(
+                "saas_edge_jobs",
+                {"job_id": job_id},
+                update_data
+            )
         
-        await self.db.update(
-            "saas_edge_jobs",
-            {"job_id": job_id},
-            update_data
-        )
+        self._cache_job(job_id, job)
+        return job
     
     async def get_job_status(
         self,
@@ -270,32 +397,45 @@ class JobStatusUpdater:
         """
         Get current job status and metrics.
         
+        With cache_ttl set, repeated calls (e.g. status polling) are served
+        from memory for up to cache_ttl seconds, all returning the same
+        dict, so treat it as read-only. Status changes through this
+        updater cache the row they return and metrics writes drop it, so
+        reads after a write see it.
+        
         Args:
             job_id: Job identifier
         
         Returns:
             Job record with status and metrics
         """
-        job = await self.db.query_one(
-            "saas_edge_jobs",
-            {"job_id": job_id}
-        )
+        if not self.cache_ttl:
+            return await self.db.get_job(job_id)
+        
+        now = time.monotonic()
+        cached = self._cache.get(job_id)
+        if cached is not None and cached[0] > now:
+            return cached[1]
         
+        job = await self.db.get_job(job_id)
+        self._cache_job(job_id, job)
         return job
     
     async def get_jobs_by_status(
         self,
         saas_edge_id: str,
         status: JobStatus,
-        limit: int = 100
+        limit: int = 100,
+        fields: Optional[Sequence[str]] = JOB_SUMMARY_FIELDS
     ) -> List[Dict[str, Any]]:
         """
-        Get jobs by status for a tenant.
+        Get jobs by status for a tenant, newest first.
         
         Args:
             saas_edge_id: Tenant identifier
             status: Job status to filter by
             limit: Maximum number of jobs to return
+            fields: Columns to return (None for full records)
         
         Returns:
             List of job records
@@ -304,8 +444,9 @@ class JobStatusUpdater:
             "saas_edge_jobs",
             {
                 "saas_edge_id": saas_edge_id,
-                "job_status": status.value if isinstance(status, JobStatus) else status
+                "job_status": _enum_value(status)
             },
+            fields=fields,
             order_by="created_at DESC",
             limit=limit
         )
@@ -316,15 +457,17 @@ class JobStatusUpdater:
         self,
         saas_edge_id: str,
         job_type: Optional[JobType] = None,
-        limit: int = 50
+        limit: int = 50,
+        fields: Optional[Sequence[str]] = JOB_SUMMARY_FIELDS
     ) -> List[Dict[str, Any]]:
         """
-        Get recent jobs for a tenant.
+        Get recent jobs for a tenant, newest first.
         
         Args:
             saas_edge_id: Tenant identifier
             job_type: Optional job type filter
             limit: Maximum number of jobs to return
+            fields: Columns to return (None for full records)
         
         Returns:
             List of job records
@@ -332,11 +475,12 @@ class JobStatusUpdater:
         filters = {"saas_edge_id": saas_edge_id}
         
         if job_type:
-            filters["job_type"] = job_type.value if isinstance(job_type, JobType) else job_type
+            filters["job_type"] = _enum_value(job_type)
         
         jobs = await self.db.query_many(
             "saas_edge_jobs",
             filters,
+            fields=fields,
             order_by="created_at DESC",
             limit=limit
         )
@@ -358,22 +502,11 @@ class JobStatusUpdater:
         """
         job = await self.get_job_status(job_id)
         
-        if not job:
+        # Clients return created_at/updated_at as datetimes
+        if not job or not job.get("created_at") or not job.get("updated_at"):
             return None
         
-        created_at = job.get("created_at")
-        updated_at = job.get("updated_at")
-        
-        if not created_at or not updated_at:
-            return None
-        
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at)
-        if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at)
-        
-        duration = (updated_at - created_at).total_seconds()
-        return duration
+        return (job["updated_at"] - job["created_at"]).total_seconds()
     
     async def get_job_by_request_id(
         self,
@@ -5,18 +5,152 @@ Provides in-memory storage for job tracking and completeness cache without
 requiring a real database connection.
 """
 
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import AsyncIterator, Dict, List, Any, Optional, Sequence, Union
+from datetime import datetime, timezone
+import os
 import uuid
+from collections import Counter, defaultdict
+from contextlib import asynccontextmanager
+from itertools import count
+
+from .statements import JOB_COLUMNS
+
+# Columns with an inverted index (value -> ids of the records holding it);
+# filters on them are answered by set intersection instead of a scan
+INDEXED_COLUMNS = {
+    "saas_edge_jobs": ("job_id", "job_status", "job_type", "saas_edge_id"),
+    "product_template_completeness": ("job_id", "saas_edge_id", "template_id", "product_id"),
+}
+
+_NO_IDS: frozenset = frozenset()
+
+# Inserted dicts are stored as passed: callers build a fresh record per
+# insert and do not touch it afterwards. MOCK_DB_COPY_ON_WRITE=1 stores a
+# copy instead, for callers that reuse their dicts.
+COPY_ON_WRITE = os.getenv("MOCK_DB_COPY_ON_WRITE", "0") == "1"
+
+
+def _copy_path(doc: Dict[str, Any], parts: Sequence[str]) -> Dict[str, Any]:
+    """
+    Replace each dict along parts within doc by a shallow copy (creating
+    missing ones) and return the innermost, for copy-on-write JSON edits.
+    """
+    for part in parts:
+        child = doc.get(part)
+        child = doc[part] = dict(child) if isinstance(child, dict) else {}
+        doc = child
+    return doc
 
 
 class MockDBClient:
-    """Mock database client for testing."""
+    """
+    Mock database client for testing.
+    
+    Records are indexed on INDEXED_COLUMNS; change them through the client
+    methods (not by editing stored dicts) so the indexes stay current.
+    Writes are copy-on-write (the record and the JSON documents along the
+    written path are replaced, not mutated), so a record returned by a
+    query is a stable snapshot, as a row fetched from PostgreSQL is.
+    Inserted dicts are stored without copying (see COPY_ON_WRITE), so a
+    caller must not mutate a record after inserting it.
+    """
 
-    def __init__(self):
-        """Initialize mock database with in-memory storage."""
+    def __init__(self, copy_on_write: Optional[bool] = None):
+        """
+        Initialize mock database with in-memory storage.
+        
+        Args:
+            copy_on_write: Store copies of inserted records (defaults to
+                COPY_ON_WRITE)
+        """
+        self.copy_on_write = COPY_ON_WRITE if copy_on_write is None else copy_on_write
         self.jobs: Dict[str, Dict[str, Any]] = {}
         self.completeness_records: Dict[str, Dict[str, Any]] = {}
+        self.completeness_errors: List[Dict[str, Any]] = []
+        self._reset_indexes()
+
+    def _reset_indexes(self):
+        """Empty the per-table column indexes and insertion positions."""
+        self._indexes: Dict[str, Dict[str, Dict[Any, set]]] = {
+            table: {col: defaultdict(set) for col in columns}
+            for table, columns in INDEXED_COLUMNS.items()
+        }
+        self._positions: Dict[str, Dict[str, int]] = {table: {} for table in INDEXED_COLUMNS}
+        self._sequence = count()
+
+    def _records(self, table: str) -> Dict[str, Dict[str, Any]]:
+        """Id-keyed storage of an indexed table."""
+        if table == "saas_edge_jobs":
+            return self.jobs
+        elif table == "product_template_completeness":
+            return self.completeness_records
+        else:
+            raise ValueError(f"Unknown table: {table}")
+
+    def _index(self, table: str, record_id: str, record: Dict[str, Any]):
+        for col, index in self._indexes[table].items():
+            index[record.get(col)].add(record_id)
+
+    def _unindex(self, table: str, record_id: str, record: Dict[str, Any]):
+        for col, index in self._indexes[table].items():
+            value = record.get(col)
+            ids = index.get(value)
+            if ids is not None:
+                ids.discard(record_id)
+                if not ids:
+                    del index[value]
+
+    def _store(self, table: str, record_id: str, record: Dict[str, Any]):
+        """Insert or replace a record, keeping indexes in step."""
+        records = self._records(table)
+        previous = records.get(record_id)
+        if previous is None:
+            self._positions[table][record_id] = next(self._sequence)
+        else:
+            self._unindex(table, record_id, previous)
+        records[record_id] = record
+        self._index(table, record_id, record)
+
+    def _apply(self, table: str, record_id: str, updates: Dict[str, Any]):
+        """
+        Update fields of a stored record, keeping indexes in step.
+        
+        The record is replaced by an updated copy, never changed in place,
+        so dicts already handed out by queries keep their state.
+        """
+        records = self._records(table)
+        record = records[record_id]
+        self._unindex(table, record_id, record)
+        record = records[record_id] = {**record, **updates}
+        self._index(table, record_id, record)
+
+    def _match_ids(self, table: str, filters: Dict[str, Any]) -> List[str]:
+        """Ids of the records matching filters, in insertion order."""
+        records = self._records(table)
+        indexes = self._indexes[table]
+
+        id_sets = []
+        scanned = []
+        for key, value in filters.items():
+            if key in indexes:
+                id_sets.append(indexes[key].get(value, _NO_IDS))
+            else:
+                scanned.append((key, value))
+
+        if id_sets:
+            id_sets.sort(key=len)
+            ids = sorted(
+                id_sets[0].intersection(*id_sets[1:]),
+                key=self._positions[table].__getitem__
+            )
+        else:
+            ids = list(records)
+
+        # Columns without an index fall back to a scan of the candidates
+        for key, value in scanned:
+            ids = [record_id for record_id in ids if records[record_id].get(key) == value]
+
+        return ids
 
     async def insert(self, table: str, record: Dict[str, Any]) -> str:
         """
@@ -29,88 +163,483 @@ class MockDBClient:
         Returns:
             Record ID
         """
+        return self._insert(table, record)
+
+    def _insert(self, table: str, record: Dict[str, Any]) -> str:
+        """Store a new record and return its id (no awaits, for batches)."""
+        stored = record.copy() if self.copy_on_write else record
         if table == "saas_edge_jobs":
             job_id = record.get("job_id", str(uuid.uuid4()))
-            self.jobs[job_id] = record.copy()
+            self._store(table, job_id, stored)
             return job_id
         elif table == "product_template_completeness":
             internal_id = record.get("internal_id", str(uuid.uuid4()))
             record["internal_id"] = internal_id
-            self.completeness_records[internal_id] = record.copy()
+            stored["internal_id"] = internal_id
+            self._store(table, internal_id, stored)
             return internal_id
         else:
             raise ValueError(f"Unknown table: {table}")
 
-    async def insert_batch(self, table: str, records: List[Dict[str, Any]]) -> List[str]:
+    async def insert_batch(
+        self,
+        table: str,
+        records: List[Dict[str, Any]],
+        id_column: Optional[str] = None
+    ) -> List[str]:
         """
-        Insert multiple records.
+        Insert multiple records in one pass.
         
         Args:
             table: Table name
             records: List of records
+            id_column: Key holding each record's id (accepted for parity
+                with PostgreSQLClient; ids are always taken from the record)
             
         Returns:
             List of record IDs
         """
-        ids = []
-        for record in records:
-            record_id = await self.insert(table, record)
-            ids.append(record_id)
-        return ids
+        return [self._insert(table, record) for record in records]
+
+    async def insert_row(self, table: str, columns: Sequence[str], values: Sequence[Any]) -> str:
+        """
+        Insert one row given as a column-order tuple of values.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            values: Values in the same order as columns
+            
+        Returns:
+            Record ID
+        """
+        return await self.insert(table, dict(zip(columns, values)))
+
+    async def insert_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]]
+    ) -> int:
+        """
+        Insert many column-order rows.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            rows: Value tuples, each in the same order as columns
+            
+        Returns:
+            Number of rows inserted
+        """
+        for values in rows:
+            self._insert(table, dict(zip(columns, values)))
+        return len(rows)
 
-    async def update(self, table: str, record_id: str, updates: Dict[str, Any]) -> bool:
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]]
+    ) -> int:
+        """
+        Bulk-load column-order rows.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            rows: Value tuples, each in the same order as columns
+            
+        Returns:
+            Number of rows copied
+        """
+        if table != "completeness_errors":
+            raise ValueError(f"Unknown table: {table}")
+        self.completeness_errors.extend(dict(zip(columns, values)) for values in rows)
+        return len(rows)
+
+    async def update(
+        self,
+        table: str,
+        record_id: Union[str, Dict[str, Any]],
+        updates: Dict[str, Any]
+    ) -> bool:
         """
         Update a record.
         
         Args:
             table: Table name
-            record_id: Record identifier
+            record_id: Record identifier, or filter conditions (as passed
+                to PostgreSQLClient.update)
             updates: Fields to update
             
         Returns:
             True if successful
         """
-        if table == "saas_edge_jobs":
-            if record_id in self.jobs:
-                self.jobs[record_id].update(updates)
-                self.jobs[record_id]["updated_at"] = datetime.now()
-                return True
-            return False
-        elif table == "product_template_completeness":
-            if record_id in self.completeness_records:
-                self.completeness_records[record_id].update(updates)
-                self.completeness_records[record_id]["updated_at"] = datetime.now()
-                return True
-            return False
+        if isinstance(record_id, dict):
+            record_ids = self._match_ids(table, record_id)
+        elif record_id in self._records(table):
+            record_ids = [record_id]
         else:
-            raise ValueError(f"Unknown table: {table}")
+            return False
+
+        # One timestamp (and one merged dict) for every matched record
+        updates = {**updates, "updated_at": datetime.now(timezone.utc)}
+        for matched_id in record_ids:
+            self._apply(table, matched_id, updates)
+        return bool(record_ids)
+
+    async def update_returning(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        updates: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a record and return its new state.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions, matching one record
+            updates: Fields to update
+            fields: Fields to return (all fields if not provided)
+            
+        Returns:
+            Updated record, or None if nothing matched
+        """
+        record_ids = self._match_ids(table, filters)
+        if not record_ids:
+            return None
+
+        self._apply(table, record_ids[0], updates)
+        record = self._records(table)[record_ids[0]]
+        if fields:
+            return {field: record.get(field) for field in fields}
+        return record
+
+    async def jsonb_append(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        json_path: str,
+        value: Any,
+        json_set: Optional[Dict[str, Any]] = None,
+        updates: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Append a value to a JSON array field in place.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions
+            json_path: "column.key[.key...]" of the array
+            value: Element to append
+            json_set: Optional "column.key" -> value assignments
+            updates: Optional plain column updates
+            
+        Returns:
+            True if any records were updated
+        """
+        records = self._records(table)
+        record_ids = self._match_ids(table, filters)
+        column, _, key_path = json_path.partition(".")
+        *parents, key = key_path.split(".")
+        for record_id in record_ids:
+            record = records[record_id]
+            docs = {column: dict(record.get(column) or {})}
+            parent = _copy_path(docs[column], parents)
+            parent[key] = [*parent.get(key, ()), value]
+
+            for path, path_value in (json_set or {}).items():
+                set_column, _, set_path = path.partition(".")
+                if set_column not in docs:
+                    docs[set_column] = dict(record.get(set_column) or {})
+                *set_parents, set_key = set_path.split(".")
+                _copy_path(docs[set_column], set_parents)[set_key] = path_value
+
+            self._apply(table, record_id, {**docs, **(updates or {})})
+        return bool(record_ids)
 
-    async def query(self, table: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def jsonb_merge_last(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        json_path: str,
+        value: Dict[str, Any],
+        updates: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Merge an object into the last element of a JSON array field, or
+        into the column's top-level document when the array is empty.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions
+            json_path: "column.key[.key...]" of the array
+            value: Keys to merge
+            updates: Optional plain column updates
+            
+        Returns:
+            True if any records were updated
+        """
+        records = self._records(table)
+        record_ids = self._match_ids(table, filters)
+        column, _, key_path = json_path.partition(".")
+        *parents, key = key_path.split(".")
+        for record_id in record_ids:
+            doc = dict(records[record_id].get(column) or {})
+            target = doc
+            for part in key_path.split("."):
+                target = target.get(part) if isinstance(target, dict) else None
+            if isinstance(target, list) and target:
+                parent = _copy_path(doc, parents)
+                parent[key] = [*target[:-1], {**target[-1], **value}]
+            else:
+                doc.update(value)
+
+            self._apply(table, record_id, {column: doc, **(updates or {})})
+        return bool(record_ids)
+
+    async def advance_job(
+        self,
+        job_id: str,
+        status: str,
+        step: Optional[Dict[str, Any]] = None,
+        response: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Move a job to a new status (as saas_edge_job_advance() does).
+        
+        Args:
+            job_id: Job identifier
+            status: New job status
+            step: Optional step entry to append as the current step
+            response: Optional new job_response
+            
+        Returns:
+            Updated job record, or None if the job does not exist
+        """
+        if job_id not in self.jobs:
+            return None
+
+        updates: Dict[str, Any] = {"job_status": status, "updated_at": datetime.now(timezone.utc)}
+        if response is not None:
+            updates["job_response"] = response
+        if step is not None:
+            metrics = dict(self.jobs[job_id].get("metrics") or {})
+            metrics["steps"] = [*metrics.get("steps", ()), step]
+            metrics["current_step"] = status
+            updates["metrics"] = metrics
+
+        self._apply("saas_edge_jobs", job_id, updates)
+        return self.jobs[job_id]
+
+    async def insert_job(self, values: Sequence[Any]) -> None:
+        """
+        Insert a saas_edge_jobs row.
+        
+        Args:
+            values: Column values in statements.JOB_COLUMNS order
+        """
+        self._insert("saas_edge_jobs", dict(zip(JOB_COLUMNS, values)))
+
+    async def merge_job_step(
+        self,
+        job_id: str,
+        metrics: Dict[str, Any],
+        updated_at: datetime
+    ) -> bool:
+        """
+        Merge metrics into a job's current step.
+        
+        Args:
+            job_id: Job identifier
+            metrics: Keys to merge
+            updated_at: New updated_at value
+            
+        Returns:
+            True if the job exists
+        """
+        return await self.jsonb_merge_last(
+            "saas_edge_jobs", {"job_id": job_id}, "metrics.steps", metrics,
+            updates={"updated_at": updated_at}
+        )
+
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a job by job_id.
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            Job record (created_at/updated_at as UTC datetimes), or None
+        """
+        return self.jobs.get(job_id)
+
+    async def query(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        raw: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Query records from a table.
         
         Args:
             table: Table name
             filters: Filter conditions
+            raw: Accepted for PostgreSQLClient parity (stored records are
+                returned without copying either way)
             
         Returns:
             List of matching records
         """
         filters = filters or {}
 
-        if table == "saas_edge_jobs":
-            records = list(self.jobs.values())
-        elif table == "product_template_completeness":
-            records = list(self.completeness_records.values())
-        else:
-            raise ValueError(f"Unknown table: {table}")
+        if table == "completeness_errors":
+            # Append-only side table, scanned
+            records = list(self.completeness_errors)
+            for key, value in filters.items():
+                records = [r for r in records if r.get(key) == value]
+            return records
 
-        # Apply filters
-        for key, value in filters.items():
-            records = [r for r in records if r.get(key) == value]
+        records = self._records(table)
+        return [records[record_id] for record_id in self._match_ids(table, filters)]
+
+    async def query_many(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        latest_per: Optional[str] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Query records, with IN filters, column selection and per-key dedup.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions; a "column__in" key matches any value
+                in the given list
+            fields: Columns to return (all columns if not provided)
+            latest_per: Return only the most recent record (by created_at)
+                for each distinct value of this column
+            order_by: Optional "column [ASC|DESC]" sort
+            limit: Optional maximum number of records
+            raw: Accepted for PostgreSQLClient parity (as in query)
+            
+        Returns:
+            List of matching records
+        """
+        filters = dict(filters or {})
+        in_filters = {
+            key[:-4]: set(filters.pop(key))
+            for key in list(filters)
+            if key.endswith("__in")
+        }
+
+        records = await self.query(table, filters)
+        for key, allowed in in_filters.items():
+            records = [r for r in records if r.get(key) in allowed]
+
+        if latest_per:
+            latest: Dict[Any, Dict[str, Any]] = {}
+            for record in records:
+                key = record.get(latest_per)
+                current = latest.get(key)
+                if current is None or record["created_at"] > current["created_at"]:
+                    latest[key] = record
+            records = list(latest.values())
+
+        if order_by:
+            column, _, direction = order_by.partition(" ")
+            records = sorted(
+                records,
+                key=lambda r: r.get(column),
+                reverse=direction.strip().upper().startswith("DESC")
+            )
+
+        if limit is not None:
+            records = records[:limit]
+
+        if fields:
+            records = [{field: r.get(field) for field in fields} for r in records]
 
         return records
 
+    async def iter_many(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        prefetch: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream matching records, mirroring PostgreSQLClient.iter_many().
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (as in query_many)
+            fields: Columns to return (all columns if not provided)
+            order_by: Optional "column [ASC|DESC]" sort
+            prefetch: Ignored (no cursor in memory)
+            
+        Yields:
+            Matching records
+        """
+        for record in await self.query_many(table, filters, fields, order_by=order_by):
+            yield record
+
+    async def query_one(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Query a single record.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (as in query_many)
+            fields: Columns to return (all columns if not provided)
+            order_by: Optional "column [ASC|DESC]" sort
+            
+        Returns:
+            First matching record, or None
+        """
+        records = await self.query_many(table, filters, fields=fields, order_by=order_by, limit=1)
+        return records[0] if records else None
+
+    async def aggregate(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]],
+        group_by: Sequence[str]
+    ) -> List[tuple]:
+        """
+        Count records per distinct combination of group_by columns.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions
+            group_by: Columns to group on
+            
+        Returns:
+            One (*group_values, count) tuple per group
+        """
+        counts = Counter(
+            tuple(record.get(col) for col in group_by)
+            for record in await self.query(table, filters)
+        )
+        return [(*key, count) for key, count in counts.items()]
+
     async def get_by_id(self, table: str, record_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a record by ID.
@@ -140,27 +669,34 @@ class MockDBClient:
         Returns:
             True if deleted
         """
-        if table == "saas_edge_jobs":
-            if record_id in self.jobs:
-                del self.jobs[record_id]
-                return True
-            return False
-        elif table == "product_template_completeness":
-            if record_id in self.completeness_records:
-                del self.completeness_records[record_id]
-                return True
-            return False
-        else:
-            raise ValueError(f"Unknown table: {table}")
+        records = self._records(table)
+        if record_id in records:
+            self._unindex(table, record_id, records.pop(record_id))
+            del self._positions[table][record_id]
+            return True
+        return False
+
+    @asynccontextmanager
+    async def transaction(self):
+        """No-op transaction block, mirroring PostgreSQLClient.transaction()."""
+        yield None
+
+    @asynccontextmanager
+    async def pipeline(self):
+        """No-op pipeline block (writes apply at once), mirroring PostgreSQLClient.pipeline()."""
+        yield None
 
     def clear_all(self):
         """Clear all data (useful for test cleanup)."""
         self.jobs.clear()
         self.completeness_records.clear()
+        self.completeness_errors.clear()
+        self._reset_indexes()
 
     def get_stats(self) -> Dict[str, int]:
         """Get database statistics."""
         return {
             "jobs": len(self.jobs),
             "completeness_records": len(self.completeness_records),
+            "completeness_errors": len(self.completeness_errors),
         }
@@ -0,0 +1,347 @@
+"""
+Shared asyncpg Connection Pool
+
+One pool per database target and event loop, created lazily on first use
+and shared by every PostgreSQLClient running on that loop. Connection
+setup (TCP, TLS, auth) is then paid once per pooled connection instead of
+once per client.
+
+Direct Cloud SQL connections go through a single Cloud SQL Python
+Connector instance (IAM auth, certificate refresh) per loop, shared the
+same way.
+
+PostgreSQLClient.disconnect() leaves the shared pools open: the
+application must await close_pools() before its event loop ends (e.g.
+at the end of the coroutine passed to asyncio.run()). Pools left behind
+by a loop that was closed without it are terminated the next time a pool
+is requested.
+"""
+
+import asyncio
+import gc
+import json
+import logging
+import re
+from datetime import date, datetime, timezone
+from typing import Any, Dict, Optional, Sequence
+
+import asyncpg
+
+from .config import ConnectionMode, DatabaseConfig, get_db_config
+from .statements import JOB_STATEMENTS
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from google.cloud.sql.connector import create_async_connector
+    CLOUD_SQL_CONNECTOR_AVAILABLE = True
+except ImportError:
+    CLOUD_SQL_CONNECTOR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Queries served by a connection before it is replaced
+MAX_QUERIES = 50000
+
+# Seconds an idle connection above min_size is kept open
+MAX_INACTIVE_CONNECTION_LIFETIME = 300.0
+
+# Seconds an unused statement stays in a connection's statement cache;
+# 0 keeps it for the connection's lifetime (the cache size still bounds it)
+MAX_CACHED_STATEMENT_LIFETIME = 0
+
+# Default statement timeout in seconds
+COMMAND_TIMEOUT = 60
+
+# Leading byte of the binary jsonb format
+_JSONB_VERSION = b"\x01"
+
+# A run of 19 digits may be an integer outside 64 bits, which orjson would
+# silently turn into a float
+_has_long_digits = re.compile(rb"\d{19}").search
+
+
+class _LoopShared:
+    """Pools and Connector shared on one event loop (asyncpg objects are loop-bound)."""
+    
+    def __init__(self):
+        self.pools: Dict[str, asyncpg.Pool] = {}
+        self.lock = asyncio.Lock()
+        self.connector: Any = None
+
+
+_shared: Dict[asyncio.AbstractEventLoop, _LoopShared] = {}
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback encoding for values json cannot serialize natively."""
+    if isinstance(value, datetime):
+        # Naive datetimes are UTC throughout the SDK (as orjson's
+        # OPT_NAIVE_UTC assumes)
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode a json/jsonb parameter as UTF-8 (orjson when installed)."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, default=str, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Integers outside 64 bits, which json writes as they are
+            pass
+    return json.dumps(value, default=_json_default).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a json/jsonb column value (orjson when installed)."""
+    if ORJSON_AVAILABLE and not _has_long_digits(data):
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jsonb_dumps(value: Any) -> bytes:
+    """Binary jsonb wire format: a version byte, then the JSON text."""
+    return _JSONB_VERSION + _json_dumps(value)
+
+
+def _jsonb_loads(data: bytes) -> Any:
+    """Decode the binary jsonb wire format."""
+    return _json_loads(data[1:])
+
+
+async def prepare_cached(conn: asyncpg.Connection, query: str) -> Any:
+    """
+    Prepare query through the connection's statement cache.
+    
+    conn.prepare() always creates a separate statement outside the cache,
+    so it neither reuses nor warms what fetch()/execute() with the same
+    text would use; this goes through the cache (a hit costs nothing).
+    
+    Returns:
+        asyncpg PreparedStatement
+    """
+    # asyncpg exposes no public way to prepare into its statement cache
+    return await conn._prepare(query, use_cache=True)
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """
+    Register JSON codecs on each new pool connection and prepare the job
+    statements on it.
+    
+    Dict and list values (transformed_response, validation_errors, job
+    metrics, ...) are then serialized exactly once, straight to the
+    binary wire format, and json/jsonb columns come back as Python
+    objects. datetime values serialize as ISO 8601 (naive means UTC).
+    
+    Every connection the pool opens (at startup, on overflow, or to
+    replace a retired one) starts with JOB_STATEMENTS in its statement
+    cache, so job calls never pay a Parse round trip.
+    """
+    await conn.set_type_codec(
+        "json",
+        encoder=_json_dumps,
+        decoder=_json_loads,
+        schema="pg_catalog",
+        format="binary",
+    )
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=_jsonb_dumps,
+        decoder=_jsonb_loads,
+        schema="pg_catalog",
+        format="binary",
+    )
+    
+    # After the codecs: registering a codec empties the statement cache
+    try:
+        for query in JOB_STATEMENTS:
+            await prepare_cached(conn, query)
+    except asyncpg.PostgresError as e:
+        # Job schema not installed in this database; statements are
+        # then prepared on first use (and fail there if used at all)
+        logger.debug(f"Job statements not prepared on new connection: {e}")
+
+
+def _pool_key(config: DatabaseConfig) -> str:
+    """Identify the database target a config points at."""
+    if config.mode == ConnectionMode.DIRECT:
+        return f"cloudsql://{config.user}@{config.instance_connection_name}/{config.database}"
+    return config.get_asyncpg_dsn()
+
+
+def _drop_closed_loops() -> None:
+    """Terminate and forget the pools of event loops that have been closed."""
+    closed = [loop for loop in _shared if loop.is_closed()]
+    for loop in closed:
+        for pool in _shared.pop(loop).pools.values():
+            try:
+                pool.terminate()
+            except Exception as e:
+                logger.debug(f"Could not terminate pool of a closed event loop: {e}")
+    if closed:
+        # Their transports cannot be closed without the loop; the sockets
+        # are released when the (cyclic) connection objects are collected
+        gc.collect()
+
+
+def _loop_shared() -> _LoopShared:
+    """Shared state of the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    shared = _shared.get(loop)
+    if shared is None:
+        _drop_closed_loops()
+        shared = _shared[loop] = _LoopShared()
+    return shared
+
+
+async def _get_connector() -> Any:
+    """Cloud SQL Python Connector of the running loop, created on first use."""
+    shared = _loop_shared()
+    
+    if shared.connector is None:
+        if not CLOUD_SQL_CONNECTOR_AVAILABLE:
+            raise ImportError(
+                "cloud-sql-python-connector is required for direct mode. "
+                "Install with: pip install \"cloud-sql-python-connector[asyncpg]\""
+            )
+        shared.connector = await create_async_connector()
+    return shared.connector
+
+
+async def _create_pool(config: DatabaseConfig) -> asyncpg.Pool:
+    """Open a pool for config (direct mode connects through the Connector)."""
+    pool_args: Dict[str, Any] = dict(
+        min_size=config.pool_size,
+        max_size=config.pool_size + config.max_overflow,
+        max_queries=MAX_QUERIES,
+        max_inactive_connection_lifetime=MAX_INACTIVE_CONNECTION_LIFETIME,
+        timeout=config.pool_timeout,
+        command_timeout=COMMAND_TIMEOUT,
+        statement_cache_size=config.statement_cache_size,
+        max_cached_statement_lifetime=MAX_CACHED_STATEMENT_LIFETIME,
+        init=_init_connection,
+    )
+    
+    if config.mode != ConnectionMode.DIRECT:
+        return await asyncpg.create_pool(dsn=config.get_asyncpg_dsn(), **pool_args)
+    
+    if not config.instance_connection_name:
+        raise ValueError("instance_connection_name required for direct mode")
+    
+    connector = await _get_connector()
+    
+    async def connect(instance_connection_name: str, **kwargs: Any) -> asyncpg.Connection:
+        return await connector.connect_async(
+            instance_connection_name,
+            "asyncpg",
+            user=config.user,
+            password=config.password,
+            db=config.database,
+            **kwargs
+        )
+    
+    return await asyncpg.create_pool(config.instance_connection_name, connect=connect, **pool_args)
+
+
+async def get_pool(config: Optional[DatabaseConfig] = None) -> asyncpg.Pool:
+    """
+    Get the shared pool for a database on the running event loop,
+    creating it on first use.
+    
+    Args:
+        config: Database configuration (uses environment if not provided)
+    
+    Returns:
+        asyncpg connection pool
+    """
+    config = config or get_db_config()
+    key = _pool_key(config)
+    shared = _loop_shared()
+    
+    pool = shared.pools.get(key)
+    if pool is not None and not pool.is_closing():
+        return pool
+    
+    async with shared.lock:
+        # Another task may have created it while we waited
+        pool = shared.pools.get(key)
+        if pool is None or pool.is_closing():
+            logger.info(f"Creating shared connection pool in {config.mode.value} mode")
+            pool = await _create_pool(config)
+            shared.pools[key] = pool
+    
+    return pool
+
+
+async def _warm_connection(pool: asyncpg.Pool, statements: Sequence[str]) -> None:
+    """Check out one connection, ping it and prepare statements on it."""
+    async with pool.acquire() as conn:
+        await conn.fetchval("SELECT 1")
+        for query in statements:
+            try:
+                await prepare_cached(conn, query)
+            except asyncpg.PostgresError as e:
+                # Schema objects the statement needs are not installed
+                # (e.g. the job tables); it is prepared on first use instead
+                logger.debug(f"Statement not prepared while warming the pool: {e}")
+
+
+async def warm_pool(
+    config: Optional[DatabaseConfig] = None,
+    statements: Sequence[str] = JOB_STATEMENTS
+) -> asyncpg.Pool:
+    """
+    Create the shared pool and warm its min_size connections concurrently.
+    
+    Each connection is pinged and prepares the given statements into its
+    statement cache, so the server parses them and the connection resolves
+    their parameter and result types before the first job runs. Every new
+    connection already prepares JOB_STATEMENTS (the ones JobStatusUpdater
+    issues); pass other hot statements to warm them too. Call once at
+    application startup.
+    
+    Args:
+        config: Database configuration (uses environment if not provided)
+        statements: SQL texts to prepare on every connection
+        
+    Returns:
+        asyncpg connection pool
+    """
+    pool = await get_pool(config)
+    # Holding all min_size connections at once makes each task warm a
+    # different one
+    await asyncio.gather(*(
+        _warm_connection(pool, statements) for _ in range(pool.get_min_size())
+    ))
+    return pool
+
+
+async def close_pools() -> None:
+    """
+    Close the running loop's shared pools (and its Cloud SQL Connector).
+    
+    Await before the event loop ends; clients attach to a new pool if used
+    afterwards.
+    """
+    shared = _shared.pop(asyncio.get_running_loop(), None)
+    if shared is None:
+        return
+    
+    for pool in shared.pools.values():
+        await pool.close()
+    
+    if shared.connector is not None:
+        await shared.connector.close_async()
@@ -8,14 +8,57 @@ Provides async database operations using asyncpg with support for:
 """
 
 import asyncpg
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from typing import AsyncIterator, Callable, Dict, List, Any, Optional, Sequence, Tuple
 import logging
 from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from itertools import chain, groupby
+from operator import itemgetter
 
 from .config import DatabaseConfig, get_db_config
+from .pool import get_pool, prepare_cached, warm_pool
+from .statements import (
+    ADVANCE_JOB_SQL,
+    INSERT_JOB_SQL,
+    MERGE_JOB_STEP_SQL,
+    SELECT_JOB_SQL,
+    count_sql,
+    delete_sql,
+    insert_sql,
+    insert_values_sql,
+    jsonb_append_sql,
+    jsonb_merge_last_sql,
+    select_sql,
+    update_sql,
+)
 
 logger = logging.getLogger(__name__)
 
+# Key path of the job steps array within metrics
+_STEPS_PATH = ["steps"]
+
+# Batches of at least this many rows are loaded with COPY, smaller ones
+# with executemany
+COPY_BATCH_THRESHOLD = 50
+
+# Bind parameters PostgreSQL accepts in one statement
+MAX_BIND_PARAMS = 32767
+
+# Rows iter_many() fetches from its cursor per round trip
+STREAM_PREFETCH = 1000
+
+# Writes queued by the pipeline() block open in the current task, with
+# the pool they are for
+_pipeline: ContextVar[Optional[Tuple[asyncpg.Pool, List[Tuple[str, tuple]]]]] = ContextVar(
+    "_pipeline", default=None
+)
+
+# Connection of the transaction open in the current task, with its pool
+_transaction: ContextVar[Optional[Tuple[asyncpg.Pool, asyncpg.Connection]]] = ContextVar(
+    "_transaction", default=None
+)
+
 
 class PostgreSQLClient:
     """Async PostgreSQL client using asyncpg."""
@@ -31,7 +74,7 @@ class PostgreSQLClient:
         self.pool: Optional[asyncpg.Pool] = None
         
     async def connect(self) -> None:
-        """Establish connection pool."""
+        """Attach to the shared connection pool for this database."""
         if self.pool:
             logger.warning("Connection pool already exists")
             return
@@ -39,34 +82,34 @@ class PostgreSQLClient:
         try:
             logger.info(f"Connecting to database in {self.config.mode.value} mode")
             
-            dsn = self.config.get_asyncpg_dsn()
-            
-            self.pool = await asyncpg.create_pool(
-                dsn=dsn,
-                min_size=1,
-                max_size=self.config.pool_size,
-                timeout=self.config.pool_timeout,
-                command_timeout=60,
-            )
+            # One pool per database, shared by all clients in the process
+            self.pool = await get_pool(self.config)
             
-            logger.info("Database connection pool created successfully")
+            logger.info("Database connection pool ready")
             
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
     
     async def disconnect(self) -> None:
-        """Close connection pool."""
+        """
+        Detach from the shared connection pool.
+        
+        The pool stays open for other clients; the application must
+        await close_pools() in db.pool before its event loop ends.
+        """
         if self.pool:
-            await self.pool.close()
             self.pool = None
-            logger.info("Database connection pool closed")
+            logger.info("Detached from database connection pool")
     
     @asynccontextmanager
     async def acquire(self):
         """
         Acquire a connection from the pool.
         
+        Inside transaction(), yields the transaction's connection so every
+        client call in the block joins it.
+        
         Usage:
             async with client.acquire() as conn:
                 result = await conn.fetchrow("SELECT * FROM table")
@@ -74,9 +117,93 @@ class PostgreSQLClient:
         if not self.pool:
             await self.connect()
         
+        current = _transaction.get()
+        if current is not None and current[0] is self.pool:
+            yield current[1]
+            return
+        
         async with self.pool.acquire() as connection:
             yield connection
     
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Run the client calls made inside the block in one transaction.
+        
+        Nested blocks become savepoints.
+        
+        Usage:
+            async with client.transaction():
+                await client.update(...)
+                await client.insert(...)
+        """
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                token = _transaction.set((self.pool, conn))
+                try:
+                    yield conn
+                finally:
+                    _transaction.reset(token)
+    
+    @asynccontextmanager
+    async def prepared(self, query: str):
+        """
+        Acquire a connection and yield query prepared on it.
+        
+        The statement comes from the connection's statement cache, so a
+        hot query is parsed once per connection, not once per call.
+        
+        Usage:
+            async with client.prepared("SELECT ... WHERE id = $1") as stmt:
+                row = await stmt.fetchrow(record_id)
+        """
+        async with self.acquire() as conn:
+            yield await prepare_cached(conn, query)
+    
+    @asynccontextmanager
+    async def pipeline(self):
+        """
+        Queue the writes made inside the block and send them together.
+        
+        update(), delete() and execute() calls are held until the block
+        exits, then run in order in one transaction. Consecutive calls
+        with the same statement go out as one executemany (asyncpg sends
+        every Bind/Execute before a single Sync), and consecutive
+        parameterless statements as one multi-statement query, so a batch
+        of writes costs a round trip per run instead of per call. Nothing
+        is sent if the block raises.
+        
+        Inside the block update() and delete() return True and execute()
+        returns "" (results are not known yet), and reads do not see the
+        queued writes.
+        
+        Usage:
+            async with client.pipeline():
+                for job_id in stale_jobs:
+                    await client.update("saas_edge_jobs", {"job_id": job_id}, {...})
+        """
+        if not self.pool:
+            await self.connect()
+        
+        queue: List[Tuple[str, tuple]] = []
+        token = _pipeline.set((self.pool, queue))
+        try:
+            yield
+        finally:
+            _pipeline.reset(token)
+        
+        if queue:
+            async with self.transaction() as conn:
+                await _send_queued(conn, queue)
+    
+    def _queue(self, query: str, args: Sequence[Any]) -> bool:
+        """Queue a write in the open pipeline() block; False if none is open."""
+        current = _pipeline.get()
+        if current is None or current[0] is not self.pool:
+            return False
+        current[1].append((query, tuple(args)))
+        return True
+    
     async def insert(self, table: str, record: Dict[str, Any]) -> str:
         """
         Insert a record into a table.
@@ -88,28 +215,35 @@ class PostgreSQLClient:
         Returns:
             Primary key value (assumes first column is PK)
         """
-        columns = list(record.keys())
+        columns = tuple(record)
         values = [record[col] for col in columns]
-        placeholders = ", ".join(f"${i+1}" for i in range(len(columns)))
-        
-        query = f"""
-            INSERT INTO {table} ({", ".join(columns)})
-            VALUES ({placeholders})
-            RETURNING *
-        """
+        query = insert_sql(table, columns)
         
         async with self.acquire() as conn:
             row = await conn.fetchrow(query, *values)
             # Return first column value (typically the ID)
             return str(row[0]) if row else None
     
-    async def insert_batch(self, table: str, records: List[Dict[str, Any]]) -> List[str]:
+    async def insert_batch(
+        self,
+        table: str,
+        records: List[Dict[str, Any]],
+        id_column: Optional[str] = None
+    ) -> List[str]:
         """
         Insert multiple records in a batch.
         
+        When the records carry their own ids (id_column), nothing needs to
+        come back from the server: the batch is sent in one go, with COPY
+        from COPY_BATCH_THRESHOLD rows up and executemany below that.
+        Otherwise rows go in multi-row INSERT ... RETURNING statements (as
+        many rows per statement as the bind parameter limit allows), one
+        round trip each.
+        
         Args:
             table: Table name
-            records: List of records
+            records: List of records (all with the same keys)
+            id_column: Key holding each record's id, if already set
             
         Returns:
             List of primary key values
@@ -117,25 +251,109 @@ class PostgreSQLClient:
         if not records:
             return []
         
-        columns = list(records[0].keys())
-        placeholders = ", ".join(f"${i+1}" for i in range(len(columns)))
+        columns = tuple(records[0])
+        row_values = _row_getter(columns)
         
-        query = f"""
-            INSERT INTO {table} ({", ".join(columns)})
-            VALUES ({placeholders})
-            RETURNING *
-        """
+        if id_column is not None:
+            rows = list(map(row_values, records))
+            if len(rows) >= COPY_BATCH_THRESHOLD:
+                await self.copy_records(table, columns, rows)
+            else:
+                await self.insert_rows(table, columns, rows)
+            return list(map(str, map(itemgetter(id_column), records)))
+        
+        rows_per_statement = max(1, MAX_BIND_PARAMS // len(columns))
         
         ids = []
         async with self.acquire() as conn:
             async with conn.transaction():
-                for record in records:
-                    values = [record[col] for col in columns]
-                    row = await conn.fetchrow(query, *values)
-                    ids.append(str(row[0]) if row else None)
+                for start in range(0, len(records), rows_per_statement):
+                    chunk = records[start:start + rows_per_statement]
+                    query = insert_values_sql(table, columns, len(chunk))
+                    values = list(chain.from_iterable(map(row_values, chunk)))
+                    # RETURNING yields rows in VALUES order
+                    rows = await conn.fetch(query, *values)
+                    ids.extend(str(row[0]) for row in rows)
         
         return ids
     
+    async def insert_row(self, table: str, columns: Sequence[str], values: Sequence[Any]) -> str:
+        """
+        Insert one row given as a column-order tuple of values.
+        
+        Same as insert(), minus building a dict per row.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            values: Values in the same order as columns
+            
+        Returns:
+            Primary key value (assumes first column is PK)
+        """
+        query = insert_sql(table, tuple(columns))
+        
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(query, *values)
+            return str(row[0]) if row else None
+    
+    async def insert_rows(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]]
+    ) -> int:
+        """
+        Insert many column-order rows with a single executemany.
+        
+        asyncpg prepares the statement once and pipelines the rows, so a
+        batch costs one round trip rather than one per row. No ids are
+        returned; callers generate them up front.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            rows: Value tuples, each in the same order as columns
+            
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        
+        query = insert_sql(table, tuple(columns), returning=False)
+        
+        async with self.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(query, rows)
+        
+        return len(rows)
+    
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        rows: Sequence[Sequence[Any]]
+    ) -> int:
+        """
+        Bulk-load column-order rows with COPY.
+        
+        Args:
+            table: Table name
+            columns: Column names
+            rows: Value tuples, each in the same order as columns
+            
+        Returns:
+            Number of rows copied
+        """
+        if not rows:
+            return 0
+        
+        async with self.acquire() as conn:
+            await conn.copy_records_to_table(table, records=rows, columns=list(columns))
+        
+        return len(rows)
+    
     async def update(self, table: str, filters: Dict[str, Any], updates: Dict[str, Any]) -> bool:
         """
         Update records matching filters.
@@ -148,61 +366,360 @@ class PostgreSQLClient:
         Returns:
             True if any rows were updated
         """
-        set_clauses = []
-        where_clauses = []
-        values = []
-        param_idx = 1
+        query = update_sql(table, tuple(updates), tuple(filters))
+        values = [*updates.values(), *filters.values()]
+        
+        if self._queue(query, values):
+            return True
+        
+        async with self.acquire() as conn:
+            result = await conn.execute(query, *values)
+            # Result is like "UPDATE 1"
+            return "UPDATE" in result and result.split()[1] != "0"
+    
+    async def update_returning(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        updates: Dict[str, Any],
+        fields: Optional[Sequence[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update a record and return its new state in the same round trip
+        (UPDATE ... RETURNING).
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (WHERE clause), matching one record
+            updates: Fields to update
+            fields: Columns to return (all columns if not provided)
+            
+        Returns:
+            Updated record, or None if nothing matched
+        """
+        query = update_sql(table, tuple(updates), tuple(filters), tuple(fields or ()))
+        values = [*updates.values(), *filters.values()]
+        
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(query, *values)
+            return dict(row) if row else None
+    
+    async def jsonb_append(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        json_path: str,
+        value: Any,
+        json_set: Optional[Dict[str, Any]] = None,
+        updates: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Append a value to a JSONB array in place, in a single UPDATE.
+        
+        The array is extended server-side, so callers need no read of the
+        current document first (and concurrent appends cannot overwrite
+        each other).
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (WHERE clause)
+            json_path: "column.key[.key...]" of the array; a missing
+                array is created
+            value: Element to append
+            json_set: Optional "column.key" -> value assignments in the
+                same JSONB column
+            updates: Optional plain column updates
+        
+        Returns:
+            True if any rows were updated
+        """
+        json_set = json_set or {}
+        updates = updates or {}
+        query = jsonb_append_sql(table, json_path, tuple(json_set), tuple(updates), tuple(filters))
+        
+        values: List[Any] = [json_path.split(".")[1:], value]
+        for path, path_value in json_set.items():
+            values.append(path.split(".")[1:])
+            values.append(path_value)
+        values.extend(updates.values())
+        values.extend(filters.values())
         
-        # Build SET clause
-        for col, val in updates.items():
-            set_clauses.append(f"{col} = ${param_idx}")
-            values.append(val)
-            param_idx += 1
+        async with self.acquire() as conn:
+            result = await conn.execute(query, *values)
+            return "UPDATE" in result and result.split()[1] != "0"
+    
+    async def jsonb_merge_last(
+        self,
+        table: str,
+        filters: Dict[str, Any],
+        json_path: str,
+        value: Dict[str, Any],
+        updates: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Merge an object into the last element of a JSONB array, in place.
         
-        # Build WHERE clause
-        for col, val in filters.items():
-            where_clauses.append(f"{col} = ${param_idx}")
-            values.append(val)
-            param_idx += 1
+        When the array is missing or empty the object is merged into the
+        column's top-level document instead.
         
-        query = f"""
-            UPDATE {table}
-            SET {", ".join(set_clauses)}
-            WHERE {" AND ".join(where_clauses)}
+        Args:
+            table: Table name
+            filters: Filter conditions (WHERE clause)
+            json_path: "column.key[.key...]" of the array
+            value: Keys to merge
+            updates: Optional plain column updates
+        
+        Returns:
+            True if any rows were updated
         """
+        updates = updates or {}
+        query = jsonb_merge_last_sql(table, json_path, tuple(updates), tuple(filters))
+        values = [json_path.split(".")[1:], value, *updates.values(), *filters.values()]
         
         async with self.acquire() as conn:
             result = await conn.execute(query, *values)
-            # Result is like "UPDATE 1"
             return "UPDATE" in result and result.split()[1] != "0"
     
-    async def query(self, table: str, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    async def advance_job(
+        self,
+        job_id: str,
+        status: str,
+        step: Optional[Dict[str, Any]] = None,
+        response: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Move a job to a new status in one call to saas_edge_job_advance().
+        
+        The function (see the saas_edge_jobs schema) sets the status,
+        appends step to metrics["steps"] as the current step when given,
+        and replaces job_response when given, in a single statement, and
+        returns the updated row.
+        
+        Args:
+            job_id: Job identifier
+            status: New job status
+            step: Optional step entry to append
+            response: Optional new job_response
+            
+        Returns:
+            Updated job record, or None if the job does not exist
+        """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(ADVANCE_JOB_SQL, job_id, status, step, response)
+            return dict(row) if row else None
+    
+    async def insert_job(self, values: Sequence[Any]) -> None:
+        """
+        Insert a saas_edge_jobs row.
+        
+        Args:
+            values: Column values in statements.JOB_COLUMNS order
+        """
+        async with self.acquire() as conn:
+            await conn.execute(INSERT_JOB_SQL, *values)
+    
+    async def merge_job_step(
+        self,
+        job_id: str,
+        metrics: Dict[str, Any],
+        updated_at: datetime
+    ) -> bool:
+        """
+        Merge metrics into a job's current step (jsonb_merge_last on
+        metrics.steps, as one fixed statement).
+        
+        Args:
+            job_id: Job identifier
+            metrics: Keys to merge
+            updated_at: New updated_at value
+            
+        Returns:
+            True if the job exists
+        """
+        async with self.acquire() as conn:
+            result = await conn.execute(
+                MERGE_JOB_STEP_SQL, _STEPS_PATH, metrics, updated_at, job_id
+            )
+            return result != "UPDATE 0"
+    
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a saas_edge_jobs row by job_id.
+        
+        Args:
+            job_id: Job identifier
+            
+        Returns:
+            Job record (created_at/updated_at as datetimes), or None
+        """
+        async with self.acquire() as conn:
+            row = await conn.fetchrow(SELECT_JOB_SQL, job_id)
+            return dict(row) if row else None
+    
+    async def query(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        raw: bool = False
+    ) -> List[Dict[str, Any]]:
         """
         Query records from a table.
         
         Args:
             table: Table name
             filters: Optional filter conditions
+            raw: Return the asyncpg Records as fetched instead of copying
+                each into a dict (Records support row["col"], keys(),
+                values() and items(), but are read-only)
             
         Returns:
-            List of records as dictionaries
+            List of records as dictionaries (Records when raw)
         """
-        where_clauses = []
-        values = []
-        param_idx = 1
+        filters = filters or {}
+        query = select_sql(table, tuple(filters))
         
-        if filters:
-            for col, val in filters.items():
-                where_clauses.append(f"{col} = ${param_idx}")
-                values.append(val)
-                param_idx += 1
+        async with self.acquire() as conn:
+            rows = await conn.fetch(query, *filters.values())
+            return rows if raw else [dict(row) for row in rows]
+    
+    async def query_many(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        latest_per: Optional[str] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+        raw: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Query records, with IN filters, column selection and per-key dedup.
         
-        where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
-        query = f"SELECT * FROM {table} {where_sql}"
+        Args:
+            table: Table name
+            filters: Filter conditions; a "column__in" key matches any value
+                in the given list
+            fields: Columns to return (all columns if not provided)
+            latest_per: Return only the most recent record (by created_at)
+                for each distinct value of this column
+            order_by: Optional ORDER BY clause (e.g. "created_at DESC")
+            limit: Optional maximum number of records
+            raw: Return asyncpg Records instead of dicts (as in query)
+            
+        Returns:
+            List of records as dictionaries (Records when raw)
+        """
+        filters = filters or {}
+        query = select_sql(
+            table,
+            tuple(filters),
+            tuple(fields) if fields else None,
+            latest_per,
+            order_by,
+            limit is not None
+        )
+        
+        values = [
+            list(val) if col.endswith("__in") else val
+            for col, val in filters.items()
+        ]
+        if limit is not None:
+            values.append(limit)
         
         async with self.acquire() as conn:
             rows = await conn.fetch(query, *values)
-            return [dict(row) for row in rows]
+            return rows if raw else [dict(row) for row in rows]
+    
+    async def iter_many(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None,
+        prefetch: int = STREAM_PREFETCH
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream records through a server-side cursor.
+        
+        Rows are fetched prefetch at a time, so memory stays flat however
+        many records match. The connection is held until the iteration
+        finishes (or the generator is closed).
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (as in query_many)
+            fields: Columns to return (all columns if not provided)
+            order_by: Optional ORDER BY clause
+            prefetch: Rows fetched per round trip
+            
+        Yields:
+            Records as dictionaries
+        """
+        filters = filters or {}
+        query = select_sql(
+            table,
+            tuple(filters),
+            tuple(fields) if fields else None,
+            None,
+            order_by
+        )
+        
+        values = [
+            list(val) if col.endswith("__in") else val
+            for col, val in filters.items()
+        ]
+        
+        async with self.acquire() as conn:
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(query, *values, prefetch=prefetch):
+                    yield dict(row)
+    
+    async def query_one(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]] = None,
+        fields: Optional[Sequence[str]] = None,
+        order_by: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Query a single record.
+        
+        Args:
+            table: Table name
+            filters: Filter conditions (as in query_many)
+            fields: Columns to return (all columns if not provided)
+            order_by: Optional ORDER BY clause picking which record is first
+            
+        Returns:
+            First matching record, or None
+        """
+        rows = await self.query_many(table, filters, fields=fields, order_by=order_by, limit=1)
+        return rows[0] if rows else None
+    
+    async def aggregate(
+        self,
+        table: str,
+        filters: Optional[Dict[str, Any]],
+        group_by: Sequence[str]
+    ) -> List[tuple]:
+        """
+        Count records per distinct combination of group_by columns.
+        
+        Args:
+            table: Table name
+            filters: Optional filter conditions
+            group_by: Columns to group on
+            
+        Returns:
+            One (*group_values, count) tuple per group
+        """
+        filters = filters or {}
+        query = count_sql(table, tuple(group_by), tuple(filters))
+        
+        async with self.acquire() as conn:
+            rows = await conn.fetch(query, *filters.values())
+            return [tuple(row) for row in rows]
     
     async def get_by_id(self, table: str, record_id: str, id_column: str = "id") -> Optional[Dict[str, Any]]:
         """
@@ -216,7 +733,7 @@ class PostgreSQLClient:
         Returns:
             Record as dictionary or None
         """
-        query = f"SELECT * FROM {table} WHERE {id_column} = $1"
+        query = select_sql(table, (id_column,))
         
         async with self.acquire() as conn:
             row = await conn.fetchrow(query, record_id)
@@ -233,16 +750,11 @@ class PostgreSQLClient:
         Returns:
             True if any rows were deleted
         """
-        where_clauses = []
-        values = []
-        param_idx = 1
+        query = delete_sql(table, tuple(filters))
+        values = list(filters.values())
         
-        for col, val in filters.items():
-            where_clauses.append(f"{col} = ${param_idx}")
-            values.append(val)
-            param_idx += 1
-        
-        query = f"DELETE FROM {table} WHERE {' AND '.join(where_clauses)}"
+        if self._queue(query, values):
+            return True
         
         async with self.acquire() as conn:
             result = await conn.execute(query, *values)
@@ -259,38 +771,68 @@ class PostgreSQLClient:
         Returns:
             Query result status
         """
+        if self._queue(query, args):
+            return ""
+        
         async with self.acquire() as conn:
             return await conn.execute(query, *args)
     
-    async def fetch_one(self, query: str, *args) -> Optional[Dict[str, Any]]:
+    async def fetch_one(self, query: str, *args, raw: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch a single row.
         
         Args:
             query: SQL query
             *args: Query parameters
+            raw: Return the asyncpg Record instead of a dict (as in query)
             
         Returns:
-            Row as dictionary or None
+            Row as dictionary (Record when raw) or None
         """
         async with self.acquire() as conn:
             row = await conn.fetchrow(query, *args)
-            return dict(row) if row else None
+            if row is None or raw:
+                return row
+            return dict(row)
     
-    async def fetch_all(self, query: str, *args) -> List[Dict[str, Any]]:
+    async def fetch_all(self, query: str, *args, raw: bool = False) -> List[Dict[str, Any]]:
         """
         Fetch all matching rows.
         
         Args:
             query: SQL query
             *args: Query parameters
+            raw: Return asyncpg Records instead of dicts (as in query)
             
         Returns:
-            List of rows as dictionaries
+            List of rows as dictionaries (Records when raw)
         """
         async with self.acquire() as conn:
             rows = await conn.fetch(query, *args)
-            return [dict(row) for row in rows]
+            return rows if raw else [dict(row) for row in rows]
+    
+    async def fetch_all_columnar(self, query: str, *args) -> Dict[str, List[Any]]:
+        """
+        Fetch all matching rows as one list of values per column.
+        
+        The rows are transposed in a single zip() pass, with no per-row
+        dict; the result can go straight to e.g. pyarrow.table().
+        
+        Args:
+            query: SQL query
+            *args: Query parameters
+            
+        Returns:
+            Column name -> values in row order (empty lists when no rows
+            match)
+        """
+        async with self.prepared(query) as stmt:
+            rows = await stmt.fetch(*args)
+            names = [attr.name for attr in stmt.get_attributes()]
+        
+        if not rows:
+            return {name: [] for name in names}
+        return dict(zip(names, map(list, zip(*rows))))
     
     async def health_check(self) -> bool:
         """
@@ -308,17 +850,46 @@ class PostgreSQLClient:
             return False
 
 
-async def create_db_client(config: Optional[DatabaseConfig] = None) -> PostgreSQLClient:
+def _row_getter(columns: Tuple[str, ...]) -> Callable[[Dict[str, Any]], tuple]:
+    """Getter returning a record's values as a tuple in column order."""
+    if len(columns) == 1:
+        # itemgetter with one key returns the bare value
+        column = columns[0]
+        return lambda record: (record[column],)
+    return itemgetter(*columns)
+
+
+async def _send_queued(conn: asyncpg.Connection, queue: List[Tuple[str, tuple]]) -> None:
+    """Send pipeline() writes in order, one round trip per run of alike calls."""
+    runs = groupby(queue, key=lambda op: (op[0], True) if op[1] else ("", False))
+    for (query, has_args), run in runs:
+        ops = list(run)
+        if not has_args:
+            await conn.execute(";\n".join(op[0] for op in ops))
+        elif len(ops) == 1:
+            await conn.execute(query, *ops[0][1])
+        else:
+            await conn.executemany(query, [op[1] for op in ops])
+
+
+async def create_db_client(
+    config: Optional[DatabaseConfig] = None,
+    warm: bool = True
+) -> PostgreSQLClient:
     """
     Create and connect a PostgreSQL client.
     
     Args:
         config: Optional database configuration
+        warm: Warm the shared pool first (see pool.warm_pool), so the
+            first job does not pay connection setup and statement parsing
         
     Returns:
         Connected PostgreSQLClient instance
     """
     client = PostgreSQLClient(config)
+    if warm:
+        await warm_pool(client.config)
     await client.connect()
     return client
 
@@ -326,6 +897,7 @@ async def create_db_client(config: Optional[DatabaseConfig] = None) -> PostgreSQ
 # Example usage
 if __name__ == "__main__":
     import asyncio
+    from .pool import close_pools
     
     async def test_connection():
         """Test database connection."""
@@ -351,6 +923,7 @@ if __name__ == "__main__":
             print(f"❌ Connection failed: {e}")
         finally:
             await client.disconnect()
+            await close_pools()
             print("Connection closed")
     
     asyncio.run(test_connection())
@@ -0,0 +1,269 @@
+"""
+SQL Statement Builders
+
+Statement text for the PostgreSQL client, built from table and column
+names only (values are always bind parameters). Builders are cached, so
+the same call shape always yields the same string object: asyncpg keys
+its per-connection prepared-statement cache on the query text, so each
+connection parses and plans a statement once and then only binds.
+
+Table and column names are checked against a plain identifier pattern
+before they are put into statement text; since the builders are cached,
+that happens once per call shape.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Unquoted PostgreSQL identifier (at most 63 bytes), optionally qualified
+_IDENT = r"[A-Za-z_][A-Za-z0-9_]{0,62}"
+_is_identifier = re.compile(rf"{_IDENT}(?:\.{_IDENT})?").fullmatch
+
+# "col [ASC|DESC] [NULLS FIRST|LAST], ..."
+_ORDER_TERM = rf"{_IDENT}(?:\s+(?:ASC|DESC))?(?:\s+NULLS\s+(?:FIRST|LAST))?"
+_is_order_by = re.compile(rf"{_ORDER_TERM}(?:\s*,\s*{_ORDER_TERM})*", re.IGNORECASE).fullmatch
+
+
+def _check_identifiers(*names: str) -> None:
+    """Refuse any name that is not a plain identifier."""
+    for name in names:
+        if not isinstance(name, str) or not _is_identifier(name):
+            raise ValueError(f"Invalid SQL identifier: {name!r}")
+
+
+def _split_json_path(json_path: str) -> Tuple[str, str]:
+    """Split "column.key[.key...]" into the column and its key path."""
+    column, _, key_path = json_path.partition(".")
+    return column, key_path
+
+
+def _set_and_where(
+    set_clauses: list,
+    update_columns: Tuple[str, ...],
+    where_columns: Tuple[str, ...],
+    first_param: int
+) -> str:
+    """SET ... WHERE ... text, numbering update then filter parameters."""
+    param_idx = first_param
+    for col in update_columns:
+        set_clauses.append(f"{col} = ${param_idx}")
+        param_idx += 1
+    
+    where_clauses = []
+    for col in where_columns:
+        where_clauses.append(f"{col} = ${param_idx}")
+        param_idx += 1
+    
+    return f"SET {', '.join(set_clauses)} WHERE {' AND '.join(where_clauses)}"
+
+
+@lru_cache(maxsize=256)
+def insert_sql(table: str, columns: Tuple[str, ...], returning: bool = True) -> str:
+    """
+    INSERT statement; parameters are the values in column order.
+    """
+    _check_identifiers(table, *columns)
+    placeholders = ", ".join(f"${i+1}" for i in range(len(columns)))
+    query = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+    if returning:
+        query += " RETURNING *"
+    return query
+
+
+@lru_cache(maxsize=256)
+def insert_values_sql(table: str, columns: Tuple[str, ...], row_count: int) -> str:
+    """
+    Multi-row INSERT ... RETURNING *; parameters are the values of each
+    row in column order, row after row.
+    """
+    _check_identifiers(table, *columns)
+    width = len(columns)
+    rows = ", ".join(
+        "(" + ", ".join(f"${row * width + i + 1}" for i in range(width)) + ")"
+        for row in range(row_count)
+    )
+    return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {rows} RETURNING *"
+
+
+@lru_cache(maxsize=256)
+def update_sql(
+    table: str,
+    update_columns: Tuple[str, ...],
+    where_columns: Tuple[str, ...],
+    returning: Optional[Tuple[str, ...]] = None
+) -> str:
+    """
+    UPDATE statement; parameters are the update values, then the filter
+    values. returning lists the columns to return (empty for all).
+    """
+    _check_identifiers(table, *update_columns, *where_columns, *(returning or ()))
+    query = f"UPDATE {table} " + _set_and_where([], update_columns, where_columns, 1)
+    if returning is not None:
+        query += f" RETURNING {', '.join(returning) or '*'}"
+    return query
+
+
+@lru_cache(maxsize=256)
+def jsonb_append_sql(
+    table: str,
+    json_path: str,
+    set_paths: Tuple[str, ...],
+    update_columns: Tuple[str, ...],
+    where_columns: Tuple[str, ...]
+) -> str:
+    """
+    UPDATE appending to the JSONB array at json_path.
+    
+    Parameters: the array's key path and the element, then a key path and
+    value per set_paths entry, then update values, then filter values.
+    """
+    column, _ = _split_json_path(json_path)
+    _check_identifiers(table, column, *update_columns, *where_columns)
+    expr = (
+        f"jsonb_set(coalesce({column}, '{{}}'::jsonb), $1::text[], "
+        f"coalesce({column} #> $1::text[], '[]'::jsonb) || jsonb_build_array($2::jsonb))"
+    )
+    
+    param_idx = 3
+    for path in set_paths:
+        set_column, _ = _split_json_path(path)
+        if set_column != column:
+            raise ValueError(f"json_set path {path} is not in column {column}")
+        expr = f"jsonb_set({expr}, ${param_idx}::text[], ${param_idx + 1}::jsonb)"
+        param_idx += 2
+    
+    return f"UPDATE {table} " + _set_and_where(
+        [f"{column} = {expr}"], update_columns, where_columns, param_idx
+    )
+
+
+@lru_cache(maxsize=256)
+def jsonb_merge_last_sql(
+    table: str,
+    json_path: str,
+    update_columns: Tuple[str, ...],
+    where_columns: Tuple[str, ...]
+) -> str:
+    """
+    UPDATE merging an object into the last element of the JSONB array at
+    json_path (or into the column's document when the array is empty).
+    
+    Parameters: the array's key path and the object, then update values,
+    then filter values.
+    """
+    column, _ = _split_json_path(json_path)
+    _check_identifiers(table, column, *update_columns, *where_columns)
+    expr = (
+        f"CASE WHEN jsonb_typeof({column} #> $1::text[]) = 'array' "
+        f"AND jsonb_array_length({column} #> $1::text[]) > 0 "
+        f"THEN jsonb_set({column}, array_append($1::text[], '-1'), "
+        f"(({column} #> $1::text[]) -> -1) || $2::jsonb) "
+        f"ELSE coalesce({column}, '{{}}'::jsonb) || $2::jsonb END"
+    )
+    
+    return f"UPDATE {table} " + _set_and_where(
+        [f"{column} = {expr}"], update_columns, where_columns, 3
+    )
+
+
+@lru_cache(maxsize=256)
+def delete_sql(table: str, where_columns: Tuple[str, ...]) -> str:
+    """
+    DELETE statement; parameters are the filter values.
+    """
+    _check_identifiers(table, *where_columns)
+    where_clauses = [f"{col} = ${i+1}" for i, col in enumerate(where_columns)]
+    return f"DELETE FROM {table} WHERE {' AND '.join(where_clauses)}"
+
+
+@lru_cache(maxsize=256)
+def count_sql(table: str, group_by: Tuple[str, ...], where_columns: Tuple[str, ...]) -> str:
+    """
+    SELECT of the group_by columns and COUNT(*) per group; parameters are
+    the filter values.
+    """
+    _check_identifiers(table, *group_by, *where_columns)
+    where_clauses = [f"{col} = ${i+1}" for i, col in enumerate(where_columns)]
+    group_sql = ", ".join(group_by)
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    return f"SELECT {group_sql}, COUNT(*) FROM {table} {where_sql} GROUP BY {group_sql}"
+
+
+@lru_cache(maxsize=256)
+def select_sql(
+    table: str,
+    filter_keys: Tuple[str, ...],
+    fields: Optional[Tuple[str, ...]] = None,
+    latest_per: Optional[str] = None,
+    order_by: Optional[str] = None,
+    limited: bool = False
+) -> str:
+    """
+    SELECT statement for query_many.
+    
+    Parameters: one per filter key (a "column__in" key takes a list),
+    then the limit when limited is set.
+    """
+    _check_identifiers(table, *filter_keys, *(fields or ()), *((latest_per,) if latest_per else ()))
+    if order_by and not _is_order_by(order_by):
+        raise ValueError(f"Invalid ORDER BY clause: {order_by!r}")
+    where_clauses = []
+    param_idx = 1
+    for col in filter_keys:
+        if col.endswith("__in"):
+            where_clauses.append(f"{col[:-4]} = ANY(${param_idx})")
+        else:
+            where_clauses.append(f"{col} = ${param_idx}")
+        param_idx += 1
+    
+    select_cols = ", ".join(fields) if fields else "*"
+    where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
+    if latest_per:
+        # One row per key, picked server-side instead of shipping history
+        query = (
+            f"SELECT DISTINCT ON ({latest_per}) {select_cols} FROM {table} {where_sql} "
+            f"ORDER BY {latest_per}, created_at DESC"
+        )
+        if order_by:
+            query = f"SELECT * FROM ({query}) AS latest"
+    else:
+        query = f"SELECT {select_cols} FROM {table} {where_sql}"
+    
+    if order_by:
+        query += f" ORDER BY {order_by}"
+    if limited:
+        query += f" LIMIT ${param_idx}"
+    return query
+
+
+# Statements JobStatusUpdater issues, as fixed texts behind the clients'
+# typed job methods (insert_job, advance_job, merge_job_step, get_job): a
+# job call goes straight to the connection's cached prepared statement
+# without building SQL from a dict
+JOBS_TABLE = "saas_edge_jobs"
+
+# insert_job() takes values in this order
+JOB_COLUMNS = (
+    "job_id", "job_name", "job_type", "job_status", "saas_edge_id",
+    "request_args", "job_response", "metrics", "created_at", "updated_at",
+)
+
+INSERT_JOB_SQL = insert_sql(JOBS_TABLE, JOB_COLUMNS, returning=False)
+
+# Job state transition through the saas_edge_job_advance() SQL function
+# (job_id, status, step or NULL, response or NULL); yields the updated row
+ADVANCE_JOB_SQL = "SELECT * FROM saas_edge_job_advance($1, $2, $3, $4)"
+
+# ('{steps}', metrics, updated_at, job_id)
+MERGE_JOB_STEP_SQL = jsonb_merge_last_sql(JOBS_TABLE, "metrics.steps", ("updated_at",), ("job_id",))
+
+SELECT_JOB_SQL = select_sql(JOBS_TABLE, ("job_id",))
+
+# Prepared on every new pooled connection (see pool._init_connection)
+JOB_STATEMENTS = (
+    INSERT_JOB_SQL,
+    ADVANCE_JOB_SQL,
+    MERGE_JOB_STEP_SQL,
+    SELECT_JOB_SQL,
+)
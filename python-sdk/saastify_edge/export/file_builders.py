@@ -11,12 +11,70 @@ Supports:
 
 import csv
 import json
-from typing import List, Dict, Any, Optional
+from functools import partial
+from itertools import chain, islice
+from typing import (
+    Any, AsyncIterable, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, TextIO, Tuple
+)
 from pathlib import Path
+from xml.sax.saxutils import escape
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xlsxwriter
+    XLSXWRITER_AVAILABLE = True
+except ImportError:
+    XLSXWRITER_AVAILABLE = False
+
+try:
+    from openpyxl import Workbook
+    OPENPYXL_AVAILABLE = True
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Write buffer for streamed text formats; rows are coalesced into few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# xlsxwriter workbook options: stream rows, and write cells the way the
+# openpyxl path does (dates formatted as dates, URLs as plain strings)
+XLSXWRITER_OPTIONS = {
+    "constant_memory": True,
+    "use_zip64": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    "strings_to_urls": False,
+}
+
+# Rows converted to one Arrow record batch by the pyarrow CSV engine
+ARROW_BATCH_ROWS = 65536
+
+# csv quoting constants as Arrow CSV quoting styles
+_ARROW_QUOTING = {
+    csv.QUOTE_MINIMAL: "needed",
+    csv.QUOTE_ALL: "all_valid",
+    csv.QUOTE_NONE: "none",
+}
+
+
+def _reject_extra_fields(row: Dict[str, Any], fieldnames: FrozenSet[str]) -> None:
+    """Raise like csv.DictWriter does for a row with keys outside the header."""
+    extra = ", ".join(repr(key) for key in row if key not in fieldnames)
+    raise ValueError(f"dict contains fields not in fieldnames: {extra}")
+
 
 class FileBuilderError(Exception):
     """Base exception for file building errors."""
@@ -51,59 +109,185 @@ class CSVFileBuilder(FileBuilder):
 
     def build_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Build CSV file.
         
+        Rows are written as they are iterated, so data can be a generator
+        and memory stays flat regardless of row count.
+        
+        Without configured columns the header is the first row's keys, and
+        a later row with a key outside it fails the build (as
+        csv.DictWriter does); with columns, other keys are left out.
+        
+        engine="pyarrow" writes batches of rows with Arrow's C++ CSV writer
+        instead (much faster for large, flat, consistently typed rows).
+        Its formatting differs from the csv module's: strings are always
+        quoted, booleans are written true/false and whole floats without
+        ".0". Falls back to the csv module when pyarrow is not installed.
+        
         Args:
-            data: List of row dictionaries
+            data: Row dictionaries (list or any iterable)
             output_path: Output file path
-            config: Optional config (delimiter, headers, quoting)
+            config: Optional config (delimiter, headers, quoting, columns,
+                engine="python" or "pyarrow")
             
         Returns:
             Path to created file
         """
         config = config or {}
-        delimiter = config.get("delimiter", ",")
-        include_headers = config.get("include_headers", True)
-        quoting = config.get("quoting", csv.QUOTE_MINIMAL)
-
-        if not data:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             raise FileBuilderError("No data to export")
 
         try:
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                # Get all unique field names
-                fieldnames = list(data[0].keys()) if data else []
-
-                writer = csv.DictWriter(
-                    f,
-                    fieldnames=fieldnames,
-                    delimiter=delimiter,
-                    quoting=quoting,
-                )
+            if config.get("engine") == "pyarrow" and PYARROW_AVAILABLE:
+                row_count = self._write_arrow(chain((first,), rows), output_path, first, config)
+                logger.info(f"Created CSV file with {row_count} rows: {output_path}")
+                return output_path
+
+            with open(output_path, "w", newline="", encoding="utf-8",
+                      buffering=WRITE_BUFFER_SIZE) as f:
+                writer, fieldnames, allowed = self._start(f, first, config)
+                writer.writerow([first.get(c) for c in fieldnames])
+                row_count = 1
+                for row in rows:
+                    if allowed is not None and not row.keys() <= allowed:
+                        _reject_extra_fields(row, allowed)
+                    writer.writerow([row.get(c) for c in fieldnames])
+                    row_count += 1
+
+            logger.info(f"Created CSV file with {row_count} rows: {output_path}")
+            return output_path
 
-                if include_headers:
-                    writer.writeheader()
+        except Exception as e:
+            raise FileBuilderError(f"CSV file creation failed: {e}")
 
-                writer.writerows(data)
+    async def build_file_async(
+        self,
+        data: AsyncIterable[Dict[str, Any]],
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build CSV file from an async row stream (e.g. db_client.iter_many()).
+        
+        Rows are written as they arrive, so the file is being written
+        while the query is still producing rows.
+        
+        Args:
+            data: Async iterable of row dictionaries
+            output_path: Output file path
+            config: Optional config (delimiter, headers, quoting, columns)
+            
+        Returns:
+            Path to created file
+        """
+        rows = data.__aiter__()
+        try:
+            first = await rows.__anext__()
+        except StopAsyncIteration:
+            raise FileBuilderError("No data to export")
 
-            logger.info(f"Created CSV file with {len(data)} rows: {output_path}")
+        try:
+            with open(output_path, "w", newline="", encoding="utf-8",
+                      buffering=WRITE_BUFFER_SIZE) as f:
+                writer, fieldnames, allowed = self._start(f, first, config or {})
+                writer.writerow([first.get(c) for c in fieldnames])
+                row_count = 1
+                async for row in rows:
+                    if allowed is not None and not row.keys() <= allowed:
+                        _reject_extra_fields(row, allowed)
+                    writer.writerow([row.get(c) for c in fieldnames])
+                    row_count += 1
+
+            logger.info(f"Created CSV file with {row_count} rows: {output_path}")
             return output_path
 
         except Exception as e:
             raise FileBuilderError(f"CSV file creation failed: {e}")
 
+    def _start(
+        self,
+        f: TextIO,
+        first: Dict[str, Any],
+        config: Dict[str, Any],
+    ) -> Tuple[Any, List[str], Optional[FrozenSet[str]]]:
+        """
+        Create the writer and write the header.
+        
+        Returns (writer, fieldnames, allowed), where allowed is the set of
+        keys rows may have, or None when configured columns select them.
+        """
+        # Configured columns select and order fields; otherwise the first
+        # row's keys do, and keys missing from a row are written empty
+        columns = config.get("columns")
+        fieldnames = list(columns) if columns else list(first.keys())
+        allowed = None if columns else frozenset(fieldnames)
+
+        writer = csv.writer(
+            f,
+            delimiter=config.get("delimiter", ","),
+            quoting=config.get("quoting", csv.QUOTE_MINIMAL),
+        )
+
+        if config.get("include_headers", True):
+            writer.writerow(fieldnames)
+
+        return writer, fieldnames, allowed
+
+    def _write_arrow(
+        self,
+        rows: Iterator[Dict[str, Any]],
+        output_path: str,
+        first: Dict[str, Any],
+        config: Dict[str, Any],
+    ) -> int:
+        """Write rows with pyarrow's CSV writer, a record batch at a time."""
+        columns = config.get("columns")
+        fieldnames = list(columns) if columns else list(first.keys())
+        allowed = None if columns else frozenset(fieldnames)
+        batches = iter(lambda: list(islice(rows, ARROW_BATCH_ROWS)), [])
+
+        # Column types come from the first batch; all-null columns are
+        # written as strings
+        first_batch = next(batches)
+        inferred = pa.Table.from_pylist(first_batch).schema
+        schema = pa.schema([
+            (name, inferred.field(name).type
+             if name in inferred.names and not pa.types.is_null(inferred.field(name).type)
+             else pa.string())
+            for name in fieldnames
+        ])
+
+        write_options = pa_csv.WriteOptions(
+            include_header=config.get("include_headers", True),
+            delimiter=config.get("delimiter", ","),
+            quoting_style=_ARROW_QUOTING[config.get("quoting", csv.QUOTE_MINIMAL)],
+        )
+
+        row_count = 0
+        with pa_csv.CSVWriter(output_path, schema, write_options=write_options) as writer:
+            for batch in chain((first_batch,), batches):
+                if allowed is not None:
+                    for row in batch:
+                        if not row.keys() <= allowed:
+                            _reject_extra_fields(row, allowed)
+                writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+                row_count += len(batch)
+        return row_count
+
 
 class TSVFileBuilder(FileBuilder):
     """Build TSV files."""
 
     def build_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
     ) -> str:
@@ -111,7 +295,7 @@ class TSVFileBuilder(FileBuilder):
         Build TSV file.
         
         Args:
-            data: List of row dictionaries
+            data: Row dictionaries (list or any iterable)
             output_path: Output file path
             config: Optional config (headers, quoting)
             
@@ -125,31 +309,55 @@ class TSVFileBuilder(FileBuilder):
         csv_builder = CSVFileBuilder()
         return csv_builder.build_file(data, output_path, config)
 
+    async def build_file_async(
+        self,
+        data: AsyncIterable[Dict[str, Any]],
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build TSV file from an async row stream.
+        
+        Args:
+            data: Async iterable of row dictionaries
+            output_path: Output file path
+            config: Optional config (headers, quoting)
+            
+        Returns:
+            Path to created file
+        """
+        config = config or {}
+        config["delimiter"] = "\t"
+        
+        csv_builder = CSVFileBuilder()
+        return await csv_builder.build_file_async(data, output_path, config)
+
 
 class XLSXFileBuilder(FileBuilder):
     """Build Excel (XLSX) files."""
 
     def build_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Build XLSX file.
         
+        Rows are streamed into the sheet a row at a time, with xlsxwriter in
+        constant-memory mode when installed, otherwise openpyxl's
+        write-only workbook; neither keeps a grid of cells in memory.
+        
         Args:
-            data: List of row dictionaries
+            data: Row dictionaries (list or any iterable)
             output_path: Output file path
             config: Optional config (sheet_name, include_headers)
             
         Returns:
             Path to created file
         """
-        try:
-            import openpyxl
-            from openpyxl import Workbook
-        except ImportError:
+        if not (XLSXWRITER_AVAILABLE or OPENPYXL_AVAILABLE):
             raise FileBuilderError(
                 "openpyxl not installed. Install with: pip install openpyxl"
             )
@@ -158,89 +366,218 @@ class XLSXFileBuilder(FileBuilder):
         sheet_name = config.get("sheet_name", "Products")
         include_headers = config.get("include_headers", True)
 
-        if not data:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             raise FileBuilderError("No data to export")
 
-        try:
-            wb = Workbook()
-            ws = wb.active
-            ws.title = sheet_name
-
-            # Get field names
-            fieldnames = list(data[0].keys())
+        # Get field names
+        fieldnames = list(first.keys())
+        values = (
+            [row.get(c) for c in fieldnames]
+            for row in chain((first,), rows)
+        )
+        if include_headers:
+            values = chain((fieldnames,), values)
 
-            # Write headers
-            if include_headers:
-                for col_idx, fieldname in enumerate(fieldnames, start=1):
-                    ws.cell(row=1, column=col_idx, value=fieldname)
-                start_row = 2
+        try:
+            if XLSXWRITER_AVAILABLE:
+                row_count = self._write_xlsxwriter(values, output_path, sheet_name)
             else:
-                start_row = 1
-
-            # Write data rows
-            for row_idx, row_data in enumerate(data, start=start_row):
-                for col_idx, fieldname in enumerate(fieldnames, start=1):
-                    value = row_data.get(fieldname)
-                    ws.cell(row=row_idx, column=col_idx, value=value)
+                row_count = self._write_openpyxl(values, output_path, sheet_name)
+            if include_headers:
+                row_count -= 1
 
-            wb.save(output_path)
-            logger.info(f"Created XLSX file with {len(data)} rows: {output_path}")
+            logger.info(f"Created XLSX file with {row_count} rows: {output_path}")
             return output_path
 
         except Exception as e:
             raise FileBuilderError(f"XLSX file creation failed: {e}")
 
+    def _write_xlsxwriter(
+        self,
+        values: Iterable[List[Any]],
+        output_path: str,
+        sheet_name: str,
+    ) -> int:
+        """Write rows with xlsxwriter, flushing each row as it is written."""
+        wb = xlsxwriter.Workbook(output_path, XLSXWRITER_OPTIONS)
+        try:
+            ws = wb.add_worksheet(sheet_name)
+            row_count = 0
+            for row_idx, row_values in enumerate(values):
+                ws.write_row(row_idx, 0, row_values)
+                row_count += 1
+        finally:
+            wb.close()
+        return row_count
+
+    def _write_openpyxl(
+        self,
+        values: Iterable[List[Any]],
+        output_path: str,
+        sheet_name: str,
+    ) -> int:
+        """Write rows with an openpyxl write-only workbook."""
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        row_count = 0
+        for row_values in values:
+            ws.append(row_values)
+            row_count += 1
+        wb.save(output_path)
+        return row_count
+
 
 class JSONFileBuilder(FileBuilder):
     """Build JSON files."""
 
     def build_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
     ) -> str:
         """
         Build JSON file.
         
+        Rows are serialized and written one at a time (orjson when
+        installed), so data can be a generator and no document-sized
+        string is built.
+        
         Args:
-            data: List of row dictionaries
+            data: Row dictionaries (list or any iterable)
             output_path: Output file path
-            config: Optional config (indent, format='array' or 'ndjson')
+            config: Optional config (indent, format='array' or 'ndjson').
+                Pass indent=None for compact output.
             
         Returns:
             Path to created file
         """
-        config = config or {}
-        indent = config.get("indent", 2)
-        json_format = config.get("format", "array")  # 'array' or 'ndjson'
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
+            raise FileBuilderError("No data to export")
+
+        try:
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                encode, head, sep, tail = self._layout(config or {})
+                f.write(head)
+                f.write(encode(first))
+                row_count = 1
+                for row in rows:
+                    f.write(sep)
+                    f.write(encode(row))
+                    row_count += 1
+                f.write(tail)
+
+            logger.info(f"Created JSON file with {row_count} rows: {output_path}")
+            return output_path
+
+        except Exception as e:
+            raise FileBuilderError(f"JSON file creation failed: {e}")
 
-        if not data:
+    async def build_file_async(
+        self,
+        data: AsyncIterable[Dict[str, Any]],
+        output_path: str,
+        config: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build JSON file from an async row stream (e.g. db_client.iter_many()).
+        
+        Args:
+            data: Async iterable of row dictionaries
+            output_path: Output file path
+            config: Optional config (as in build_file)
+            
+        Returns:
+            Path to created file
+        """
+        rows = data.__aiter__()
+        try:
+            first = await rows.__anext__()
+        except StopAsyncIteration:
             raise FileBuilderError("No data to export")
 
         try:
-            with open(output_path, "w", encoding="utf-8") as f:
-                if json_format == "ndjson":
-                    # Newline-delimited JSON
-                    for row in data:
-                        f.write(json.dumps(row, ensure_ascii=False) + "\n")
-                else:
-                    # Standard JSON array
-                    json.dump(data, f, indent=indent, ensure_ascii=False)
-
-            logger.info(f"Created JSON file with {len(data)} rows: {output_path}")
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                encode, head, sep, tail = self._layout(config or {})
+                f.write(head)
+                f.write(encode(first))
+                row_count = 1
+                async for row in rows:
+                    f.write(sep)
+                    f.write(encode(row))
+                    row_count += 1
+                f.write(tail)
+
+            logger.info(f"Created JSON file with {row_count} rows: {output_path}")
             return output_path
 
         except Exception as e:
             raise FileBuilderError(f"JSON file creation failed: {e}")
 
+    def _layout(
+        self,
+        config: Dict[str, Any],
+    ) -> Tuple[Callable[[Dict[str, Any]], bytes], bytes, bytes, bytes]:
+        """
+        Row encoder and the bytes written before, between and after rows.
+        
+        The output is byte-for-byte what serializing the whole list at once
+        would give: an indented row has its lines shifted one level in.
+        """
+        json_format = config.get("format", "array")  # 'array' or 'ndjson'
+        indent = None if json_format == "ndjson" else config.get("indent", 2)
+
+        # Drop the default ", "/": " padding when not pretty-printing
+        separators = None if indent else (",", ":")
+
+        def json_dumps(row: Dict[str, Any]) -> bytes:
+            return json.dumps(
+                row, indent=indent or None, separators=separators, ensure_ascii=False
+            ).encode("utf-8")
+
+        dumps = json_dumps
+
+        # orjson only supports two-space indentation
+        if ORJSON_AVAILABLE and indent in (None, 0, 2):
+            orjson_dumps = partial(
+                orjson.dumps,
+                option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0),
+            )
+
+            def dumps(row: Dict[str, Any]) -> bytes:
+                try:
+                    return orjson_dumps(row)
+                except orjson.JSONEncodeError:
+                    # Values orjson rejects but json writes (e.g. integers
+                    # beyond 64 bits) go through the stdlib encoder
+                    return json_dumps(row)
+
+        if json_format == "ndjson":
+            # Newline-delimited JSON
+            return dumps, b"", b"\n", b"\n"
+        if not indent:
+            return dumps, b"[", b",", b"]"
+
+        # JSON strings never hold a raw newline, so every one in an
+        # encoded row is a line break
+        pad = b"\n" + b" " * indent
+
+        def encode(row: Dict[str, Any]) -> bytes:
+            return dumps(row).replace(b"\n", pad)
+
+        return encode, b"[" + pad, b"," + pad, b"\n]"
+
 
 class XMLFileBuilder(FileBuilder):
     """Build XML files."""
 
     def build_file(
         self,
-        data: List[Dict[str, Any]],
+        data: Iterable[Dict[str, Any]],
         output_path: str,
         config: Optional[Dict[str, Any]] = None,
     ) -> str:
@@ -248,48 +585,51 @@ class XMLFileBuilder(FileBuilder):
         Build XML file.
         
         Args:
-            data: List of row dictionaries
+            data: Row dictionaries (list or any iterable)
             output_path: Output file path
             config: Optional config (root_tag, row_tag)
             
         Returns:
             Path to created file
         """
-        try:
-            import xml.etree.ElementTree as ET
-        except ImportError:
-            raise FileBuilderError("xml.etree.ElementTree not available")
-
         config = config or {}
         root_tag = config.get("root_tag", "products")
         row_tag = config.get("row_tag", "product")
 
-        if not data:
+        rows = iter(data)
+        first = next(rows, None)
+        if first is None:
             raise FileBuilderError("No data to export")
 
         try:
-            # Create root element
-            root = ET.Element(root_tag)
-
-            # Add data rows
-            for row_data in data:
-                row_element = ET.SubElement(root, row_tag)
-                
-                for key, value in row_data.items():
-                    field_element = ET.SubElement(row_element, str(key))
-                    field_element.text = str(value) if value is not None else ""
-
-            # Create tree and write
-            tree = ET.ElementTree(root)
-            ET.indent(tree, space="  ")  # Pretty print (Python 3.9+)
-            tree.write(output_path, encoding="utf-8", xml_declaration=True)
-
-            logger.info(f"Created XML file with {len(data)} rows: {output_path}")
+            # Stream elements straight to disk so memory stays flat
+            # regardless of row count. Each row is formatted as one string
+            # (the markup XMLGenerator would emit, escaped the same way)
+            # rather than through a SAX call per tag.
+            open_row = f"\n  <{row_tag}>"
+            close_row = f"\n  </{row_tag}>"
+            row_count = 0
+
+            with open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+                f.write(f'<?xml version="1.0" encoding="utf-8"?>\n<{root_tag}>')
+                for row_data in chain((first,), rows):
+                    f.write(open_row + "".join(self._fields(row_data)) + close_row)
+                    row_count += 1
+                f.write(f"\n</{root_tag}>")
+
+            logger.info(f"Created XML file with {row_count} rows: {output_path}")
             return output_path
 
         except Exception as e:
             raise FileBuilderError(f"XML file creation failed: {e}")
 
+    @staticmethod
+    def _fields(row_data: Dict[str, Any]) -> Iterator[str]:
+        """Field elements of one row; empty values become <tag/>."""
+        for key, value in row_data.items():
+            text = "" if value is None else escape(str(value))
+            yield f"\n    <{key}>{text}</{key}>" if text else f"\n    <{key}/>"
+
 
 class FileBuilderFactory:
     """Factory to create appropriate file builder based on format."""
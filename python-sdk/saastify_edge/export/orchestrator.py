@@ -28,6 +28,9 @@ from .file_builders import FileBuilderFactory
 
 logger = logging.getLogger(__name__)
 
+# Pipeline for fields the template doesn't define: no rule, no validations
+_NO_PIPELINE = (None, [])
+
 
 class ExportPipelineConfig:
     """Configuration for export pipeline."""
@@ -73,6 +76,7 @@ class ExportPipeline:
         
         self.job_id: Optional[str] = None
         self.template = None
+        self.field_pipelines: Dict[str, Any] = {}
         self.products: List[Dict[str, Any]] = []
 
     async def run(self) -> Dict[str, Any]:
@@ -156,6 +160,7 @@ class ExportPipeline:
             template_id=self.config.template_id,
             saas_edge_id=self.config.saas_edge_id,
         )
+        self.field_pipelines = self.template_mapper.build_field_pipelines(self.template)
 
     async def _fetch_products(self) -> None:
         """Stage 3: Fetch products from database."""
@@ -214,6 +219,7 @@ class ExportPipeline:
 
         transformed_products = []
         completeness_records = []
+        field_pipelines = self.field_pipelines
 
         for product in self.products:
             # Check cache first if enabled
@@ -237,20 +243,8 @@ class ExportPipeline:
 
             transformed_data = {}
             for field_name, raw_value in mapped_data.items():
-                transformations = self.template_mapper.get_transformation_pipeline(
-                    template=self.template,
-                    field_name=field_name,
-                )
-                
-                if transformations:
-                    rule_parts = []
-                    for trans in transformations:
-                        if trans.args:
-                            args_str = "|".join(str(v) for v in trans.args.values())
-                            rule_parts.append(f"{trans.operation}|{args_str}")
-                        else:
-                            rule_parts.append(trans.operation)
-                    rule_string = " + ".join(rule_parts)
+                rule_string, _ = field_pipelines.get(field_name, _NO_PIPELINE)
+                if rule_string:
                     transformed_value = apply_transformations(raw_value, rule_string)
                 else:
                     transformed_value = raw_value
@@ -260,10 +254,7 @@ class ExportPipeline:
             # Validate
             validation_errors = {}
             for field_name, value in transformed_data.items():
-                validation_rules = self.template_mapper.get_validation_rules(
-                    template=self.template,
-                    field_name=field_name,
-                )
+                _, validation_rules = field_pipelines.get(field_name, _NO_PIPELINE)
                 
                 for rule in validation_rules:
                     error = validate_field(
@@ -29,6 +29,9 @@ from .batch_processor import BatchProcessor, BatchConfig
 
 logger = logging.getLogger(__name__)
 
+# Pipeline for fields the template doesn't define: no rule, no validations
+_NO_PIPELINE = (None, [])
+
 
 class ImportPipelineConfig:
     """Configuration for import pipeline."""
@@ -77,6 +80,7 @@ class ImportPipeline:
         
         self.job_id: Optional[str] = None
         self.template = None
+        self.field_pipelines: Dict[str, Any] = {}
         self.local_file_path: Optional[str] = None
 
     async def run(self) -> Dict[str, Any]:
@@ -172,6 +176,7 @@ class ImportPipeline:
             template_id=self.config.template_id,
             saas_edge_id=self.config.saas_edge_id,
         )
+        self.field_pipelines = self.template_mapper.build_field_pipelines(self.template)
 
         await self.job_manager.update_status(
             job_id=self.job_id,
@@ -217,6 +222,7 @@ class ImportPipeline:
         errors = []
 
         completeness_records = []
+        field_pipelines = self.field_pipelines
 
         for row_idx, raw_row in enumerate(batch_data):
             try:
@@ -226,25 +232,11 @@ class ImportPipeline:
                     template=self.template,
                 )
 
-                # Transform fields
+                # Transform fields (rule strings precomputed per field)
                 transformed_data = {}
                 for field_name, raw_value in mapped_data.items():
-                    transformations = self.template_mapper.get_transformation_pipeline(
-                        template=self.template,
-                        field_name=field_name,
-                    )
-                    
-                    # Convert transformation steps to rule strings
-                    if transformations:
-                        rule_parts = []
-                        for trans in transformations:
-                            if trans.args:
-                                # Format with args: "operation|arg1|arg2"
-                                args_str = "|".join(str(v) for v in trans.args.values())
-                                rule_parts.append(f"{trans.operation}|{args_str}")
-                            else:
-                                rule_parts.append(trans.operation)
-                        rule_string = " + ".join(rule_parts)
+                    rule_string, _ = field_pipelines.get(field_name, _NO_PIPELINE)
+                    if rule_string:
                         transformed_value = apply_transformations(raw_value, rule_string)
                     else:
                         transformed_value = raw_value
@@ -254,10 +246,7 @@ class ImportPipeline:
                 # Validate fields
                 validation_errors = {}
                 for field_name, value in transformed_data.items():
-                    validation_rules = self.template_mapper.get_validation_rules(
-                        template=self.template,
-                        field_name=field_name,
-                    )
+                    _, validation_rules = field_pipelines.get(field_name, _NO_PIPELINE)
                     
                     for rule in validation_rules:
                         error = validate_field(
@@ -8,7 +8,7 @@ Handles:
 - Validation rule configuration
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from ..core.types import (
     ChannelTemplate,
     AttributeDefinition,
@@ -16,6 +16,9 @@ from ..core.types import (
     ValidationRule,
 )
 
+# Row layouts remembered by map_row_to_fields before the cache is reset
+MAX_ROW_PLANS = 256
+
 
 class TemplateMapper:
     """Maps raw data columns to template fields with transformation/validation configs."""
@@ -29,6 +32,11 @@ class TemplateMapper:
         """
         self.db_client = db_client
         self._template_cache: Dict[str, ChannelTemplate] = {}
+        # (id(template), row keys) -> (template, ((field_name, row key), ...))
+        self._row_plans: Dict[
+            Tuple[int, Tuple[str, ...]],
+            Tuple[ChannelTemplate, Tuple[Tuple[str, Optional[str]], ...]],
+        ] = {}
 
     async def load_template(self, template_id: str, saas_edge_id: str) -> ChannelTemplate:
         """
@@ -218,22 +226,38 @@ class TemplateMapper:
         Returns:
             Mapped field data (attribute_name -> raw_value)
         """
-        mapped_data = {}
+        # Feeds keep one column layout for all (or most) rows, so the
+        # case-insensitive column match is resolved once per layout and
+        # each row is then a plain key lookup per field
+        keys = tuple(raw_row)
+        cache_key = (id(template), keys)
+        entry = self._row_plans.get(cache_key)
+        if entry is None or entry[0] is not template:
+            if len(self._row_plans) >= MAX_ROW_PLANS:
+                self._row_plans.clear()
+            entry = (template, self._build_row_plan(template, keys))
+            self._row_plans[cache_key] = entry
         
-        for attribute in template.attributes:
-            column_name = attribute.column_name
-            field_name = attribute.name
-            
-            # Get value from raw row (case-insensitive match)
-            raw_value = None
-            for col_key, col_value in raw_row.items():
-                if col_key.lower() == column_name.lower():
-                    raw_value = col_value
-                    break
-            
-            mapped_data[field_name] = raw_value
+        get = raw_row.get
+        return {
+            field_name: get(key) if key is not None else None
+            for field_name, key in entry[1]
+        }
+
+    @staticmethod
+    def _build_row_plan(
+        template: ChannelTemplate,
+        keys: Tuple[str, ...],
+    ) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """Resolve each attribute to the first row key matching its column (case-insensitive)."""
+        lowered: Dict[str, str] = {}
+        for key in keys:
+            lowered.setdefault(key.lower(), key)
         
-        return mapped_data
+        return tuple(
+            (attribute.name, lowered.get(attribute.column_name.lower()))
+            for attribute in template.attributes
+        )
 
     def get_transformation_pipeline(
         self,
@@ -257,6 +281,46 @@ class TemplateMapper:
                 return attribute.validations
         return []
 
+    def build_field_pipelines(
+        self,
+        template: ChannelTemplate,
+    ) -> Dict[str, Tuple[Optional[str], List[ValidationRule]]]:
+        """
+        Precompute each field's DSL rule string and validation rules.
+        
+        Lets row loops resolve a field with one dict lookup instead of
+        scanning the template attributes and rebuilding the rule string
+        for every row.
+        
+        Args:
+            template: Channel template with attribute definitions
+            
+        Returns:
+            Mapping of field_name -> (rule_string or None, validation_rules)
+        """
+        pipelines: Dict[str, Tuple[Optional[str], List[ValidationRule]]] = {}
+        
+        for attribute in template.attributes:
+            # First definition wins, matching get_transformation_pipeline()
+            if attribute.name in pipelines:
+                continue
+            
+            rule_string = None
+            if attribute.transformations:
+                rule_parts = []
+                for trans in attribute.transformations:
+                    if trans.args:
+                        # Format with args: "operation|arg1|arg2"
+                        args_str = "|".join(str(v) for v in trans.args.values())
+                        rule_parts.append(f"{trans.operation}|{args_str}")
+                    else:
+                        rule_parts.append(trans.operation)
+                rule_string = " + ".join(rule_parts)
+            
+            pipelines[attribute.name] = (rule_string, attribute.validations)
+        
+        return pipelines
+
     def get_required_fields(self, template: ChannelTemplate) -> List[str]:
         """Get list of required field names."""
         return [attr.name for attr in template.attributes if attr.is_required]
@@ -268,3 +332,4 @@ class TemplateMapper:
     def clear_cache(self) -> None:
         """Clear template cache (useful for testing or cache invalidation)."""
         self._template_cache.clear()
+        self._row_plans.clear()
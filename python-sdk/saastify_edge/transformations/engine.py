@@ -6,11 +6,16 @@ Supports both structured pipeline definitions and DSL string format.
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import Any, List, Dict, Optional, Tuple, Callable
 from ..core.types import TransformationStep, RejectRow
 from . import operations
 from . import advanced_operations as adv
 
+# vlookup values that look like decimals are coerced to float
+_FLOAT_RE = re.compile(r'^-?\d+\.\d+$')
+
 
 # Build the transformation registry - ALL 85 OPERATIONS
 TRANSFORMS: Dict[str, Callable] = {
@@ -256,15 +261,20 @@ def bulk_apply_pipe_rules(
     return results
 
 
-def _parse_dsl_rule(rule: str) -> List[TransformationStep]:
+@lru_cache(maxsize=1024)
+def _parse_dsl_rule(rule: str) -> Tuple[TransformationStep, ...]:
     """
     Parse a DSL rule string into transformation steps.
     
+    Results are memoized per rule string, so a rule broadcast over many
+    values (or reused across calls) is only parsed once. The returned
+    steps are shared between callers and must not be mutated.
+    
     Args:
         rule: DSL rule string (e.g., "uppercase + strip + replace|old|new")
     
     Returns:
-        List of TransformationStep dictionaries
+        Tuple of TransformationStep dictionaries
     """
     steps: List[TransformationStep] = []
     
@@ -340,16 +350,18 @@ def _parse_dsl_rule(rule: str) -> List[TransformationStep]:
                 k, v = pair.split(':', 1)
                 v = v.strip()
                 # Type coercion for values
-                if v.lower() == "true":
+                lowered = v.lower()
+                if lowered == "true":
                     v = True
-                elif v.lower() == "false":
+                elif lowered == "false":
                     v = False
-                elif re.match(r'^-?\d+\.\d+$', v):
+                elif _FLOAT_RE.match(v):
                     v = float(v)
                 elif v.isdigit():
                     v = int(v)
                 
-                mapping[k.strip().lower()] = v
+                # Interned so identical keys across cached rules share one object
+                mapping[sys.intern(k.strip().lower())] = v
             
             steps.append({"name": "vlookup_map", "params": {"mapping": mapping}})
             continue
@@ -389,4 +401,4 @@ def _parse_dsl_rule(rule: str) -> List[TransformationStep]:
             # Simple operation without parameters
             steps.append({"name": token})
     
-    return steps
+    return tuple(steps)
@@ -10,6 +10,20 @@ from datetime import datetime, date
 from typing import Any, Optional, List, Union, Dict
 from ..core.types import RejectRow
 
+# Deletion tables for the digit scrubbers' ASCII fast path (bytes.translate
+# is a single C loop, no regex engine); non-ASCII input keeps re's Unicode \d
+_NON_DIGIT_BYTES = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+_NON_NUMERIC_BYTES = bytes(c for c in range(256) if not (0x30 <= c <= 0x39 or c == 0x2E))
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_NON_NUMERIC_RE = re.compile(r'[^\d.]')
+
+
+def _keep_chars(v: str, delete: bytes, pattern: "re.Pattern[str]") -> str:
+    """Drop every character not kept by the deletion table / pattern"""
+    if v.isascii():
+        return v.encode('ascii').translate(None, delete).decode('ascii')
+    return pattern.sub('', v)
+
 
 # ─── Text Operations ────────────────────────────────────────────────────────
 
@@ -92,7 +106,7 @@ def clean_html(v: Any, **kw) -> Any:
 
 def clean_upc(v: Any, **kw) -> Any:
     """Remove non-numeric characters from UPC"""
-    return re.sub(r'[^\d]', '', v) if isinstance(v, str) else v
+    return _keep_chars(v, _NON_DIGIT_BYTES, _NON_DIGIT_RE) if isinstance(v, str) else v
 
 
 # ─── Numeric Operations ─────────────────────────────────────────────────────
@@ -101,7 +115,7 @@ def clean_numeric_value(v: Any, **kw) -> Any:
     """Remove non-numeric characters from text and parse number"""
     if isinstance(v, str):
         try:
-            return float(re.sub(r'[^\d.]', '', v))
+            return float(_keep_chars(v, _NON_NUMERIC_BYTES, _NON_NUMERIC_RE))
         except ValueError:
             return v
     return v
@@ -195,14 +195,13 @@ async def get_or_generate_template_schema(
     # Generate schema
     generated_schema = generate_json_schema(template_attrs)
     
-    # Save to database
-    schema_json = json.dumps(generated_schema)
+    # Save to database (the jsonb codec serializes the dict)
     await db_client.insert(
         "saas_template_schema",
         {
             "saas_edge_id": saas_edge_id,
             "template_id": template_id,
-            "schema": schema_json
+            "schema": generated_schema
         },
         on_conflict="(saas_edge_id, template_id) DO UPDATE SET schema = EXCLUDED.schema, updated_at = CURRENT_TIMESTAMP"
     )
@@ -2,12 +2,13 @@
 Validation engine and rules
 """
 
-from .engine import validate_field, validate_row, validate_batch
+from .engine import validate_field, validate_row, validate_batch, compile_validations
 from .rules import VALIDATION_RULES
 
 __all__ = [
     "validate_field",
     "validate_row",
     "validate_batch",
+    "compile_validations",
     "VALIDATION_RULES",
 ]
\ No newline at end of file
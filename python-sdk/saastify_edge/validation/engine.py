@@ -4,7 +4,7 @@ Validation Engine
 Applies validation rules to transformed data.
 """
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from ..core.types import ValidationRule, ValidationError
 from .rules import VALIDATION_RULES
 
@@ -89,6 +89,75 @@ def validate_row(
     return is_valid, all_errors, error_count
 
 
+RowValidator = Callable[
+    [Dict[str, Any]], Tuple[bool, Dict[str, List[ValidationError]], int]
+]
+
+
+def compile_validations(
+    field_validations: Dict[str, List[ValidationRule]]
+) -> RowValidator:
+    """
+    Compile field validations into a reusable row validator.
+    
+    Rule names are resolved against VALIDATION_RULES once, up front, so
+    each call only runs the validators. Use this when the same rules are
+    applied to many rows.
+    
+    Args:
+        field_validations: Dictionary mapping field names to their validation rules
+    
+    Returns:
+        Callable taking row data and returning the same
+        (is_valid, validation_errors_by_field, error_count) tuple as validate_row
+    """
+    compiled: List[Tuple[str, List[Tuple[Any, Any, Dict[str, Any]]]]] = []
+    
+    for field_name, rules in field_validations.items():
+        if not rules:
+            continue
+        
+        field_rules = []
+        for rule in rules:
+            rule_name = rule.get("rule")
+            field_rules.append(
+                (rule_name, VALIDATION_RULES.get(rule_name), rule.get("args", {}))
+            )
+        compiled.append((field_name, field_rules))
+    
+    def validate(
+        row_data: Dict[str, Any]
+    ) -> Tuple[bool, Dict[str, List[ValidationError]], int]:
+        all_errors: Dict[str, List[ValidationError]] = {}
+        error_count = 0
+        
+        for field_name, field_rules in compiled:
+            value = row_data.get(field_name)
+            field_errors: List[ValidationError] = []
+            
+            for rule_name, validator, rule_args in field_rules:
+                if validator is None:
+                    error_message = f"Unknown validation rule: {rule_name}"
+                else:
+                    error_message = validator(value, rule_args, row_data)
+                
+                if error_message:
+                    field_errors.append({
+                        "field": field_name,
+                        "rule": rule_name,
+                        "message": error_message,
+                        "value": value
+                    })
+            
+            if field_errors:
+                all_errors[field_name] = field_errors
+                error_count += len(field_errors)
+        
+        return error_count == 0, all_errors, error_count
+    
+    return validate
+
+
 def validate_batch(
     rows: List[Dict[str, Any]],
     field_validations: Dict[str, List[ValidationRule]]
@@ -103,10 +172,6 @@ def validate_batch(
     Returns:
         List of (is_valid, validation_errors, error_count) tuples for each row
     """
-    results = []
-    
-    for row in rows:
-        result = validate_row(row, field_validations)
-        results.append(result)
+    validate = compile_validations(field_validations)
     
-    return results
+    return [validate(row) for row in rows]
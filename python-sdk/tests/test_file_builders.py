@@ -0,0 +1,308 @@
+"""
+Tests for the streaming export file builders.
+"""
+
+import csv
+import json
+import os
+import tempfile
+from datetime import datetime
+
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+    # Mock pytest.mark.asyncio decorator
+    class MockPytest:
+        class mark:
+            @staticmethod
+            def asyncio(func):
+                return func
+    pytest = MockPytest()
+
+from saastify_edge.export import file_builders
+from saastify_edge.export.file_builders import (
+    CSVFileBuilder,
+    FileBuilderError,
+    JSONFileBuilder,
+    TSVFileBuilder,
+    XLSXFileBuilder,
+    XMLFileBuilder,
+)
+
+
+ROWS = (
+    {"sku": "SKU001", "name": "Wireless Mouse", "price": 29.99},
+    {"sku": "SKU002", "name": "Cable, USB-C", "price": None},
+    {"sku": "SKU003", "name": "Keyboard & \"Cover\"", "price": 149.99},
+)
+
+
+def _rows():
+    """Rows as a one-shot generator."""
+    return (dict(row) for row in ROWS)
+
+
+async def _arows(rows=ROWS):
+    """Rows as an async iterable, like db_client.iter_many()."""
+    for row in rows:
+        yield dict(row)
+
+
+def _read(path, mode="r"):
+    with open(path, mode, **({} if "b" in mode else {"encoding": "utf-8", "newline": ""})) as f:
+        return f.read()
+
+
+CSV_TEXT = (
+    "sku,name,price\r\n"
+    "SKU001,Wireless Mouse,29.99\r\n"
+    "SKU002,\"Cable, USB-C\",\r\n"
+    "SKU003,\"Keyboard & \"\"Cover\"\"\",149.99\r\n"
+)
+
+
+async def _no_rows():
+    return
+    yield
+
+
+def _assert_empty_rejected(build):
+    """build() must raise FileBuilderError for an empty row stream."""
+    try:
+        build()
+    except FileBuilderError:
+        pass
+    else:
+        raise AssertionError("empty input was not rejected")
+
+
+@pytest.mark.asyncio
+async def test_csv_builder_generator_and_async():
+    """CSV output is the same from a generator and from an async iterable."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sync_path = os.path.join(tmpdir, "sync.csv")
+        async_path = os.path.join(tmpdir, "async.csv")
+
+        CSVFileBuilder().build_file(_rows(), sync_path)
+        await CSVFileBuilder().build_file_async(_arows(), async_path)
+
+        assert _read(sync_path) == CSV_TEXT
+        assert _read(async_path) == CSV_TEXT
+
+
+@pytest.mark.asyncio
+async def test_tsv_builder_generator_and_async():
+    """TSV output is the same from a generator and from an async iterable."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sync_path = os.path.join(tmpdir, "sync.tsv")
+        async_path = os.path.join(tmpdir, "async.tsv")
+
+        TSVFileBuilder().build_file(_rows(), sync_path)
+        await TSVFileBuilder().build_file_async(_arows(), async_path)
+
+        lines = _read(sync_path).splitlines()
+        assert lines[0] == "sku\tname\tprice"
+        assert lines[2] == "SKU002\tCable, USB-C\t"
+        assert _read(async_path) == _read(sync_path)
+
+
+@pytest.mark.asyncio
+async def test_csv_builder_rejects_empty_input():
+    """An empty row stream raises FileBuilderError instead of writing a file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "empty.csv")
+        _assert_empty_rejected(lambda: CSVFileBuilder().build_file(iter(()), path))
+        try:
+            await CSVFileBuilder().build_file_async(_no_rows(), path)
+        except FileBuilderError:
+            pass
+        else:
+            raise AssertionError("empty input was not rejected")
+
+        assert not os.path.exists(path)
+
+
+def test_csv_builder_columns():
+    """Configured columns select and order fields; missing keys are empty."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "columns.csv")
+        CSVFileBuilder().build_file(
+            _rows(), path, {"columns": ["price", "sku", "brand"], "include_headers": False}
+        )
+
+        assert _read(path) == "29.99,SKU001,\r\n,SKU002,\r\n149.99,SKU003,\r\n"
+
+
+@pytest.mark.asyncio
+async def test_csv_builder_rejects_extra_keys():
+    """Without columns, a row with a key outside the header fails the build."""
+    rows = [{"sku": "SKU001"}, {"sku": "SKU002", "name": "Cable"}]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "extra.csv")
+        try:
+            CSVFileBuilder().build_file(iter(rows), path)
+        except FileBuilderError as e:
+            assert "'name'" in str(e)
+        else:
+            raise AssertionError("extra key was not rejected")
+
+        try:
+            await CSVFileBuilder().build_file_async(_arows(rows), path)
+        except FileBuilderError as e:
+            assert "'name'" in str(e)
+        else:
+            raise AssertionError("extra key was not rejected")
+
+        # Rows may leave header keys out, and columns may leave keys out
+        CSVFileBuilder().build_file(iter(rows[::-1]), path)
+        assert _read(path) == "sku,name\r\nSKU002,Cable\r\nSKU001,\r\n"
+        CSVFileBuilder().build_file(iter(rows), path, {"columns": ["sku"]})
+        assert _read(path) == "sku\r\nSKU001\r\nSKU002\r\n"
+
+
+def test_csv_builder_pyarrow_engine():
+    """engine="pyarrow" writes the same values, batch after batch."""
+    rows = [
+        {"sku": f"SKU{i:03}", "note": None if i < 5 else f"n{i}", "qty": i} for i in range(12)
+    ]
+    batch_rows = file_builders.ARROW_BATCH_ROWS
+    # Several batches, with the first one leaving "note" all null
+    file_builders.ARROW_BATCH_ROWS = 5
+    try:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "arrow.csv")
+            CSVFileBuilder().build_file(iter(rows), path, {"engine": "pyarrow"})
+            with open(path, newline="", encoding="utf-8") as f:
+                written = list(csv.reader(f))
+    finally:
+        file_builders.ARROW_BATCH_ROWS = batch_rows
+
+    assert written == [["sku", "note", "qty"]] + [
+        [row["sku"], row["note"] or "", str(row["qty"])] for row in rows
+    ]
+
+
+@pytest.mark.asyncio
+async def test_json_builder_layouts():
+    """Every layout parses back to the rows, from generators and async iterables."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for config in ({}, {"indent": None}, {"indent": 4}):
+            sync_path = os.path.join(tmpdir, "sync.json")
+            async_path = os.path.join(tmpdir, "async.json")
+
+            JSONFileBuilder().build_file(_rows(), sync_path, dict(config))
+            await JSONFileBuilder().build_file_async(_arows(), async_path, dict(config))
+
+            assert json.loads(_read(sync_path)) == list(ROWS), config
+            assert _read(async_path, "rb") == _read(sync_path, "rb"), config
+
+        path = os.path.join(tmpdir, "compact.json")
+        JSONFileBuilder().build_file(_rows(), path, {"indent": None})
+        assert _read(path, "rb") == json.dumps(
+            list(ROWS), separators=(",", ":"), ensure_ascii=False
+        ).encode("utf-8")
+
+        path = os.path.join(tmpdir, "indented.json")
+        JSONFileBuilder().build_file(_rows(), path, {"indent": 4})
+        assert _read(path) == json.dumps(list(ROWS), indent=4, ensure_ascii=False)
+
+
+@pytest.mark.asyncio
+async def test_json_builder_ndjson():
+    """ndjson writes one compact object per line."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sync_path = os.path.join(tmpdir, "sync.ndjson")
+        async_path = os.path.join(tmpdir, "async.ndjson")
+
+        JSONFileBuilder().build_file(_rows(), sync_path, {"format": "ndjson"})
+        await JSONFileBuilder().build_file_async(_arows(), async_path, {"format": "ndjson"})
+
+        lines = _read(sync_path).splitlines()
+        assert [json.loads(line) for line in lines] == list(ROWS)
+        assert _read(async_path) == _read(sync_path)
+
+
+def test_json_builder_non_str_keys_and_big_ints():
+    """Integer keys and integers beyond 64 bits are written as json.dump would."""
+    rows = [{1: "a", "big": 2 ** 70}, {"n": 1}]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "odd.json")
+        JSONFileBuilder().build_file(iter(rows), path, {"indent": None})
+
+        assert json.loads(_read(path)) == [{"1": "a", "big": 2 ** 70}, {"n": 1}]
+
+
+@pytest.mark.asyncio
+async def test_json_builder_rejects_empty_input():
+    """An empty row stream raises FileBuilderError instead of writing a file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "empty.json")
+        _assert_empty_rejected(lambda: JSONFileBuilder().build_file(iter(()), path))
+        try:
+            await JSONFileBuilder().build_file_async(_no_rows(), path)
+        except FileBuilderError:
+            pass
+        else:
+            raise AssertionError("empty input was not rejected")
+
+        assert not os.path.exists(path)
+
+
+def test_xlsx_builder_values():
+    """Cells read back as written; dates are dates and URLs stay plain strings."""
+    if HAS_PYTEST:
+        pytest.importorskip("openpyxl")
+    else:
+        try:
+            import openpyxl
+        except ImportError:
+            print("⚠️  Skipping XLSX test - openpyxl not installed")
+            return
+    from openpyxl import load_workbook
+
+    rows = [
+        {"sku": "SKU001", "price": 29.99, "updated": datetime(2024, 1, 2, 3, 4, 5)},
+        {"sku": "https://example.com/p/2", "price": None, "updated": None},
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "products.xlsx")
+        XLSXFileBuilder().build_file(iter(rows), path, {"sheet_name": "Items"})
+
+        wb = load_workbook(path)
+        ws = wb["Items"]
+        assert [[cell.value for cell in row] for row in ws.iter_rows()] == [
+            ["sku", "price", "updated"],
+            ["SKU001", 29.99, datetime(2024, 1, 2, 3, 4, 5)],
+            ["https://example.com/p/2", None, None],
+        ]
+        assert ws["C2"].is_date
+        assert ws["A3"].hyperlink is None
+        wb.close()
+
+        _assert_empty_rejected(
+            lambda: XLSXFileBuilder().build_file(iter(()), os.path.join(tmpdir, "empty.xlsx"))
+        )
+
+
+def test_xml_builder_generator():
+    """XML rows are escaped and empty values become self-closing tags."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "products.xml")
+        XMLFileBuilder().build_file(_rows(), path, {"root_tag": "catalog", "row_tag": "item"})
+
+        assert _read(path) == (
+            '<?xml version="1.0" encoding="utf-8"?>\n<catalog>'
+            "\n  <item>\n    <sku>SKU001</sku>\n    <name>Wireless Mouse</name>"
+            "\n    <price>29.99</price>\n  </item>"
+            "\n  <item>\n    <sku>SKU002</sku>\n    <name>Cable, USB-C</name>"
+            "\n    <price/>\n  </item>"
+            "\n  <item>\n    <sku>SKU003</sku>\n    <name>Keyboard &amp; \"Cover\"</name>"
+            "\n    <price>149.99</price>\n  </item>"
+            "\n</catalog>"
+        )
+
+        _assert_empty_rejected(
+            lambda: XMLFileBuilder().build_file(iter(()), os.path.join(tmpdir, "empty.xml"))
+        )
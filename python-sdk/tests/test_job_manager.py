@@ -0,0 +1,218 @@
+"""
+Tests for JobStatusUpdater against the in-memory MockDBClient.
+"""
+
+try:
+    import pytest
+    HAS_PYTEST = True
+except ImportError:
+    HAS_PYTEST = False
+    # Mock pytest.mark.asyncio decorator
+    class MockPytest:
+        class mark:
+            @staticmethod
+            def asyncio(func):
+                return func
+    pytest = MockPytest()
+
+import asyncio
+
+from saastify_edge.core.types import JobStatus, JobType, RunType
+from saastify_edge.db.job_manager import METRICS_FLUSH_DELAY, JobStatusUpdater
+from saastify_edge.db.mock_db_client import MockDBClient
+
+
+def _count_metric_writes(db):
+    """Wrap db.merge_job_step, returning the list its calls are recorded in."""
+    calls = []
+    merge_job_step = db.merge_job_step
+    
+    async def counting(job_id, metrics, updated_at):
+        calls.append(dict(metrics))
+        return await merge_job_step(job_id, metrics, updated_at)
+    
+    db.merge_job_step = counting
+    return calls
+
+
+def _count_job_reads(db):
+    """Wrap db.get_job, returning the list its calls are recorded in."""
+    calls = []
+    get_job = db.get_job
+    
+    async def counting(job_id):
+        calls.append(job_id)
+        return await get_job(job_id)
+    
+    db.get_job = counting
+    return calls
+
+
+async def _start_job(job_manager):
+    """Create an import job and enter its first step."""
+    job_id = await job_manager.create_job(
+        job_name="test",
+        job_type=JobType.PRODUCT_IMPORT,
+        saas_edge_id="tenant",
+        request_args={},
+    )
+    await job_manager.update_status(job_id, JobStatus.IMPORT_FILE_PARSE, {"file": "a.csv"})
+    return job_id
+
+
+@pytest.mark.asyncio
+async def test_create_job_initial_status():
+    """Job types given as enums or plain strings start in the right INIT status."""
+    job_manager = JobStatusUpdater(MockDBClient())
+
+    expected = {
+        JobType.PRODUCT_IMPORT: JobStatus.IMPORT_INIT.value,
+        JobType.CATEGORY_EXPORT: JobStatus.EXPORT_INIT.value,
+        RunType.IMPORT: JobStatus.IMPORT_INIT.value,
+        "IMPORT": JobStatus.IMPORT_INIT.value,
+        "EXPORT": JobStatus.EXPORT_INIT.value,
+        "VARIANT_IMPORT": JobStatus.IMPORT_INIT.value,
+        "CUSTOM_IMPORT": JobStatus.IMPORT_INIT.value,
+        "CUSTOM_EXPORT": JobStatus.EXPORT_INIT.value,
+    }
+
+    for job_type, status in expected.items():
+        job_id = await job_manager.create_job(
+            job_name="test",
+            job_type=job_type,
+            saas_edge_id="tenant",
+            request_args={},
+        )
+        job = await job_manager.get_job_status(job_id)
+        assert job["job_status"] == status, job_type
+
+
+@pytest.mark.asyncio
+async def test_add_metrics_coalesces_writes():
+    """Metrics added within the flush delay go out in a single write."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db)
+    job_id = await _start_job(job_manager)
+    writes = _count_metric_writes(db)
+    
+    await job_manager.add_metrics(job_id, {"rows_read": 100})
+    await job_manager.add_metrics(job_id, {"rows_read": 200})
+    await job_manager.add_metrics(job_id, {"rows_valid": 190})
+    assert writes == []
+    
+    await asyncio.sleep(METRICS_FLUSH_DELAY * 3)
+    
+    assert writes == [{"rows_read": 200, "rows_valid": 190}]
+    step = db.jobs[job_id]["metrics"]["steps"][-1]
+    assert step["rows_read"] == 200 and step["rows_valid"] == 190
+
+
+@pytest.mark.asyncio
+async def test_pending_metrics_land_in_current_step():
+    """update_status writes pending metrics into the step that is ending."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db)
+    job_id = await _start_job(job_manager)
+    
+    await job_manager.add_metrics(job_id, {"rows_read": 100})
+    await job_manager.update_status(job_id, JobStatus.IMPORT_VALIDATE, {"rules": 3})
+    
+    parsing, validating = db.jobs[job_id]["metrics"]["steps"]
+    assert parsing["step"] == JobStatus.IMPORT_FILE_PARSE.value
+    assert parsing["rows_read"] == 100
+    assert validating["step"] == JobStatus.IMPORT_VALIDATE.value
+    assert "rows_read" not in validating
+
+
+@pytest.mark.asyncio
+async def test_complete_step_and_job_flush_immediately():
+    """complete_step and complete_job write pending metrics before returning."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db)
+    job_id = await _start_job(job_manager)
+    writes = _count_metric_writes(db)
+    
+    await job_manager.add_metrics(job_id, {"rows_read": 10})
+    await job_manager.complete_step(job_id, rows_processed=10, rows_success=9, rows_failed=1)
+    
+    assert len(writes) == 1
+    step = db.jobs[job_id]["metrics"]["steps"][-1]
+    assert step["rows_read"] == 10 and step["rows_failed"] == 1
+    
+    await job_manager.add_metrics(job_id, {"rows_written": 9})
+    job = await job_manager.complete_job(job_id, True, total_rows=10, success_count=9)
+    
+    assert len(writes) == 2
+    assert job["job_status"] == JobStatus.COMPLETED.value
+    assert job["metrics"]["steps"][-1]["rows_written"] == 9
+    
+    # Nothing is left to write once the timer would have fired
+    await asyncio.sleep(METRICS_FLUSH_DELAY * 3)
+    assert len(writes) == 2
+
+
+@pytest.mark.asyncio
+async def test_add_metrics_unknown_job():
+    """Only a flushing add_metrics reports an unknown job; background writes log it."""
+    job_manager = JobStatusUpdater(MockDBClient())
+    
+    try:
+        await job_manager.add_metrics("missing", {"rows_read": 1}, flush=True)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("flush=True accepted an unknown job")
+    
+    await job_manager.add_metrics("missing", {"rows_read": 1})
+    await asyncio.sleep(METRICS_FLUSH_DELAY * 3)
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_uncached_by_default():
+    """Without a cache_ttl every call reads the job from the database."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db)
+    assert job_manager.cache_ttl == 0
+    job_id = await _start_job(job_manager)
+    reads = _count_job_reads(db)
+    
+    await job_manager.get_job_status(job_id)
+    await job_manager.get_job_status(job_id)
+    
+    assert reads == [job_id, job_id]
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_cache_expires():
+    """Cached jobs are served until cache_ttl passes, then read again."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db, cache_ttl=0.2)
+    job_id = await _start_job(job_manager)
+    reads = _count_job_reads(db)
+    
+    # update_status cached the row it returned
+    job = await job_manager.get_job_status(job_id)
+    assert job["job_status"] == JobStatus.IMPORT_FILE_PARSE.value
+    assert await job_manager.get_job_status(job_id) is job
+    assert reads == []
+    
+    await asyncio.sleep(0.3)
+    await job_manager.get_job_status(job_id)
+    await job_manager.get_job_status(job_id)
+    assert reads == [job_id]
+
+
+@pytest.mark.asyncio
+async def test_get_job_status_cache_dropped_on_metrics_write():
+    """A metrics write drops the cached job, so the next read sees it."""
+    db = MockDBClient()
+    job_manager = JobStatusUpdater(db, cache_ttl=60)
+    job_id = await _start_job(job_manager)
+    reads = _count_job_reads(db)
+    
+    await job_manager.get_job_status(job_id)
+    await job_manager.add_metrics(job_id, {"rows_read": 5}, flush=True)
+    job = await job_manager.get_job_status(job_id)
+    
+    assert reads == [job_id]
+    assert job["metrics"]["steps"][-1]["rows_read"] == 5
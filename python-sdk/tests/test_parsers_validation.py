@@ -11,7 +11,7 @@ import asyncio
 sys.path.insert(0, os.path.dirname(__file__))
 
 from saastify_edge.core.parsers import get_parser, detect_file_type
-from saastify_edge.validation import validate_row, validate_field
+from saastify_edge.validation import validate_row, validate_field, compile_validations
 from saastify_edge.transformations import apply_transformations
 
 
@@ -36,6 +36,106 @@ async def test_csv_parser():
     return rows
 
 
+async def test_csv_strip_auto():
+    """Test strip_whitespace="auto" matches the default row output"""
+    print("\nTesting CSV strip_whitespace=auto...")
+    
+    import tempfile
+    from saastify_edge.core.parsers import CSVParser
+    
+    for body in ("SKU,Name\nA1,Shirt\nA2,\n", "SKU,Name\nA1,  Shirt \nA2,\n"):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+            f.write(body)
+        try:
+            default_rows = [row async for row in CSVParser().parse(f.name)]
+            auto_rows = [row async for row in CSVParser({"strip_whitespace": "auto"}).parse(f.name)]
+        finally:
+            os.unlink(f.name)
+        
+        assert auto_rows == default_rows
+        assert auto_rows[0]["data"]["Name"] == "Shirt"
+        assert auto_rows[1]["data"]["Name"] is None
+    
+    print("✓ strip_whitespace=auto matches default parsing")
+
+
+async def test_json_snapshot_mode():
+    """Test snapshot_mode controls how raw_input_snapshot relates to data"""
+    print("\nTesting JSON snapshot_mode...")
+    
+    import tempfile
+    from saastify_edge.core.parsers import JSONParser
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        f.write('[{"sku": "A1", "tags": ["x"]}]')
+    try:
+        shared = [row async for row in JSONParser().parse(f.name)][0]
+        shallow = [row async for row in JSONParser({"snapshot_mode": "shallow"}).parse(f.name)][0]
+        deep = [row async for row in JSONParser({"snapshot_mode": "deep"}).parse(f.name)][0]
+        readonly = [row async for row in JSONParser({"snapshot_mode": "readonly"}).parse(f.name)][0]
+    finally:
+        os.unlink(f.name)
+    
+    assert shared["raw_input_snapshot"] is shared["data"]
+    assert shallow["raw_input_snapshot"] == shallow["data"]
+    assert shallow["raw_input_snapshot"] is not shallow["data"]
+    assert shallow["raw_input_snapshot"]["tags"] is shallow["data"]["tags"]
+    assert deep["raw_input_snapshot"]["tags"] is not deep["data"]["tags"]
+    try:
+        readonly["raw_input_snapshot"]["sku"] = "B2"
+        assert False, "readonly snapshot accepted a write"
+    except TypeError:
+        pass
+    
+    print("✓ snapshot_mode share/shallow/deep/readonly")
+
+
+async def test_json_columns():
+    """Test the columns option keeps only the listed keys (case-insensitive)"""
+    print("\nTesting JSON columns projection...")
+    
+    import tempfile
+    from saastify_edge.core.parsers import JSONParser
+    
+    with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+        f.write('{"data": [{"SKU": "A1", "Name": "Shirt", "Extra": {"a": [1]}}, 5, {"sku": "A2"}]}')
+    try:
+        rows = [row async for row in JSONParser({"columns": ["sku", "extra"]}).parse(f.name)]
+    finally:
+        os.unlink(f.name)
+    
+    assert [row["file_row_number"] for row in rows] == [1, 3]
+    assert rows[0]["data"] == {"SKU": "A1", "Extra": {"a": [1]}}
+    assert rows[1]["data"] == {"sku": "A2"}
+    
+    print("✓ columns projection")
+
+
+async def test_json_big_numbers():
+    """Test integers beyond 64 bits and NaN load exactly as json.load reads them"""
+    print("\nTesting JSON big integers...")
+    
+    import math
+    import tempfile
+    from saastify_edge.core.parsers import JSONParser
+    
+    rows = []
+    for text in ('[{"sku": 123456789012345678901234567890, "id": -9999999999999999999}]',
+                 '[{"sku": 1, "price": NaN}]'):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            f.write(text)
+        try:
+            rows += [row async for row in JSONParser().parse(f.name)]
+        finally:
+            os.unlink(f.name)
+    
+    assert rows[0]["data"] == {"sku": 123456789012345678901234567890, "id": -9999999999999999999}
+    assert rows[1]["data"]["sku"] == 1
+    assert math.isnan(rows[1]["data"]["price"])
+    
+    print("✓ big integers and NaN")
+
+
 def test_validation():
     """Test validation engine"""
     print("\nTesting validation engine...")
@@ -98,6 +198,31 @@ def test_validation():
     print("✓ Row validation works")
 
 
+def test_compiled_validations():
+    """Test compiled validators match validate_row"""
+    print("\nTesting compiled validations...")
+    
+    validations = {
+        "sku": [{"rule": "required"}],
+        "name": [{"rule": "required"}, {"rule": "min_length", "args": {"value": 3}}],
+        "price": [{"rule": "numeric_range", "args": {"min": 0, "max": 1000}}],
+        "color": [{"rule": "no_such_rule"}]
+    }
+    validate = compile_validations(validations)
+    
+    rows = [
+        {"sku": "SKU001", "name": "Product", "price": 25.00, "color": "red"},
+        {"sku": None, "name": "ab", "price": 5000, "color": None},
+    ]
+    for row in rows:
+        assert validate(row) == validate_row(row, validations)
+    
+    is_valid, errors, error_count = validate(rows[1])
+    assert not is_valid
+    assert set(errors) == {"sku", "name", "price", "color"}
+    print("✓ Compiled validations match validate_row")
+
+
 async def test_integrated_pipeline():
     """Test integrated transformation + validation"""
     print("\nTesting integrated pipeline...")
@@ -190,7 +315,12 @@ async def main():
         # Run tests
         test_file_type_detection()
         await test_csv_parser()
+        await test_csv_strip_auto()
+        await test_json_snapshot_mode()
+        await test_json_columns()
+        await test_json_big_numbers()
         test_validation()
+        test_compiled_validations()
         await test_integrated_pipeline()
         
         print("\n" + "="*50)
@@ -0,0 +1,152 @@
+"""
+Tests for the cached SQL statement builders.
+"""
+
+from saastify_edge.db.statements import (
+    count_sql,
+    delete_sql,
+    insert_sql,
+    insert_values_sql,
+    jsonb_append_sql,
+    jsonb_merge_last_sql,
+    select_sql,
+    update_sql,
+)
+
+
+BAD_IDENTIFIERS = (
+    "products; DROP TABLE products",
+    "1products",
+    "products name",
+    'products"',
+    "a.b.c",
+    "x" * 64,
+    "",
+)
+
+BAD_ORDER_BY = (
+    "name; DROP TABLE products",
+    "name DESC, ",
+    "lower(name)",
+    "name ASCENDING",
+    "name -- comment",
+)
+
+
+def _assert_rejected(message, build, *args, **kwargs):
+    """build(*args, **kwargs) must raise ValueError mentioning message."""
+    try:
+        build(*args, **kwargs)
+    except ValueError as e:
+        assert message in str(e), e
+    else:
+        raise AssertionError(f"{build.__name__}{args} was not rejected")
+
+
+def test_insert_sql():
+    """Values are numbered in column order; RETURNING is optional."""
+    assert insert_sql("products", ("sku", "name")) == (
+        "INSERT INTO products (sku, name) VALUES ($1, $2) RETURNING *"
+    )
+    assert insert_sql("products", ("sku",), returning=False) == (
+        "INSERT INTO products (sku) VALUES ($1)"
+    )
+
+
+def test_insert_values_sql():
+    """Parameters run row after row, column order within each row."""
+    assert insert_values_sql("products", ("sku", "name"), 3) == (
+        "INSERT INTO products (sku, name) VALUES ($1, $2), ($3, $4), ($5, $6) RETURNING *"
+    )
+
+
+def test_update_sql():
+    """Update values come first, then the filter values."""
+    assert update_sql("products", ("name", "price"), ("sku", "tenant_id")) == (
+        "UPDATE products SET name = $1, price = $2 WHERE sku = $3 AND tenant_id = $4"
+    )
+    assert update_sql("products", ("name",), ("sku",), ()) == (
+        "UPDATE products SET name = $1 WHERE sku = $2 RETURNING *"
+    )
+    assert update_sql("products", ("name",), ("sku",), ("sku", "name")) == (
+        "UPDATE products SET name = $1 WHERE sku = $2 RETURNING sku, name"
+    )
+
+
+def test_delete_and_count_sql():
+    """Filter values are numbered from $1."""
+    assert delete_sql("products", ("sku", "tenant_id")) == (
+        "DELETE FROM products WHERE sku = $1 AND tenant_id = $2"
+    )
+    assert count_sql("products", ("status",), ("tenant_id",)) == (
+        "SELECT status, COUNT(*) FROM products WHERE tenant_id = $1 GROUP BY status"
+    )
+
+
+def test_select_sql():
+    """Filter keys, "__in" keys and the limit are numbered in order."""
+    assert select_sql("products", ()) == "SELECT * FROM products "
+    assert select_sql(
+        "products",
+        ("tenant_id", "sku__in"),
+        fields=("sku", "name"),
+        order_by="name DESC NULLS LAST, sku",
+        limited=True,
+    ) == (
+        "SELECT sku, name FROM products WHERE tenant_id = $1 AND sku = ANY($2) "
+        "ORDER BY name DESC NULLS LAST, sku LIMIT $3"
+    )
+
+
+def test_select_sql_latest_per():
+    """latest_per keeps the newest row per key, ordered in an outer query."""
+    assert select_sql("rows", ("job_id",), latest_per="sku", order_by="sku") == (
+        "SELECT * FROM (SELECT DISTINCT ON (sku) * FROM rows WHERE job_id = $1 "
+        "ORDER BY sku, created_at DESC) AS latest ORDER BY sku"
+    )
+
+
+def test_jsonb_sql_parameter_numbering():
+    """Key path and value come first, then set paths, updates and filters."""
+    query = jsonb_append_sql(
+        "jobs", "metrics.steps", ("metrics.current",), ("updated_at",), ("job_id",)
+    )
+    assert "$1::text[]" in query and "jsonb_build_array($2::jsonb)" in query
+    assert "$3::text[], $4::jsonb)" in query
+    assert query.endswith("updated_at = $5 WHERE job_id = $6")
+
+    query = jsonb_merge_last_sql("jobs", "metrics.steps", ("updated_at",), ("job_id",))
+    assert query.startswith("UPDATE jobs SET metrics = CASE")
+    assert query.endswith("updated_at = $3 WHERE job_id = $4")
+
+
+def test_jsonb_append_sql_rejects_other_column():
+    """json_set paths must be in the appended column."""
+    _assert_rejected(
+        "not in column metrics",
+        jsonb_append_sql, "jobs", "metrics.steps", ("request_args.x",), (), ("job_id",)
+    )
+
+
+def test_builders_are_cached():
+    """The same call shape returns the same string object."""
+    assert insert_sql("products", ("sku",)) is insert_sql("products", ("sku",))
+
+
+def test_invalid_identifiers_rejected():
+    """Table and column names that are not plain identifiers are refused."""
+    for name in BAD_IDENTIFIERS:
+        _assert_rejected("Invalid SQL identifier", insert_sql, name, ("sku",))
+        _assert_rejected("Invalid SQL identifier", update_sql, "products", (name,), ("sku",))
+        _assert_rejected("Invalid SQL identifier", select_sql, "products", ("sku",), fields=(name,))
+
+
+def test_qualified_identifier_allowed():
+    """schema.table names are accepted."""
+    assert delete_sql("public.products", ("sku",)) == "DELETE FROM public.products WHERE sku = $1"
+
+
+def test_invalid_order_by_rejected():
+    """ORDER BY accepts only column [ASC|DESC] [NULLS FIRST|LAST] lists."""
+    for order_by in BAD_ORDER_BY:
+        _assert_rejected("Invalid ORDER BY clause", select_sql, "products", (), order_by=order_by)
@@ -121,6 +121,22 @@ def test_broadcasting():
     print("✓ multiple values → single rule in list")
 
 
+def test_rule_parse_cache():
+    """Test that DSL rules are parsed once and reused"""
+    print("\nTesting rule parse cache...")
+    
+    from saastify_edge.transformations.engine import _parse_dsl_rule
+    
+    _parse_dsl_rule.cache_clear()
+    result = bulk_apply_pipe_rules(["  a  ", "  b  ", "  c  "], "strip + uppercase")
+    assert result == ["A", "B", "C"]
+    
+    info = _parse_dsl_rule.cache_info()
+    assert info.misses == 1, f"Expected 1 parse, got {info.misses}"
+    assert info.hits == 2, f"Expected 2 cache hits, got {info.hits}"
+    print("✓ rule parsed once for broadcast values")
+
+
 if __name__ == "__main__":
     try:
         test_basic_operations()
@@ -129,6 +145,7 @@ if __name__ == "__main__":
         test_complex_pipeline()
         test_structured_pipeline()
         test_broadcasting()
+        test_rule_parse_cache()
         
         print("\n" + "="*50)
         print("✅ All tests passed!")